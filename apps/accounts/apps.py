@@ -6,3 +6,6 @@ class AccountsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.accounts"
     verbose_name = _("Users")
+
+    def ready(self) -> None:
+        from apps.accounts import signals  # noqa: F401
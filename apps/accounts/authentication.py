@@ -0,0 +1,97 @@
+import copy
+import hashlib
+import time
+from typing import Any
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from apps.accounts.models import User
+from apps.core.caches import MISSING, LocalLRUCache
+
+USER_CACHE_TIMEOUT = 30
+
+# 검증된 access token 의 payload 를 만료 시각(exp)까지 보관합니다.
+token_cache = LocalLRUCache(maxsize=4096)
+# 공유 캐시 앞에서, 유저를 프로세스 메모리에 ttl(초) 동안 보관합니다.
+user_local_cache = LocalLRUCache(maxsize=4096, ttl=5)
+
+
+def user_cache_key(user_uuid: Any) -> str:
+    return f"accounts:user:{user_uuid}"
+
+
+def invalidate_cached_user(user_uuid: Any) -> None:
+    """
+    바로 지우고, 트랜잭션이 커밋된 뒤에 한 번 더 지웁니다.
+    커밋 전에 다른 요청이 이전 유저를 다시 캐시하더라도, 커밋 후에는 새 유저를 읽게 됩니다.
+    """
+    key = user_cache_key(user_uuid)
+    cache.delete(key)
+    user_local_cache.delete(key)
+    transaction.on_commit(lambda: (cache.delete(key), user_local_cache.delete(key)))
+
+
+class CachedUserJWTAuthentication(JWTAuthentication):
+    """
+    토큰의 user_uuid 로 유저를 조회할 때, USER_CACHE_TIMEOUT(초) 동안 캐시된 유저를 사용합니다.
+    공유 캐시(운영 환경은 Redis) 앞에 프로세스 메모리 LRU(user_local_cache)를 두어,
+    같은 유저의 요청이 이어지면 캐시 서버도 거치지 않습니다.
+    유저 정보가 수정되거나 탈퇴하면 signal 에서 캐시를 지우며,
+    다른 프로세스의 LRU 에는 최대 user_local_cache.ttl 초 동안 이전 유저가 남습니다.
+    한 번 검증한 access token 은 token_cache 에 보관해, 같은 토큰은 서명과 claim 을 다시 검증하지 않습니다.
+    """
+
+    def get_validated_token(self, raw_token: bytes) -> Token:
+        key = hashlib.sha256(raw_token).hexdigest()
+        validated_token = token_cache.get(key)
+        if validated_token is not MISSING:
+            return validated_token
+
+        validated_token = super().get_validated_token(raw_token)
+        ttl = validated_token.get("exp", 0) - time.time()
+        if ttl > 0:
+            token_cache.set(key, validated_token, ttl)
+        return validated_token
+
+    def get_user(self, validated_token: Token) -> User:
+        try:
+            user_uuid = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        key = user_cache_key(user_uuid)
+        user = user_local_cache.get(key)
+        if user is MISSING:
+            user = cache.get(key)
+            if user is None:
+                user = super().get_user(validated_token)
+                cache.set(key, user, USER_CACHE_TIMEOUT)
+            user_local_cache.set(key, user)
+        # 요청에서 request.user 를 수정해도 캐시된 유저는 바뀌지 않도록 복사해서 사용합니다.
+        user = copy.copy(user)
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."), code="password_changed"
+            )
+        return user
+
+
+class CachedUserJWTScheme(SimpleJWTScheme):
+    """
+    drf-spectacular 에서 CachedUserJWTAuthentication 을 JWT 인증으로 문서화합니다.
+    """
+
+    target_class = CachedUserJWTAuthentication
@@ -0,0 +1,115 @@
+import atexit
+import logging
+import threading
+from datetime import datetime
+from typing import Any
+
+from django.conf import settings
+from django.db import connection
+
+from apps.accounts.models import User
+
+logger = logging.getLogger(__name__)
+
+
+class LastLoginBuffer:
+    """
+    유저별 마지막 로그인 시각을 프로세스 메모리에 모아 두었다가, flush_interval(초)마다 한 번에 저장합니다. (write-behind)
+    같은 유저가 여러 번 로그인하면 가장 늦은 시각만 남으므로, 자주 로그인하는 유저의 행을 매번 UPDATE 하지 않습니다.
+    프로세스가 종료될 때도 저장하며, 비정상 종료 시에는 최대 flush_interval 초 동안의 기록을 잃을 수 있습니다.
+    모인 유저가 max_pending 명이 되면 주기를 기다리지 않고 바로 저장합니다.
+    """
+
+    batch_size = 500
+
+    def __init__(
+        self, flush_interval: float | None = None, max_pending: int = 10_000
+    ) -> None:
+        self._flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._pending: dict[Any, datetime] = {}
+        self._stopped = threading.Event()
+        self._worker: threading.Thread | None = None
+
+    @property
+    def flush_interval(self) -> float:
+        if self._flush_interval is not None:
+            return self._flush_interval
+        return getattr(settings, "LAST_LOGIN_FLUSH_INTERVAL", 10)
+
+    def record(self, user_id: Any, logged_in_at: datetime) -> None:
+        with self._lock:
+            previous = self._pending.get(user_id)
+            if previous is None or previous < logged_in_at:
+                self._pending[user_id] = logged_in_at
+            is_full = len(self._pending) >= self.max_pending
+        if is_full or self.flush_interval <= 0:
+            self.flush()
+        else:
+            self._start_worker()
+
+    def flush(self) -> int:
+        """
+        모인 로그인 시각들을 batch_size 명씩 하나의 UPDATE 로 저장하고, 저장한 유저 수를 반환합니다.
+        저장에 실패하면 다음 flush 에서 다시 시도합니다.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        try:
+            User.objects.bulk_update(
+                [
+                    User(pk=user_id, last_login=logged_in_at)
+                    for user_id, logged_in_at in pending.items()
+                ],
+                ["last_login"],
+                batch_size=self.batch_size,
+            )
+        except Exception:
+            with self._lock:
+                for user_id, logged_in_at in pending.items():
+                    if self._pending.get(user_id, logged_in_at) <= logged_in_at:
+                        self._pending[user_id] = logged_in_at
+            raise
+        return len(pending)
+
+    def stop(self) -> None:
+        """
+        주기적으로 저장하는 스레드를 멈추고, 남은 기록을 저장합니다.
+        프로세스 종료 시(atexit) 호출되므로, 저장에 실패해도 예외를 던지지 않고 로그만 남깁니다.
+        """
+        self._stopped.set()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Failed to flush last_login buffer")
+
+    def _start_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._stopped.clear()
+                self._worker = threading.Thread(
+                    target=self._run, name="last-login-buffer", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        try:
+            while not self._stopped.wait(self.flush_interval):
+                try:
+                    self.flush()
+                except Exception:
+                    logger.exception("Failed to flush last_login buffer")
+        finally:
+            connection.close()
+
+
+last_login_buffer = LastLoginBuffer()
+atexit.register(last_login_buffer.stop)
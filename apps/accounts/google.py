@@ -0,0 +1,128 @@
+import hashlib
+import re
+import threading
+import time
+from typing import Any
+
+import jwt
+import requests
+from allauth.socialaccount.models import SocialApp, SocialLogin, SocialToken
+from allauth.socialaccount.providers.google.views import GoogleOAuth2Adapter
+from allauth.socialaccount.providers.oauth2.client import OAuth2Error
+from django.http import HttpRequest
+from requests.adapters import HTTPAdapter
+
+from apps.core.caches import MISSING, LocalLRUCache
+from apps.core.exceptions import ServiceUnavailable
+
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+
+
+class GoogleIdTokenVerifier:
+    """
+    Google 이 서명한 id token 을 Google 의 공개키로 검증합니다.
+
+    공개키는 keep-alive 커넥션을 재사용하는 requests.Session 으로 받아오고,
+    응답의 Cache-Control max-age 동안 보관합니다. 요청마다 connect_timeout, read_timeout(초)을 적용합니다.
+    검증한 id token 의 claim 들은 identity_ttl(초)과 토큰 만료 시각 중 이른 시각까지 보관해,
+    같은 토큰으로 다시 로그인하면 검증을 반복하지 않습니다.
+    """
+
+    algorithms = ["RS256"]
+
+    def __init__(
+        self,
+        certs_url: str = GOOGLE_CERTS_URL,
+        connect_timeout: float = 1.0,
+        read_timeout: float = 2.0,
+        pool_maxsize: int = 10,
+        identity_ttl: float = 60,
+    ) -> None:
+        self.certs_url = certs_url
+        self.timeout = (connect_timeout, read_timeout)
+        self.identity_ttl = identity_ttl
+        self.session = requests.Session()
+        self.session.mount(
+            "https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        )
+        self.identities = LocalLRUCache(maxsize=1024, ttl=identity_ttl)
+        self._lock = threading.Lock()
+        self._keys: dict[str, Any] = {}
+        self._keys_expires_at = 0.0
+
+    def verify(self, id_token: str, audience: str, issuer: str) -> dict[str, Any]:
+        """
+        검증된 id token 의 claim 들을 반환합니다.
+        토큰이 유효하지 않으면 jwt.PyJWTError, 공개키를 받아오지 못하면 requests.RequestException 이 발생합니다.
+        """
+        key = hashlib.sha256(f"{audience}:{id_token}".encode()).hexdigest()
+        identity = self.identities.get(key)
+        if identity is not MISSING:
+            return identity
+
+        kid = jwt.get_unverified_header(id_token).get("kid")
+        identity = jwt.decode(
+            id_token,
+            self.get_signing_key(kid),
+            algorithms=self.algorithms,
+            audience=audience,
+            issuer=issuer,
+        )
+        ttl = min(self.identity_ttl, identity["exp"] - time.time())
+        if ttl > 0:
+            self.identities.set(key, identity, ttl)
+        return identity
+
+    def get_signing_key(self, kid: str | None) -> Any:
+        """
+        kid 에 해당하는 공개키를 반환합니다.
+        보관 기간이 지났거나 모르는 kid 면(Google 이 키를 교체한 경우) 공개키 목록을 다시 받아옵니다.
+        """
+        if time.monotonic() >= self._keys_expires_at or kid not in self._keys:
+            with self._lock:
+                if time.monotonic() >= self._keys_expires_at or kid not in self._keys:
+                    self._fetch_keys()
+        try:
+            return self._keys[kid]
+        except KeyError:
+            raise jwt.InvalidKeyError(f"Unknown signing key: {kid}")
+
+    def _fetch_keys(self) -> None:
+        response = self.session.get(self.certs_url, timeout=self.timeout)
+        response.raise_for_status()
+        self._keys = {
+            jwk.key_id: jwk.key for jwk in jwt.PyJWKSet.from_dict(response.json()).keys
+        }
+        max_age = re.search(r"max-age=(\d+)", response.headers.get("Cache-Control", ""))
+        self._keys_expires_at = time.monotonic() + (
+            int(max_age.group(1)) if max_age else 0
+        )
+
+
+google_id_token_verifier = GoogleIdTokenVerifier()
+
+
+class GoogleIdTokenAdapter(GoogleOAuth2Adapter):  # type: ignore
+    """
+    클라이언트가 보낸 Google id token 의 서명을 google_id_token_verifier 로 검증한 뒤 로그인합니다.
+    """
+
+    def complete_login(
+        self,
+        request: HttpRequest,
+        app: SocialApp,
+        token: SocialToken,
+        response: dict[str, Any],
+        **kwargs: Any,
+    ) -> SocialLogin:
+        try:
+            identity_data = google_id_token_verifier.verify(
+                response["id_token"],
+                audience=app.client_id,
+                issuer=self.id_token_issuer,
+            )
+        except requests.RequestException as e:
+            raise ServiceUnavailable from e
+        except (jwt.PyJWTError, KeyError, TypeError) as e:
+            raise OAuth2Error("Invalid id_token") from e
+        return self.get_provider().sociallogin_from_response(request, identity_data)
@@ -0,0 +1,38 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "만료된 refresh token 들을 outstanding token, blacklist 에서 삭제합니다. "
+        "테이블 잠금이 길어지지 않도록 나누어 삭제합니다."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번의 DELETE 로 삭제할 토큰 수입니다.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        expired = OutstandingToken.objects.filter(
+            expires_at__lte=timezone.now()
+        ).order_by("pk")
+        deleted = 0
+        while pks := list(
+            expired.values_list("pk", flat=True)[: options["batch_size"]]
+        ):
+            with transaction.atomic():
+                BlacklistedToken.objects.filter(token_id__in=pks).delete()
+                OutstandingToken.objects.filter(pk__in=pks).delete()
+            deleted += len(pks)
+        self.stdout.write(self.style.SUCCESS(f"만료된 토큰 {deleted}개를 삭제했습니다."))
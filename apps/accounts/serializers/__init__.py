@@ -1,9 +1,15 @@
-from apps.accounts.serializers.jwt import JWTSerializer
+from apps.accounts.serializers.jwt import (
+    JWTSerializer,
+    TokenBlacklistSerializer,
+    TokenRefreshSerializer,
+)
 from apps.accounts.serializers.login import GoogleLoginSerializer
 from apps.accounts.serializers.profile import ProfileSerializer
 
 __all__ = [
     "JWTSerializer",
+    "TokenRefreshSerializer",
+    "TokenBlacklistSerializer",
     "GoogleLoginSerializer",
     "ProfileSerializer",
 ]
@@ -1,6 +1,22 @@
 from rest_framework import serializers
+from rest_framework_simplejwt.serializers import (
+    TokenBlacklistSerializer as _TokenBlacklistSerializer,
+)
+from rest_framework_simplejwt.serializers import (
+    TokenRefreshSerializer as _TokenRefreshSerializer,
+)
+
+from apps.accounts.tokens import RefreshToken
 
 
 class JWTSerializer(serializers.Serializer):
     access = serializers.CharField()
     refresh = serializers.CharField()
+
+
+class TokenRefreshSerializer(_TokenRefreshSerializer):
+    token_class = RefreshToken
+
+
+class TokenBlacklistSerializer(_TokenBlacklistSerializer):
+    token_class = RefreshToken
@@ -0,0 +1,49 @@
+from typing import Any
+
+from django.contrib.auth.signals import user_logged_in
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from apps.accounts.authentication import invalidate_cached_user
+from apps.accounts.buffers import last_login_buffer
+from apps.accounts.models import User
+from apps.accounts.tokens import blacklist_filter
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender: type[User], instance: User, **kwargs: Any) -> None:
+    """
+    유저 정보가 수정, 비활성화되거나 탈퇴하면 인증에 사용하는 유저 캐시를 지웁니다.
+    """
+    invalidate_cached_user(instance.uuid)
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def add_to_blacklist_filter(
+    sender: type[BlacklistedToken],
+    instance: BlacklistedToken,
+    created: bool,
+    **kwargs: Any
+) -> None:
+    """
+    새로 blacklist 에 등록된 refresh token 을 blacklist_filter 에 추가합니다.
+    """
+    if created:
+        blacklist_filter.add(instance.token.jti)
+
+
+# 로그인할 때마다 last_login 을 바로 저장하는 django.contrib.auth 의 receiver 대신,
+# last_login_buffer 에 모아서 저장합니다.
+user_logged_in.disconnect(dispatch_uid="update_last_login")
+
+
+@receiver(user_logged_in)
+def buffer_last_login(sender: type[User], user: User, **kwargs: Any) -> None:
+    """
+    로그인 시각을 last_login_buffer 에 기록합니다. DB 에는 flush 될 때 저장됩니다.
+    """
+    user.last_login = timezone.now()
+    last_login_buffer.record(user.pk, user.last_login)
@@ -0,0 +1,77 @@
+import json
+import time
+from typing import Any
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+from apps.accounts.google import GoogleIdTokenVerifier
+
+
+class FakeGoogle(BaseAdapter):
+    """
+    Google 공개키 endpoint 를 흉내 내는 requests transport 입니다.
+    verifier 의 session 에 mount 하면 네트워크 없이 로그인 과정을 실행할 수 있고,
+    공개키 요청 수(requests_count)와 요청에 적용된 timeout 을 기록합니다.
+    """
+
+    kid = "fake-google-key"
+    issuer = "https://accounts.google.com"
+
+    def __init__(self, max_age: int = 3600, delay: float = 0) -> None:
+        super().__init__()
+        self.max_age = max_age
+        self.delay = delay
+        self.private_key = rsa.generate_private_key(
+            public_exponent=65537, key_size=2048
+        )
+        self.requests_count = 0
+        self.timeouts: list[Any] = []
+
+    def install(self, verifier: GoogleIdTokenVerifier) -> None:
+        verifier.session.mount(verifier.certs_url, self)
+
+    def issue_id_token(
+        self, audience: str, private_key: Any = None, **claims: Any
+    ) -> str:
+        now = int(time.time())
+        payload = {
+            "iss": self.issuer,
+            "aud": audience,
+            "sub": "1234567890",
+            "email": "test@gmail.com",
+            "email_verified": True,
+            "name": "테스트",
+            "iat": now,
+            "exp": now + 3600,
+            **claims,
+        }
+        return jwt.encode(
+            payload,
+            private_key or self.private_key,
+            algorithm="RS256",
+            headers={"kid": self.kid},
+        )
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        self.requests_count += 1
+        self.timeouts.append(kwargs.get("timeout"))
+        time.sleep(self.delay)
+        jwk = json.loads(
+            jwt.algorithms.RSAAlgorithm.to_jwk(self.private_key.public_key())
+        )
+        response = Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response.headers["Cache-Control"] = f"public, max-age={self.max_age}"
+        response._content = json.dumps(
+            {"keys": [{**jwk, "kid": self.kid, "alg": "RS256", "use": "sig"}]}
+        ).encode()
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
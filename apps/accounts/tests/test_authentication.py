@@ -0,0 +1,137 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.accounts.authentication import token_cache, user_cache_key, user_local_cache
+from apps.accounts.models import User
+from apps.accounts.urls import AccountsURLs
+
+
+class CachedUserJWTAuthenticationTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        user_local_cache.clear()
+        self.user = User.objects.create_user(
+            email="test@test.com",
+            username="test",
+            password="test",
+        )
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}"
+        )
+
+    def test_user_is_cached(self):
+        """
+        같은 유저의 두 번째 요청부터는 인증 시 유저를 조회하지 않습니다.
+        """
+        url = reverse(AccountsURLs.MY_PROFILE)
+        with self.assertNumQueries(2):
+            self.client.get(url)
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+                "LOCATION": "test_user_cache",
+            }
+        }
+    )
+    def test_cached_user_does_not_query_database_cache(self):
+        """
+        공유 캐시가 DB 를 사용하더라도, 이어지는 요청은 프로세스 메모리 LRU 에서 유저를 읽어
+        인증에 DB 를 조회하지 않습니다. (남은 1번은 내 프로필 조회입니다.)
+        """
+        call_command("createcachetable", verbosity=0)
+        url = reverse(AccountsURLs.MY_PROFILE)
+        self.client.get(url)
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        # 로컬 LRU 가 비면 공유 캐시(DB) 조회 1번이 더해집니다.
+        user_local_cache.clear()
+        with self.assertNumQueries(2):
+            self.client.get(url)
+
+    def test_cache_is_invalidated_on_profile_update(self):
+        url = reverse(AccountsURLs.MY_PROFILE)
+        self.client.get(url)
+        response = self.client.put(url, {"username": "changed"})
+        self.assertEqual(response.status_code, 200, f"response: {response.data}")
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual(response.data["username"], "changed")
+
+    def test_cache_is_invalidated_on_delete(self):
+        url = reverse(AccountsURLs.MY_PROFILE)
+        self.client.get(url)
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, 204)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 401)
+
+    def test_cache_is_invalidated_again_after_commit(self):
+        """
+        커밋 전에 다른 요청이 이전 유저를 다시 캐시하더라도, 커밋 후에는 캐시가 지워져야 합니다.
+        """
+        key = user_cache_key(self.user.uuid)
+        stale_user = User.objects.get(pk=self.user.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.username = "changed"
+            self.user.save()
+            cache.set(key, stale_user)
+        self.assertIsNone(cache.get(key))
+        response = self.client.get(reverse(AccountsURLs.MY_PROFILE))
+        self.assertEqual(response.data["username"], "changed")
+
+
+class AccessTokenCacheTestCase(APITestCase):
+    def setUp(self):
+        token_cache.clear()
+        self.admin = User.objects.create_superuser(
+            email="admin@test.com",
+            username="admin",
+            password="admin",
+        )
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.admin)}"
+        )
+
+    def test_validated_token_is_reused(self):
+        url = reverse(AccountsURLs.TOKEN_CACHE_STATS)
+        self.client.get(url)
+        with patch.object(
+            JWTAuthentication, "get_validated_token", side_effect=AssertionError
+        ):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, f"response: {response.data}")
+        self.assertEqual(response.data["size"], 1)
+        self.assertGreaterEqual(response.data["hits"], 1)
+
+    def test_expired_token_is_not_cached(self):
+        token = AccessToken.for_user(self.admin)
+        token.set_exp(lifetime=-timedelta(seconds=1))
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        response = self.client.get(reverse(AccountsURLs.MY_PROFILE))
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(token_cache.stats()["size"], 0)
+
+    def test_token_cache_stats_is_only_for_admin(self):
+        user = User.objects.create_user(
+            email="test@test.com", username="test", password="test"
+        )
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}"
+        )
+        response = self.client.get(reverse(AccountsURLs.TOKEN_CACHE_STATS))
+        self.assertEqual(response.status_code, 403)
@@ -1,7 +1,16 @@
+from unittest.mock import Mock, patch
+
+import requests
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.conf import settings
+from django.test import override_settings
 from rest_framework import status
 from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
 
+from apps.accounts.google import GoogleIdTokenVerifier
+from apps.accounts.models import User
+from apps.accounts.tests.fakes import FakeGoogle
 from apps.accounts.urls import AccountsURLs
 
 
@@ -19,3 +28,75 @@ class GoogleLoginTestCase(APITestCase):
         self.assertIn("detail", response.data)
         self.assertEqual(response.data["code"], "token_not_valid")
         self.assertEqual(response.data["detail"], "Token is invalid or expired")
+
+
+@override_settings(LAST_LOGIN_FLUSH_INTERVAL=0)
+class GoogleIdTokenLoginTestCase(APITestCase):
+    """
+    FakeGoogle 로 Google 공개키 endpoint 를 대신해, 네트워크 없이 로그인 과정을 확인합니다.
+    """
+
+    def setUp(self):
+        self.client_id = settings.SOCIALACCOUNT_PROVIDERS["google"]["APP"]["client_id"]
+        self.fake_google = FakeGoogle()
+        self.verifier = GoogleIdTokenVerifier(connect_timeout=0.5, read_timeout=1.5)
+        self.fake_google.install(self.verifier)
+        patcher = patch("apps.accounts.google.google_id_token_verifier", self.verifier)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _login(self, id_token: str):
+        return self.client.post(
+            path=reverse(AccountsURLs.GOOGLE_LOGIN),
+            data={"access": id_token},
+        )
+
+    def test_google_login(self):
+        response = self._login(self.fake_google.issue_id_token(self.client_id))
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertIn("access", response.data)
+        self.assertIn("refresh", response.data)
+        self.assertTrue(User.objects.filter(email="test@gmail.com").exists())
+
+    def test_signing_keys_are_fetched_once_with_timeout(self):
+        """
+        공개키는 한 번만 받아오고, 이후 로그인은 Google 에 요청하지 않아야 합니다.
+        """
+        for sub in range(3):
+            response = self._login(
+                self.fake_google.issue_id_token(
+                    self.client_id, sub=str(sub), email=f"test{sub}@gmail.com"
+                )
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(self.fake_google.requests_count, 1)
+        self.assertEqual(self.fake_google.timeouts, [(0.5, 1.5)])
+
+    def test_verified_id_token_is_cached(self):
+        id_token = self.fake_google.issue_id_token(self.client_id)
+        self._login(id_token)
+        with patch("jwt.decode", side_effect=AssertionError):
+            response = self._login(id_token)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+    def test_forged_id_token(self):
+        """
+        Google 의 키로 서명되지 않은 id token 으로는 로그인할 수 없어야 합니다.
+        """
+        forged_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        response = self._login(
+            self.fake_google.issue_id_token(self.client_id, private_key=forged_key)
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_other_audience_id_token(self):
+        response = self._login(self.fake_google.issue_id_token("other-client-id"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_google_unavailable(self):
+        self.verifier.session.mount(
+            self.verifier.certs_url,
+            Mock(send=Mock(side_effect=requests.ConnectTimeout)),
+        )
+        response = self._login(self.fake_google.issue_id_token(self.client_id))
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
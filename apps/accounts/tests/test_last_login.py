@@ -0,0 +1,76 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.db import DatabaseError
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from apps.accounts.buffers import LastLoginBuffer
+from apps.accounts.models import User
+
+
+class LastLoginBufferTestCase(APITestCase):
+    def setUp(self):
+        self.buffer = LastLoginBuffer(flush_interval=3600)
+        self.addCleanup(self.buffer.stop)
+        self.user = User.objects.create_user(
+            email="test@test.com",
+            username="test",
+            password="test",
+        )
+        self.another_user = User.objects.create_user(
+            email="another@test.com",
+            username="another",
+            password="another",
+        )
+
+    def test_records_are_coalesced_into_single_update(self):
+        """
+        같은 유저의 로그인은 가장 늦은 시각만 남고, flush 할 때 한 번의 UPDATE 로 저장되어야 합니다.
+        """
+        now = timezone.now()
+        self.buffer.record(self.user.pk, now - timedelta(minutes=1))
+        self.buffer.record(self.user.pk, now)
+        self.buffer.record(self.user.pk, now - timedelta(minutes=2))
+        self.buffer.record(self.another_user.pk, now)
+        self.user.refresh_from_db()
+        self.assertIsNone(self.user.last_login)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.buffer.flush(), 2)
+        self.user.refresh_from_db()
+        self.another_user.refresh_from_db()
+        self.assertEqual(self.user.last_login, now)
+        self.assertEqual(self.another_user.last_login, now)
+
+    def test_flush_when_pending_is_full(self):
+        self.buffer.max_pending = 2
+        now = timezone.now()
+        self.buffer.record(self.user.pk, now)
+        self.buffer.record(self.another_user.pk, now)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.last_login, now)
+
+    def test_login_is_buffered(self):
+        """
+        로그인하면 last_login 은 바로 저장되지 않고, 버퍼가 멈출 때 저장되어야 합니다.
+        """
+        with patch("apps.accounts.signals.last_login_buffer", self.buffer):
+            self.assertTrue(self.client.login(email="test@test.com", password="test"))
+        self.user.refresh_from_db()
+        self.assertIsNone(self.user.last_login)
+
+        self.buffer.stop()
+        self.user.refresh_from_db()
+        self.assertIsNotNone(self.user.last_login)
+
+    def test_stop_logs_failed_flush(self):
+        """
+        멈출 때 저장에 실패하면 예외를 던지지 않고 로그를 남기며, 기록은 버퍼에 남아 있어야 합니다.
+        """
+        self.buffer.record(self.user.pk, timezone.now())
+        with patch.object(
+            User.objects, "bulk_update", side_effect=DatabaseError
+        ), self.assertLogs("apps.accounts.buffers", level="ERROR"):
+            self.buffer.stop()
+        self.assertEqual(self.buffer.flush(), 1)
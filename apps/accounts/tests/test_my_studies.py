@@ -0,0 +1,220 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+from django.utils.datetime_safe import date
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from apps.accounts.urls import AccountsURLs
+from apps.studygroup.caches import my_studygroup_counts_cache
+from apps.studygroup.models import (
+    StudyGroup,
+    StudyGroupMember,
+    StudyGroupMemberRequest,
+    StudyGroupUserRelation,
+)
+from apps.studygroup.models.member import Relationship
+from apps.studygroup.tests.factories import (
+    OpenedByDeadlineStudyGroupFactory,
+    StudyGroupGeneralMemberFactory,
+    StudyGroupLeaderMemberFactory,
+    StudyGroupMemberRequestFactory,
+    UserFactory,
+)
+
+
+class MyStudyTestCase(APITestCase):
+    """
+    내 스터디그룹 목록(filter) 테스트
+    """
+
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.leading = OpenedByDeadlineStudyGroupFactory(members=None)
+        StudyGroupLeaderMemberFactory(studygroup=self.leading, user=self.user)
+        self.approved = OpenedByDeadlineStudyGroupFactory()
+        self.approved_request = StudyGroupMemberRequestFactory(
+            studygroup=self.approved, user=self.user, processed=True, is_approved=True
+        )
+        self.member = StudyGroupGeneralMemberFactory(
+            studygroup=self.approved, user=self.user
+        )
+        self.current = OpenedByDeadlineStudyGroupFactory()
+        StudyGroupGeneralMemberFactory(studygroup=self.current, user=self.user)
+        StudyGroup.objects.filter(pk=self.current.pk).update(
+            start_date=date.today() - timedelta(days=1)
+        )
+        self.requested = OpenedByDeadlineStudyGroupFactory()
+        StudyGroupMemberRequestFactory(studygroup=self.requested, user=self.user)
+        self.disapproved = OpenedByDeadlineStudyGroupFactory()
+        StudyGroupMemberRequestFactory(
+            studygroup=self.disapproved, user=self.user, processed=True
+        )
+        self.client.force_authenticate(user=self.user)
+        cache.clear()
+
+    def _my_studies(self, value: str) -> list[str]:
+        response = self.client.get(
+            reverse(AccountsURLs.MY_PROFILE_STUDIES), {"filter": value}
+        )
+        self.assertEqual(response.status_code, 200, f"response: {response.data}")
+        return [item["uuid"] for item in response.data["results"]]
+
+    def test_filter_my_studies(self):
+        self.assertEqual(self._my_studies("as_leader"), [str(self.leading.uuid)])
+        self.assertEqual(self._my_studies("approved"), [str(self.approved.uuid)])
+        self.assertEqual(self._my_studies("current"), [str(self.current.uuid)])
+        self.assertEqual(self._my_studies("requested"), [str(self.requested.uuid)])
+        self.assertEqual(self._my_studies("disapproved"), [str(self.disapproved.uuid)])
+
+    def test_relation_follows_member_and_request_changes(self):
+        """
+        멤버가 탈퇴하면 남아 있는 가입 요청에 따라 관계가 다시 계산되어야 합니다.
+        """
+        self.member.delete()
+        self.assertEqual(self._my_studies("approved"), [])
+
+        self.approved_request.processed = False
+        self.approved_request.is_approved = False
+        self.approved_request.save()
+        self.assertIn(str(self.approved.uuid), self._my_studies("requested"))
+        self.approved_request.delete()
+        self.assertNotIn(str(self.approved.uuid), self._my_studies("requested"))
+
+    def test_requested_excludes_expired_studygroups(self):
+        """
+        모집 마감일이 지난 스터디그룹은 저장된 모집 상태와 관계없이 requested 에서 제외됩니다.
+        """
+        StudyGroup.objects.filter(pk=self.requested.pk).update(
+            deadline=date.today() - timedelta(days=1)
+        )
+        self.assertEqual(self._my_studies("requested"), [])
+
+    def test_requested_includes_studygroups_closing_today(self):
+        """
+        모집 마감일 당일까지는 모집 중이므로(is_closed 와 같은 기준), requested 에 포함됩니다.
+        """
+        StudyGroup.objects.filter(pk=self.requested.pk).update(deadline=date.today())
+        self.assertEqual(self._my_studies("requested"), [str(self.requested.uuid)])
+
+    def test_deleting_studygroup_deletes_relations(self):
+        self.approved.delete()
+        self.assertFalse(
+            StudyGroupUserRelation.objects.filter(studygroup=self.approved.pk).exists()
+        )
+        self.assertEqual(self._my_studies("approved"), [])
+
+    def test_rebuild_user_relations_command(self):
+        relations = set(
+            StudyGroupUserRelation.objects.values_list(
+                "user", "studygroup", "relationship"
+            )
+        )
+        StudyGroupUserRelation.objects.all().delete()
+        call_command("rebuild_user_relations", stdout=StringIO())
+        self.assertEqual(
+            set(
+                StudyGroupUserRelation.objects.values_list(
+                    "user", "studygroup", "relationship"
+                )
+            ),
+            relations,
+        )
+        self.assertIn(
+            (self.user.pk, self.disapproved.pk, Relationship.DISAPPROVED), relations
+        )
+
+    def test_rebuild_user_relations_command_invalidates_counts(self):
+        """
+        rebuild 는 signal 없이 관계를 다시 만들므로, 캐시된 스터디그룹 수도 다시 계산해야 합니다.
+        """
+        url = reverse(AccountsURLs.MY_PROFILE_STUDIES_COUNTS)
+        self.client.get(url)
+        StudyGroupUserRelation.objects.filter(
+            user=self.user, studygroup=self.requested
+        ).update(relationship=Relationship.DISAPPROVED)
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("rebuild_user_relations", stdout=StringIO())
+        response = self.client.get(url)
+        self.assertEqual(response.data["requested"], 1)
+        self.assertEqual(response.data["disapproved"], 1)
+
+    def test_my_studies_counts(self):
+        """
+        filter 값별 스터디그룹 수는 한 번의 쿼리로 계산되고, 이후에는 캐시된 값을 사용해야 합니다.
+        """
+        url = reverse(AccountsURLs.MY_PROFILE_STUDIES_COUNTS)
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, f"response: {response.data}")
+        self.assertEqual(
+            response.data,
+            {
+                "current": 1,
+                "requested": 1,
+                "approved": 1,
+                "disapproved": 1,
+                "as_leader": 1,
+            },
+        )
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+        StudyGroupMemberRequestFactory(
+            studygroup=OpenedByDeadlineStudyGroupFactory(), user=self.user
+        )
+        response = self.client.get(url)
+        self.assertEqual(response.data["requested"], 2)
+
+    def test_my_studies_counts_are_invalidated_after_commit(self):
+        """
+        커밋 전에 다른 요청이 이전 값을 다시 캐시하더라도, 커밋 후에는 캐시가 지워져야 합니다.
+        """
+        key = my_studygroup_counts_cache.make_key(self.user.pk)
+        self.client.get(reverse(AccountsURLs.MY_PROFILE_STUDIES_COUNTS))
+        stale = cache.get(key)
+        self.assertIsNotNone(stale)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.approved_request.delete()
+            cache.set(key, stale)
+        self.assertIsNone(cache.get(key))
+
+    @override_settings(DEBUG=True)
+    def test_benchmark_my_studies_command(self):
+        """
+        benchmark_my_studies 커맨드는 filter 값별 지연 시간을 출력하고, 만든 데이터는 롤백해야 합니다.
+        """
+        counts = [
+            model.objects.count()
+            for model in (StudyGroup, StudyGroupMember, StudyGroupMemberRequest)
+        ]
+        stdout, stderr = StringIO(), StringIO()
+        call_command(
+            "benchmark_my_studies",
+            studies=20,
+            memberships=100,
+            users=10,
+            repeat=3,
+            batch_size=7,
+            stdout=stdout,
+            stderr=stderr,
+        )
+        for name in ("current", "requested", "approved", "disapproved", "as_leader"):
+            self.assertIn(name, stdout.getvalue())
+        # 모든 방식이 같은 스터디그룹을 조회해야 합니다.
+        self.assertEqual(stderr.getvalue(), "")
+        self.assertEqual(
+            [
+                model.objects.count()
+                for model in (StudyGroup, StudyGroupMember, StudyGroupMemberRequest)
+            ],
+            counts,
+        )
+
+    def test_benchmark_my_studies_command_requires_debug(self):
+        with self.assertRaises(CommandError):
+            call_command("benchmark_my_studies", studies=1, stdout=StringIO())
+        self.assertFalse(StudyGroup.objects.filter(name__startswith="bench-").exists())
@@ -0,0 +1,159 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.accounts.models import User
+from apps.accounts.tokens import blacklist_filter
+from apps.accounts.urls import AccountsURLs
+from apps.core.bloom import BloomFilter
+
+
+class BloomFilterTestCase(APITestCase):
+    def test_added_values_are_always_found(self):
+        bloom = BloomFilter(capacity=1000)
+        values = [f"jti-{i}" for i in range(1000)]
+        for value in values:
+            bloom.add(value)
+        self.assertTrue(all(bloom.might_contain(value) for value in values))
+        self.assertTrue(bloom.is_full)
+
+    def test_false_positive_rate_is_bounded(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+        false_positives = sum(bloom.might_contain(f"other-{i}") for i in range(10000))
+        self.assertLess(false_positives, 300)
+
+
+class TokenBlacklistFilterTestCase(APITestCase):
+    def setUp(self):
+        blacklist_filter.reset()
+        self.user = User.objects.create_user(
+            email="test@test.com",
+            username="test",
+            password="test",
+        )
+
+    def _refresh(self, refresh_token: RefreshToken):
+        return self.client.post(
+            path=reverse(AccountsURLs.REFRESH_LOGIN),
+            data={"refresh": str(refresh_token)},
+        )
+
+    def test_refresh_skips_blacklist_query_for_unknown_token(self):
+        refresh_token = RefreshToken.for_user(self.user)
+        blacklist_filter.sync()
+        with CaptureQueriesContext(connection) as queries:
+            response = self._refresh(refresh_token)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        blacklist_checks = [
+            query["sql"]
+            for query in queries.captured_queries
+            if BlacklistedToken._meta.db_table in query["sql"]
+            and '"jti" =' in query["sql"]
+        ]
+        self.assertEqual(blacklist_checks, [])
+
+    def test_filter_is_checked_without_queries(self):
+        """
+        sync_interval 안에서는 DB 도 캐시도 조회하지 않습니다.
+        """
+        blacklist_filter.sync()
+        with self.assertNumQueries(0):
+            self.assertFalse(blacklist_filter.might_contain("unknown-jti"))
+
+    def test_blacklisted_in_other_process_is_rejected(self):
+        """
+        다른 프로세스에서 blacklist 에 추가된 토큰도, sync_interval 이 지나면 거부되어야 합니다.
+        """
+        refresh_token = RefreshToken.for_user(self.user)
+        blacklist_filter.sync()
+        BlacklistedToken.objects.bulk_create(
+            [
+                BlacklistedToken(
+                    token=OutstandingToken.objects.get(jti=refresh_token["jti"])
+                )
+            ]
+        )
+        with mock.patch.object(blacklist_filter, "sync_interval", 0):
+            response = self._refresh(refresh_token)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_blacklisted_before_sync_is_rejected(self):
+        """
+        filter 에 아직 반영되지 않은 토큰도, 재발급할 때 blacklist 에 추가하면서 거부되어야 합니다.
+        """
+        refresh_token = RefreshToken.for_user(self.user)
+        blacklist_filter.sync()
+        BlacklistedToken.objects.bulk_create(
+            [
+                BlacklistedToken(
+                    token=OutstandingToken.objects.get(jti=refresh_token["jti"])
+                )
+            ]
+        )
+        self.assertFalse(blacklist_filter.might_contain(refresh_token["jti"]))
+        response = self._refresh(refresh_token)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_late_committed_blacklist_is_rejected(self):
+        """
+        더 작은 pk 로 늦게 커밋된 blacklist 항목도 다음 동기화에서 읽어야 합니다.
+        """
+        early, late = RefreshToken.for_user(self.user), RefreshToken.for_user(self.user)
+        BlacklistedToken.objects.create(
+            pk=10, token=OutstandingToken.objects.get(jti=late["jti"])
+        )
+        blacklist_filter.sync()
+        BlacklistedToken.objects.bulk_create(
+            [
+                BlacklistedToken(
+                    pk=5, token=OutstandingToken.objects.get(jti=early["jti"])
+                )
+            ]
+        )
+        with mock.patch.object(blacklist_filter, "sync_interval", 0):
+            self.assertTrue(blacklist_filter.might_contain(early["jti"]))
+
+    def test_rotated_token_is_rejected(self):
+        refresh_token = RefreshToken.for_user(self.user)
+        self.assertEqual(self._refresh(refresh_token).status_code, status.HTTP_200_OK)
+        self.assertTrue(blacklist_filter.might_contain(refresh_token["jti"]))
+        self.assertEqual(
+            self._refresh(refresh_token).status_code, status.HTTP_401_UNAUTHORIZED
+        )
+
+
+class PruneExpiredTokensTestCase(APITestCase):
+    def test_prune_expired_tokens(self):
+        user = User.objects.create_user(
+            email="test@test.com",
+            username="test",
+            password="test",
+        )
+        tokens = [RefreshToken.for_user(user) for _ in range(5)]
+        for token in tokens[:2]:
+            token.blacklist()
+        OutstandingToken.objects.filter(
+            jti__in=[token["jti"] for token in tokens[:3]]
+        ).update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        call_command("prune_expired_tokens", "--batch-size=2", stdout=StringIO())
+        self.assertEqual(
+            set(OutstandingToken.objects.values_list("jti", flat=True)),
+            {token["jti"] for token in tokens[3:]},
+        )
+        self.assertFalse(BlacklistedToken.objects.exists())
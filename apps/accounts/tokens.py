@@ -0,0 +1,125 @@
+import threading
+import time
+from datetime import timedelta
+
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.tokens import RefreshToken as _RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from apps.core.bloom import BloomFilter
+
+
+class BlacklistFilter:
+    """
+    blacklist 에 등록된 refresh token 의 jti 들을 프로세스 메모리의 Bloom filter 로 보관합니다.
+    might_contain() 이 False 면 blacklist 에 없는 토큰이므로, DB 를 조회하지 않아도 됩니다.
+
+    처음 사용할 때 전체 blacklist 로 만들고, 이후에는 sync_interval(초)마다
+    최근 sync_margin(초) 안에 추가된 항목부터 다시 읽습니다.
+    pk 는 커밋 순서대로 보이지 않으므로(먼저 pk 를 받은 트랜잭션이 나중에 커밋될 수 있음),
+    마지막으로 읽은 pk 뒤만 읽으면 늦게 커밋된 항목을 영영 놓칩니다.
+    sync_margin 보다 오래 열려 있는 트랜잭션에서 추가된 항목만 놓칠 수 있습니다.
+
+    이 프로세스에서 추가된 항목은 바로 반영되고, 다른 프로세스에서 추가된 항목은 최대 sync_interval 초 뒤에 반영됩니다.
+    그 사이에 다시 사용된 토큰은 RefreshToken.blacklist() 에서 거부합니다.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100_000,
+        sync_interval: float = 5,
+        sync_margin: float = 60,
+    ) -> None:
+        self.capacity = capacity
+        self.sync_interval = sync_interval
+        self.sync_margin = sync_margin
+        self._lock = threading.Lock()
+        self._filter: BloomFilter | None = None
+        self._pk_floor = 0
+        self._synced_at = 0.0
+
+    def might_contain(self, jti: str) -> bool:
+        return self.sync().might_contain(jti)
+
+    def add(self, jti: str) -> None:
+        with self._lock:
+            if self._filter is not None:
+                self._filter.add(jti)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._filter = None
+
+    def sync(self) -> BloomFilter:
+        """
+        sync_interval 이 지났다면 DB 에서 다시 읽고, 사용할 filter 를 반환합니다.
+        """
+        with self._lock:
+            if (
+                self._filter is not None
+                and not self._filter.is_full
+                and time.monotonic() < self._synced_at + self.sync_interval
+            ):
+                return self._filter
+            if self._filter is None or self._filter.is_full:
+                self._rebuild()
+            bloom = self._filter
+            self._synced_at = time.monotonic()
+            # sync_margin 보다 오래된 항목까지는 다음에 다시 읽지 않습니다.
+            settled_before = timezone.now() - timedelta(seconds=self.sync_margin)
+            for pk, blacklisted_at, jti in (
+                BlacklistedToken.objects.filter(pk__gt=self._pk_floor)
+                .order_by("pk")
+                .values_list("pk", "blacklisted_at", "token__jti")
+            ):
+                bloom.add(jti)
+                if blacklisted_at < settled_before:
+                    self._pk_floor = pk
+            return bloom
+
+    def _rebuild(self) -> None:
+        count = BlacklistedToken.objects.count()
+        while self.capacity <= count:
+            self.capacity *= 2
+        self._filter = BloomFilter(self.capacity)
+        self._pk_floor = 0
+
+
+blacklist_filter = BlacklistFilter()
+
+
+class RefreshToken(_RefreshToken):
+    """
+    blacklist_filter 에 없는 토큰은 blacklist 를 조회하지 않습니다.
+    """
+
+    def check_blacklist(self) -> None:
+        jti = self.payload[api_settings.JTI_CLAIM]
+        if not blacklist_filter.might_contain(jti):
+            return
+        if BlacklistedToken.objects.filter(token__jti=jti).exists():
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self) -> BlacklistedToken:
+        """
+        이미 blacklist 에 있던 토큰이면 거부합니다.
+        다른 프로세스의 blacklist_filter 에 아직 반영되지 않은 토큰도, 재발급, 로그아웃에서는 여기서 걸러집니다.
+        """
+        token, _created = OutstandingToken.objects.get_or_create(
+            jti=self.payload[api_settings.JTI_CLAIM],
+            defaults={
+                "token": str(self),
+                "expires_at": datetime_from_epoch(self.payload["exp"]),
+            },
+        )
+        blacklisted, created = BlacklistedToken.objects.get_or_create(token=token)
+        if not created:
+            raise TokenError(_("Token is blacklisted"))
+        return blacklisted
@@ -7,6 +7,8 @@ from apps.accounts.views import (
     LogoutAPI,
     MyProfileAPI,
     MyStudyAPI,
+    MyStudyCountsAPI,
+    TokenCacheStatsAPI,
     TokenRefreshAPI,
     UUIDProfileAPI,
 )
@@ -20,7 +22,9 @@ class AccountsURLs:
     LOGOUT: str = "token-blacklist"
     MY_PROFILE: str = "profile-login-user"
     MY_PROFILE_STUDIES: str = "profile-login-studies"
+    MY_PROFILE_STUDIES_COUNTS: str = "profile-login-studies-counts"
     UUID_PROFILE: str = "profile-uuid"
+    TOKEN_CACHE_STATS: str = "token-cache-stats"
 
 
 urlpatterns = [
@@ -54,6 +58,12 @@ urlpatterns = [
         LogoutAPI.as_view(),
         name="token-blacklist",
     ),
+    # 모니터링
+    path(
+        "token-cache/stats/",
+        TokenCacheStatsAPI.as_view(),
+        name="token-cache-stats",
+    ),
     # 프로필
     path(
         "profiles/",
@@ -69,6 +79,11 @@ urlpatterns = [
                     MyStudyAPI.as_view(),
                     name="profile-login-studies",
                 ),
+                path(
+                    "me/studies/counts/",
+                    MyStudyCountsAPI.as_view(),
+                    name="profile-login-studies-counts",
+                ),
                 path(
                     "<uuid:user_uuid>/",
                     UUIDProfileAPI.as_view(),
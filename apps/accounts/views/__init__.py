@@ -1,13 +1,21 @@
 from apps.accounts.views.login import GoogleLoginAPI
 from apps.accounts.views.logout import LogoutAPI
-from apps.accounts.views.profile import MyProfileAPI, MyStudyAPI, UUIDProfileAPI
+from apps.accounts.views.profile import (
+    MyProfileAPI,
+    MyStudyAPI,
+    MyStudyCountsAPI,
+    UUIDProfileAPI,
+)
 from apps.accounts.views.refresh import TokenRefreshAPI
+from apps.accounts.views.stats import TokenCacheStatsAPI
 
 __all__ = [
     "GoogleLoginAPI",
     "LogoutAPI",
     "MyProfileAPI",
     "MyStudyAPI",
+    "MyStudyCountsAPI",
     "UUIDProfileAPI",
     "TokenRefreshAPI",
+    "TokenCacheStatsAPI",
 ]
@@ -1,6 +1,5 @@
 from typing import Any
 
-from allauth.socialaccount.providers.google.views import GoogleOAuth2Adapter
 from allauth.socialaccount.providers.oauth2.client import OAuth2Error
 from dj_rest_auth.app_settings import api_settings
 from dj_rest_auth.registration.views import SocialLoginView
@@ -10,6 +9,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework_simplejwt.exceptions import InvalidToken
 
+from apps.accounts.google import GoogleIdTokenAdapter
 from apps.accounts.serializers import GoogleLoginSerializer
 
 
@@ -30,7 +30,7 @@ class GoogleLoginAPI(SocialLoginView):  # type: ignore
     """
 
     serializer_class = GoogleLoginSerializer
-    adapter_class = GoogleOAuth2Adapter
+    adapter_class = GoogleIdTokenAdapter
 
     @extend_schema(
         tags=["로그인/로그아웃 API"],
@@ -1,6 +1,8 @@
 from drf_spectacular.utils import extend_schema
 from rest_framework_simplejwt.views import TokenBlacklistView as _TokenBlacklistView
 
+from apps.accounts.serializers import TokenBlacklistSerializer
+
 
 @extend_schema(
     tags=["로그인/로그아웃 API"],
@@ -11,4 +13,4 @@ class LogoutAPI(_TokenBlacklistView):  # type: ignore
     로그아웃에 사용된 refresh token 은 더 이상 사용될 수 없습니다.
     """
 
-    pass
+    serializer_class = TokenBlacklistSerializer
@@ -1,6 +1,6 @@
 from typing import Any
 
-from django.db.models import QuerySet
+from django.db.models import Count, Q, QuerySet
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema
 from rest_framework import generics, mixins
@@ -11,10 +11,14 @@ from rest_framework.response import Response
 
 from apps.accounts.models import User
 from apps.accounts.serializers import ProfileSerializer
-from apps.studygroup.filters import MyStudyGroupFilter
+from apps.studygroup.caches import my_studygroup_counts_cache
+from apps.studygroup.filters import MyStudyGroupFilter, my_studygroup_conditions
 from apps.studygroup.models import StudyGroup
 from apps.studygroup.pagination import StudyGroupPagination
-from apps.studygroup.serializers import MyStudyGroupReadSerializer
+from apps.studygroup.serializers import (
+    MyStudyGroupCountsSerializer,
+    MyStudyGroupReadSerializer,
+)
 
 
 @extend_schema(
@@ -70,6 +74,41 @@ class MyStudyAPI(mixins.ListModelMixin, generics.GenericAPIView):
         return self.list(request, *args, **kwargs)
 
 
+@extend_schema(
+    tags=["사용자 정보 API"],
+)
+class MyStudyCountsAPI(generics.GenericAPIView):
+    """
+    로그인한 사용자와 관련된 스터디 그룹 수를 filter 값별로 조회합니다.
+    """
+
+    serializer_class = MyStudyGroupCountsSerializer
+    queryset = StudyGroup.objects.all()
+
+    def get_counts(self) -> dict[str, int]:
+        """
+        조건부 집계(COUNT ... FILTER)로 다섯 가지 filter 값의 스터디그룹 수를 한 번의 쿼리로 계산합니다.
+        """
+        counts = {
+            name: Count(
+                "pk", filter=Q(user_relations__relationship=relationship) & condition
+            )
+            for name, (relationship, condition) in my_studygroup_conditions().items()
+        }
+        return (
+            self.get_queryset()
+            .filter(user_relations__user=self.request.user)
+            .aggregate(**counts)
+        )
+
+    @extend_schema(summary="로그인한 사용자와 관련된 스터디 그룹 수를 filter 값별로 조회합니다.")
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        counts = my_studygroup_counts_cache.get_or_build(
+            request.user.pk, self.get_counts
+        )
+        return Response(self.get_serializer(counts).data)
+
+
 @extend_schema(
     tags=["사용자 정보 API"],
 )
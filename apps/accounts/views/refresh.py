@@ -7,12 +7,16 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework_simplejwt.views import TokenRefreshView as _TokenRefreshView
 
+from apps.accounts.serializers import TokenRefreshSerializer
+
 
 class TokenRefreshAPI(_TokenRefreshView):  # type: ignore
     """
     클라이언트가 가지고 있는 refresh token 을 이용하여 새로운 access token 을 발급합니다.
     """
 
+    serializer_class = TokenRefreshSerializer
+
     @extend_schema(
         tags=["로그인/로그아웃 API"],
         summary="클라이언트가 가지고 있는 refresh token 을 이용하여 새로운 access token 을 발급합니다.",
@@ -0,0 +1,26 @@
+from typing import Any
+
+from drf_spectacular.utils import extend_schema
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.accounts.authentication import token_cache
+
+
+@extend_schema(
+    tags=["모니터링 API"],
+    summary="이 프로세스의 access token 캐시 통계를 조회합니다. 관리자만 가능합니다.",
+    responses={200: dict},
+)
+class TokenCacheStatsAPI(APIView):
+    """
+    적중(hits), 실패(misses), 크기 제한으로 밀려난 항목(evictions) 수와 적중률(hit_ratio)을 반환합니다.
+    값은 요청을 처리한 프로세스 기준입니다.
+    """
+
+    permission_classes = (IsAdminUser,)
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return Response(token_cache.stats())
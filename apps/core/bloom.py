@@ -0,0 +1,45 @@
+import hashlib
+import math
+from typing import Iterable
+
+
+class BloomFilter:
+    """
+    문자열 집합을 비트 배열로 표현하는 Bloom filter 입니다.
+    might_contain() 이 False 면 추가된 적이 없는 값이고, True 면 추가된 값이거나 낮은 확률(error_rate)로 오탐입니다.
+    capacity 개보다 많이 추가하면 오탐 확률이 높아지므로, is_full 이면 더 큰 capacity 로 다시 만들어야 합니다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    @property
+    def is_full(self) -> bool:
+        return self.count >= self.capacity
+
+    def _positions(self, value: str) -> Iterable[int]:
+        """
+        두 개의 64비트 해시를 조합해 hash_count 개의 위치를 만듭니다. (Kirsch-Mitzenmacher)
+        """
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def might_contain(self, value: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
@@ -0,0 +1,65 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+MISSING = object()
+
+
+class LocalLRUCache:
+    """
+    크기가 maxsize 로 제한된 프로세스 메모리 LRU 캐시입니다.
+    각 항목은 ttl(초) 동안만 유효하며, set() 에서 항목마다 ttl 을 따로 지정할 수 있습니다.
+    적중(hit), 실패(miss), 크기 제한으로 밀려난 항목(eviction) 수를 stats() 로 확인할 수 있습니다.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 5) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and time.monotonic() >= item[0]:
+                del self._data[key]
+                item = None
+            if item is None:
+                self._misses += 1
+                return MISSING
+            self._hits += 1
+            self._data.move_to_end(key)
+            return item[1]
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_ratio": self._hits / total if total else 0.0,
+            }
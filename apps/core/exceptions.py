@@ -0,0 +1,14 @@
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = "요청한 리소스가 그 사이에 변경되었습니다. 다시 조회한 뒤 시도해주세요."
+    default_code = "precondition_failed"
+
+
+class ServiceUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "외부 서비스에 연결할 수 없습니다. 잠시 후 다시 시도해주세요."
+    default_code = "service_unavailable"
@@ -1,4 +1,6 @@
 from django.contrib import admin
+from django.db.models import QuerySet
+from django.http import HttpRequest
 
 from apps.studygroup.models import Category
 
@@ -10,3 +12,6 @@ class CategoryAdmin(admin.ModelAdmin[Category]):
         "name",
         "related_studygroups_count",
     )
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet[Category]:
+        return super().get_queryset(request).with_studygroups_count()  # type: ignore
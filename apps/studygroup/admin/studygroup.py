@@ -85,6 +85,8 @@ class StudyGroupAdmin(admin.ModelAdmin[StudyGroup]):
         "uuid",
         "created_at",
         "updated_at",
+        "member_count",
+        "recruitment_status",
     )
     list_display = (
         "head_image_tag",
@@ -128,6 +130,8 @@ class StudyGroupAdmin(admin.ModelAdmin[StudyGroup]):
                     "end_date",
                     "deadline",
                     "member_limit",
+                    "member_count",
+                    "recruitment_status",
                 )
             },
         ),
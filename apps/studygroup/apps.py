@@ -6,3 +6,6 @@ class StudygroupConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.studygroup"
     verbose_name = _("StudyGroup")
+
+    def ready(self) -> None:
+        from apps.studygroup import signals  # noqa: F401
@@ -0,0 +1,334 @@
+import abc
+import hashlib
+import heapq
+import random
+import threading
+import time
+from datetime import date
+from typing import Any, Callable, Generic, Iterable, TypeVar
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count
+from django.http import QueryDict
+
+from apps.core.caches import MISSING, LocalLRUCache
+from apps.studygroup.models import Category, Tag
+
+T = TypeVar("T")
+
+
+class ProcessLocalCache(abc.ABC, Generic[T]):
+    """
+    DB 에서 불러온 값을 프로세스 메모리에 보관합니다.
+    ttl(초)이 지나거나 invalidate() 가 호출되면 다음 조회 시 load() 로 다시 불러옵니다.
+    version_name 이 있으면 조회할 때마다 공유 캐시의 버전을 확인하므로,
+    다른 프로세스에서 invalidate() 한 것도 다음 조회에 반영됩니다.
+    """
+
+    version_name: str | None = None
+
+    def __init__(self, ttl: float = 60) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._value: T | None = None
+        self._version: int | None = None
+        self._expires_at = 0.0
+
+    def invalidate(self) -> None:
+        self._expires_at = 0.0
+        if self.version_name is not None:
+            bump_version(self.version_name)
+
+    def get(self) -> T:
+        version = None if self.version_name is None else get_version(self.version_name)
+        if self._is_fresh(version):
+            return self._value  # type: ignore
+        with self._lock:
+            if not self._is_fresh(version):
+                # 불러오는 도중 invalidate() 되면, 불러온 값은 이번 한 번만 사용합니다.
+                self._expires_at = time.monotonic() + self.ttl
+                expires_at = self._expires_at
+                self._value = self.load()
+                self._version = version
+                if self._expires_at != expires_at:
+                    self._expires_at = 0.0
+            return self._value  # type: ignore
+
+    def _is_fresh(self, version: int | None) -> bool:
+        return (
+            self._value is not None
+            and self._version == version
+            and time.monotonic() < self._expires_at
+        )
+
+    @abc.abstractmethod
+    def load(self) -> T:
+        ...
+
+
+class WeightedTagPool(ProcessLocalCache[list[tuple[Tag, int]]]):
+    """
+    스터디그룹에서 사용 중인 태그들을 사용 횟수와 함께 보관합니다.
+    """
+
+    version_name = "tag-pool"
+
+    def sample(self, count: int) -> list[Tag]:
+        """
+        사용 횟수에 비례하는 확률로, 중복 없이 count 개의 태그를 뽑습니다.
+        (Efraimidis-Spirakis 가중치 비복원 추출)
+        """
+        return [
+            tag
+            for _, tag in heapq.nlargest(
+                count,
+                ((random.random() ** (1 / usage), tag) for tag, usage in self.get()),
+                key=lambda item: item[0],
+            )
+        ]
+
+    def load(self) -> list[tuple[Tag, int]]:
+        return [
+            (tag, tag.usage)  # type: ignore
+            for tag in Tag.objects.annotate(usage=Count("studygroups")).filter(
+                usage__gt=0
+            )
+        ]
+
+
+class CategoryCatalogue(ProcessLocalCache[list[Category]]):
+    """
+    전체 카테고리 목록을 보관합니다.
+    """
+
+    version_name = "category-catalogue"
+
+    def load(self) -> list[Category]:
+        return list(Category.objects.order_by("pk"))
+
+
+tag_pool = WeightedTagPool()
+category_catalogue = CategoryCatalogue()
+
+
+STUDIES_VERSION = "studies"
+
+
+def get_version(name: str) -> int:
+    """
+    name 에 해당하는 버전을 반환합니다. 버전이 바뀌면 이전 버전으로 캐시된 값은 더 이상 사용되지 않습니다.
+    캐시에서 버전이 사라져도 이전 버전을 다시 쓰지 않도록, 현재 시각(ms)으로 초기화합니다.
+    """
+    key = f"studygroup:version:{name}"
+    cache.add(key, time.time_ns() // 1_000_000, None)
+    return cache.get(key) or 0
+
+
+def bump_version(name: str) -> None:
+    """
+    버전을 바로 올리고, 트랜잭션 안이라면 커밋된 뒤에 한 번 더 올립니다.
+    커밋 전에 다른 요청이 이전 데이터로 만든 값을 새 버전으로 캐시하더라도, 커밋 후에는 다시 만들게 됩니다.
+    """
+    _incr_version(name)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _incr_version(name))
+
+
+def _incr_version(name: str) -> None:
+    try:
+        cache.incr(f"studygroup:version:{name}")
+    except ValueError:
+        get_version(name)
+
+
+def get_studies_version() -> int:
+    """
+    스터디그룹 목록의 버전을 반환합니다.
+    """
+    return get_version(STUDIES_VERSION)
+
+
+def bump_studies_version() -> None:
+    bump_version(STUDIES_VERSION)
+
+
+def get_studygroup_version(studygroup_id: Any) -> int:
+    """
+    스터디그룹 상세 정보 중, 스터디그룹 row 밖에 있는 정보(리더와 리더의 프로필, 태그, 카테고리)의 버전입니다.
+    """
+    return get_version(f"detail:{studygroup_id}")
+
+
+def bump_studygroup_versions(studygroup_ids: Iterable[Any]) -> None:
+    for studygroup_id in set(studygroup_ids):
+        bump_version(f"detail:{studygroup_id}")
+
+
+class VersionedResponseCache:
+    """
+    스터디그룹 목록 버전과 정규화된 querystring 으로 응답 데이터를 캐시합니다.
+    같은 키의 캐시가 비어 있을 때 동시에 요청이 몰려도, 프로세스마다 한 번만 응답을 만듭니다. (single-flight)
+    적중(hit)/실패(miss) 횟수는 프로세스 메모리에 모았다가 stats_flush_every 번마다 캐시에 더하며,
+    stats() 로 확인할 수 있습니다. 요청마다 캐시 서버에 쓰지 않기 위해서입니다.
+    """
+
+    lock_count = 64
+    stats_flush_every = 100
+
+    def __init__(self, prefix: str, timeout: int = 60) -> None:
+        self.prefix = prefix
+        self.timeout = timeout
+        self._locks = [threading.Lock() for _ in range(self.lock_count)]
+        self._stats_lock = threading.Lock()
+        self._pending_stats = {"hit": 0, "miss": 0}
+
+    def make_key(self, host: str, query_params: QueryDict) -> str:
+        normalized = "&".join(
+            f"{key}={value}"
+            for key in sorted(query_params)
+            for value in sorted(query_params.getlist(key))
+        )
+        digest = hashlib.md5(f"{host}?{normalized}".encode()).hexdigest()
+        return f"{self.prefix}:{get_studies_version()}:{digest}"
+
+    def get_or_build(self, key: str, build: Callable[[], Any]) -> tuple[Any, bool]:
+        """
+        캐시된 데이터와 적중 여부를 반환합니다.
+        """
+        data = cache.get(key)
+        if data is None:
+            with self._locks[hash(key) % self.lock_count]:
+                data = cache.get(key)
+                if data is None:
+                    data = build()
+                    cache.set(key, data, self.timeout)
+                    self._count("miss")
+                    return data, False
+        self._count("hit")
+        return data, True
+
+    def stats(self) -> dict[str, int]:
+        """
+        캐시에 더해진 횟수와, 이 프로세스에서 아직 더하지 않은 횟수를 합쳐 반환합니다.
+        다른 프로세스의 횟수는 stats_flush_every 번마다 반영됩니다.
+        """
+        with self._stats_lock:
+            pending = dict(self._pending_stats)
+        return {
+            name: cache.get(self._stats_key(name), 0) + count
+            for name, count in pending.items()
+        }
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self._pending_stats = {"hit": 0, "miss": 0}
+        cache.delete_many([self._stats_key(name) for name in ("hit", "miss")])
+
+    def _stats_key(self, name: str) -> str:
+        return f"{self.prefix}:stats:{name}"
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self._pending_stats[name] += 1
+            if sum(self._pending_stats.values()) < self.stats_flush_every:
+                return
+            pending, self._pending_stats = self._pending_stats, {"hit": 0, "miss": 0}
+        for stat, count in pending.items():
+            if not count:
+                continue
+            cache.add(self._stats_key(stat), 0, None)
+            try:
+                cache.incr(self._stats_key(stat), count)
+            except ValueError:
+                pass
+
+
+studygroup_list_cache = VersionedResponseCache("studygroup:list")
+
+
+class MembershipCache:
+    """
+    스터디그룹 uuid -> pk, (스터디그룹 uuid, 유저 pk) -> 멤버 정보를 캐시합니다.
+    공유 캐시(운영 환경은 Redis) 앞에 프로세스 메모리 LRU 를 둡니다.
+    LRU 에 있는 동안(local.ttl, 5초)은 캐시 서버도 거치지 않고, 그 뒤에는 공유 캐시에서 읽으므로
+    timeout(300초) 동안은 DB 를 조회하지 않습니다.
+    멤버 정보가 바뀌면 signal 에서 invalidate 하며, 다른 프로세스의 LRU 에는 최대 local.ttl 초 동안 이전 값이 남습니다.
+    Django 캐시가 프로세스마다 따로인 캐시(LocMemCache)라면 invalidate 가 다른 프로세스에 전달되지 않아,
+    이전 값이 최대 timeout 초 동안 남습니다.
+    """
+
+    def __init__(self, timeout: int = 300) -> None:
+        self.timeout = timeout
+        self.local = LocalLRUCache(maxsize=2048, ttl=5)
+
+    @staticmethod
+    def studygroup_key(studygroup_uuid: Any) -> str:
+        return f"studygroup:pk:{studygroup_uuid}"
+
+    @staticmethod
+    def role_key(studygroup_uuid: Any, user_id: Any) -> str:
+        return f"studygroup:role:{studygroup_uuid}:{user_id}"
+
+    def get(self, key: str) -> Any:
+        value = self.local.get(key)
+        if value is MISSING:
+            value = cache.get(key, MISSING)
+            if value is not MISSING:
+                self.local.set(key, value)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        cache.set(key, value, self.timeout)
+        self.local.set(key, value)
+
+    def invalidate(self, key: str) -> None:
+        """
+        바로 지우고, 트랜잭션이 커밋된 뒤에 한 번 더 지웁니다.
+        커밋 전에 다른 요청이 이전 값을 다시 캐시하더라도, 커밋 후에는 새 값을 읽게 됩니다.
+        """
+        cache.delete(key)
+        self.local.delete(key)
+        transaction.on_commit(lambda: (cache.delete(key), self.local.delete(key)))
+
+
+membership_cache = MembershipCache()
+
+
+class MyStudyGroupCountsCache:
+    """
+    유저별로 나와 관련된 스터디그룹 수를 캐시합니다.
+    스터디그룹 목록 버전과 날짜가 같을 때만 사용하므로, 스터디그룹 정보가 바뀌거나 날짜가 바뀌면 다시 계산합니다.
+    유저와 스터디그룹의 관계가 바뀌면 signal 에서 invalidate 합니다.
+    Django 캐시는 프로세스들이 공유하는 캐시여야 합니다. (운영 환경은 Redis)
+    """
+
+    def __init__(self, timeout: int = 60) -> None:
+        self.timeout = timeout
+
+    @staticmethod
+    def make_key(user_id: Any) -> str:
+        return f"studygroup:my-counts:{user_id}"
+
+    def get_or_build(
+        self, user_id: Any, build: Callable[[], dict[str, int]]
+    ) -> dict[str, int]:
+        key = self.make_key(user_id)
+        version = (get_studies_version(), date.today().isoformat())
+        cached = cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        counts = build()
+        cache.set(key, (version, counts), self.timeout)
+        return counts
+
+    def invalidate(self, user_id: Any) -> None:
+        """
+        바로 지우고, 트랜잭션이 커밋된 뒤에 한 번 더 지웁니다.
+        """
+        key = self.make_key(user_id)
+        cache.delete(key)
+        transaction.on_commit(lambda: cache.delete(key))
+
+
+my_studygroup_counts_cache = MyStudyGroupCountsCache()
@@ -0,0 +1,131 @@
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+from django.db.models import OuterRef, Subquery
+from django.http import Http404
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework.generics import get_object_or_404
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+from apps.studygroup.caches import MISSING, membership_cache
+from apps.studygroup.models import AssignmentSubmission, StudyGroup, StudyGroupMember
+
+
+@dataclass(frozen=True)
+class StudyGroupContext:
+    """
+    URL 의 studygroup_uuid 에 해당하는 스터디그룹과, 요청한 사용자의 멤버 정보입니다.
+    studygroup, member 인스턴스는 처음 사용할 때 조회합니다.
+    캐시된 값이 가리키는 스터디그룹이나 멤버가 그 사이에 삭제되었다면 404 에러를 반환합니다.
+    """
+
+    studygroup_id: int
+    member_id: int | None
+    is_leader: bool
+
+    @property
+    def is_member(self) -> bool:
+        return self.member_id is not None
+
+    @cached_property
+    def studygroup(self) -> StudyGroup:
+        return get_object_or_404(StudyGroup, pk=self.studygroup_id)
+
+    @cached_property
+    def member(self) -> StudyGroupMember | None:
+        if self.member_id is None:
+            return None
+        return get_object_or_404(StudyGroupMember, pk=self.member_id)
+
+
+def get_studygroup_context(request: Request, view: APIView) -> StudyGroupContext:
+    """
+    요청마다 한 번만 스터디그룹과 멤버 정보를 확인하고, request 에 저장해 재사용합니다.
+    권한 클래스, get_queryset, perform_create 등에서 같은 값을 사용합니다.
+    membership_cache 에 있으면 DB 를 조회하지 않고, 없으면 한 번의 쿼리로 조회해 캐시합니다.
+    스터디그룹이 없으면 404 에러를 반환합니다.
+    """
+    assert view.kwargs.get("studygroup_uuid") is not None, _(
+        f"{view.__class__.__name__} requires studygroup_uuid argument in view"
+    )
+    try:
+        studygroup_uuid = str(uuid.UUID(str(view.kwargs["studygroup_uuid"])))
+    except ValueError:
+        raise Http404
+    cached_uuid, context = getattr(request, "_studygroup_context", (None, None))
+    if context is not None and cached_uuid == studygroup_uuid:
+        return context
+
+    user_id = request.user.pk if request.user.is_authenticated else None
+    studygroup_key = membership_cache.studygroup_key(studygroup_uuid)
+    role_key = membership_cache.role_key(studygroup_uuid, user_id)
+    studygroup_id = membership_cache.get(studygroup_key)
+    role = membership_cache.get(role_key) if user_id is not None else None
+    if studygroup_id is MISSING or role is MISSING:
+        studygroup_id, role = _load_studygroup_role(studygroup_uuid, user_id)
+        membership_cache.set(studygroup_key, studygroup_id)
+        if user_id is not None:
+            membership_cache.set(role_key, role)
+
+    member_id, is_leader = role if role is not None else (None, False)
+    context = StudyGroupContext(
+        studygroup_id=studygroup_id, member_id=member_id, is_leader=is_leader
+    )
+    request._studygroup_context = (studygroup_uuid, context)  # type: ignore
+    return context
+
+
+def _load_studygroup_role(
+    studygroup_uuid: str, user_id: Any
+) -> tuple[int, tuple[int, bool] | None]:
+    """
+    스터디그룹 pk 와 사용자의 (멤버 pk, 리더 여부)를 한 번의 쿼리로 조회합니다.
+    """
+    queryset = StudyGroup.objects.filter(uuid=studygroup_uuid)
+    if user_id is None:
+        studygroup_id = queryset.values_list("pk", flat=True).first()
+        if studygroup_id is None:
+            raise Http404
+        return studygroup_id, None
+
+    members = StudyGroupMember.objects.filter(studygroup=OuterRef("pk"), user=user_id)
+    row = (
+        queryset.annotate(
+            member_id=Subquery(members.values("pk")[:1]),
+            member_is_leader=Subquery(members.values("is_leader")[:1]),
+        )
+        .values_list("pk", "member_id", "member_is_leader")
+        .first()
+    )
+    if row is None:
+        raise Http404
+    studygroup_id, member_id, is_leader = row
+    return studygroup_id, (member_id, bool(is_leader)) if member_id else None
+
+
+def get_assignment_submission(request: Request, view: APIView) -> AssignmentSubmission:
+    """
+    URL 의 submission_id 에 해당하는 과제 제출을 작성자(유저 포함)와 함께 한 번의 쿼리로 조회하고,
+    request 에 저장해 권한 클래스와 view 의 get_object 에서 재사용합니다.
+    URL 의 스터디그룹, 과제에 속하지 않은 과제 제출이면 404 에러를 반환합니다.
+    """
+    assert view.kwargs.get("submission_id") is not None, _(
+        f"{view.__class__.__name__} requires submission_id argument in view"
+    )
+    submission_id = str(view.kwargs["submission_id"])
+    cached_id, submission = getattr(request, "_assignment_submission", (None, None))
+    if submission is not None and cached_id == submission_id:
+        return submission
+
+    studygroup_id = get_studygroup_context(request, view).studygroup_id
+    submission = get_object_or_404(
+        AssignmentSubmission.objects.select_related("author__user"),
+        pk=submission_id,
+        studygroup_id=studygroup_id,
+        assignment_id=view.kwargs.get("assignment_id"),
+    )
+    request._assignment_submission = (submission_id, submission)  # type: ignore
+    return submission
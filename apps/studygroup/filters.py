@@ -1,12 +1,40 @@
 from typing import Any
 
-from django.db.models import Count, F, Q, QuerySet
+from django.db.models import Q, QuerySet
 from django.utils.datetime_safe import date
 from django.utils.translation import gettext_lazy as _
 from django_filters import rest_framework as filters
 from rest_framework.filters import OrderingFilter
 
 from apps.studygroup.models import Category, StudyGroup
+from apps.studygroup.models.member import Relationship
+from apps.studygroup.models.studygroup import StudyGroupQuerySet, recruiting_condition
+
+
+def my_studygroup_conditions() -> dict[str, tuple[str, Q]]:
+    """
+    MyStudyGroupFilter 의 filter 값마다, 사용자와 스터디그룹의 관계(relationship)와
+    스터디그룹이 만족해야 하는 조건입니다.
+    """
+    today = date.today()
+    return {
+        # 가입해 활동 중: 활동 시작일이 오늘보다 이전이고, 활동 종료일이 오늘보다 이후
+        "current": (
+            Relationship.MEMBER,
+            Q(start_date__lte=today, end_date__gte=today),
+        ),
+        # 가입 요청해서 승인 대기 중: 모집 마감일이 지나지 않고(마감일 당일 포함), 모집 인원이 남음
+        "requested": (
+            Relationship.REQUESTED,
+            recruiting_condition(),
+        ),
+        # 승인되었지만 아직 활동을 시작하지 않음: 활동 시작일이 오늘보다 이후
+        "approved": (Relationship.MEMBER, Q(start_date__gte=today)),
+        # 가입을 요청했지만 거절당함
+        "disapproved": (Relationship.DISAPPROVED, Q()),
+        # 리더
+        "as_leader": (Relationship.LEADER, Q()),
+    }
 
 
 class MyStudyGroupFilter(filters.FilterSet):  # type: ignore
@@ -41,79 +69,21 @@ class MyStudyGroupFilter(filters.FilterSet):  # type: ignore
     def filter_my_studygroup(
         self, queryset: QuerySet[StudyGroup], name: str, value: str
     ) -> QuerySet[StudyGroup]:
-        if value == "current":
-            return self._filter_current(queryset)
-        elif value == "requested":
-            return self._filter_requested(queryset)
-        elif value == "approved":
-            return self._filter_approved(queryset)
-        elif value == "disapproved":
-            return self._filter_disapproved(queryset)
-        elif value == "as_leader":
-            return self._filter_as_leader(queryset)
-        return queryset
-
-    def _filter_current(self, queryset: QuerySet[StudyGroup]) -> QuerySet[StudyGroup]:
-        """
-        현재 사용자가 가입해 활동 중인 스터디그룹들을 필터링합니다.
-        """
-        queryset = queryset.filter(
-            members__user__in=[self.request.user],
-            members__is_leader=False,
-            start_date__lte=date.today(),  # 활동 시작일이 오늘보다 이전
-            end_date__gte=date.today(),  # 활동 종료일이 오늘보다 이후
-        )
-        return queryset
-
-    def _filter_requested(self, queryset: QuerySet[StudyGroup]) -> QuerySet[StudyGroup]:
-        """
-        현재 사용자가 가입 요청해서 승인을 기다리고 있는 스터디그룹들을 필터링합니다.
-        모집 마감일이 지나지 않고, 모집 인원이 남아있어야 합니다.
-        """
-        queryset = queryset.annotate(
-            members_count=Count("members"),
-        ).filter(
-            requests__user__in=[self.request.user],
-            requests__processed=False,
-            requests__is_approved=False,
-            deadline__gt=date.today(),  # 모집 마감일이 지나지 않음
-            member_limit__gt=F("members_count"),  # 모집 인원이 남음
-        )
-        return queryset
-
-    def _filter_approved(self, queryset: QuerySet[StudyGroup]) -> QuerySet[StudyGroup]:
-        """
-        현재 사용자가 가입을 요청했고, 승인되었지만 아직 활동을 시작하지 않은 스터디그룹들을 필터링합니다.
-        """
-        queryset = queryset.filter(
-            members__user__in=[self.request.user],
-            members__is_leader=False,
-            start_date__gte=date.today(),  # 활동 시작일이 오늘보다 이후
-        )
-        return queryset
-
-    def _filter_disapproved(
-        self, queryset: QuerySet[StudyGroup]
-    ) -> QuerySet[StudyGroup]:
-        """
-        현재 사용자가 가입을 요청했지만, 거절당한 스터디그룹들을 필터링합니다.
         """
-        queryset = queryset.filter(
-            requests__user__in=[self.request.user],
-            requests__processed=True,
-            requests__is_approved=False,
+        현재 사용자와 관련된 스터디그룹들을 조회합니다.
+        StudyGroupUserRelation 의 (user, relationship, studygroup) 인덱스에서 시작해
+        스터디그룹을 JOIN 합니다.
+        유저-스터디그룹 쌍마다 관계는 하나이므로, JOIN 해도 중복된 스터디그룹이 나오지 않습니다.
+        (EXISTS 서브쿼리와의 비교는 benchmark_my_studies 커맨드로 측정할 수 있습니다.)
+        """
+        if value not in (conditions := my_studygroup_conditions()):
+            return queryset
+        relationship, condition = conditions[value]
+        return queryset.filter(
+            condition,
+            user_relations__user=self.request.user,
+            user_relations__relationship=relationship,
         )
-        return queryset
-
-    def _filter_as_leader(self, queryset: QuerySet[StudyGroup]) -> QuerySet[StudyGroup]:
-        """
-        현재 사용자가 리더인 스터디그룹들을 필터링합니다.
-        """
-        queryset = queryset.filter(
-            members__user__in=[self.request.user],
-            members__is_leader=True,
-        )
-        return queryset
 
     class Meta:
         model = StudyGroup
@@ -122,16 +92,21 @@ class MyStudyGroupFilter(filters.FilterSet):  # type: ignore
 
 class StudyGroupOrderingFilter(OrderingFilter):  # type: ignore
     additional_filters = ["random"]
-    fields_related = {"random": "?"}
+    fields_related = {"random": "random_key"}
     ordering_fields = ("created_at", "deadline", "random")
+    search_param = "search"
+    search_ordering = ["-search_rank", "-created_at"]
 
     def get_ordering(self, request, queryset, view):
         """
         OrderingFilter 의 get_ordering 메서드를 오버라이딩합니다.
         random 은 모델의 필드가 아니므로 rest_framework 의 기본 get_ordering 에서 처리할 수 없습니다.
         하여 random 쿼리스트링이 들어오면, fields_related 에서 해당하는 필드를 가져와서 처리합니다.
+        ordering 없이 검색어가 들어오면, 검색 결과를 일치한 토큰 수 순서로 정렬합니다.
         """
         params = request.query_params.get(self.ordering_param)
+        if not params and request.query_params.get(self.search_param):
+            return self.search_ordering
         if params:
             fields = [param.strip() for param in params.split(",")]
             valid_ordering_fields = [
@@ -146,8 +121,9 @@ class StudyGroupOrderingFilter(OrderingFilter):  # type: ignore
     def filter_queryset(self, request, queryset, view):
         ordering = self.get_ordering(request, queryset, view)
         if ordering:
-            if "random" in ordering:
-                return queryset.order_by("?")
+            if self.fields_related["random"] in ordering:
+                # random_key 가 같은 스터디그룹들의 순서를 고정하기 위해 pk 를 함께 사용합니다.
+                return queryset.order_by(self.fields_related["random"], "pk")
             return queryset.order_by(*ordering)
         return queryset
 
@@ -189,6 +165,14 @@ class StudyGroupListFilter(filters.FilterSet):  # type: ignore
             "스터디 이름 검색입니다. LIKE 검색을 지원합니다. ex) '스터디' 검색 시 '스터디그룹', '스터디' 등이 검색됩니다."
         ),
     )
+    search = filters.CharFilter(
+        label="search",
+        method="filter_search",
+        help_text=(
+            "제목, 스터디 이름, 태그, 카테고리 통합 검색입니다. 띄어쓰기 없이 쓰인 한글도 부분 검색이 됩니다. "
+            "ordering 을 지정하지 않으면 검색어와 많이 일치하는 순서로 정렬됩니다."
+        ),
+    )
     is_closed = filters.BooleanFilter(
         label="is_closed",
         method="filter_is_closed",
@@ -212,20 +196,26 @@ class StudyGroupListFilter(filters.FilterSet):  # type: ignore
         help_text="스터디그룹의 카테고리를 필터링합니다. ex) '개발' 검색 시, '개발' 카테고리가 포함된 스터디그룹을 보여줍니다.",
     )
 
+    @staticmethod
+    def filter_search(
+        queryset: StudyGroupQuerySet, name: str, value: str
+    ) -> StudyGroupQuerySet:
+        """
+        검색 색인(StudyGroupSearchToken)을 이용해 스터디그룹을 검색합니다.
+        """
+        return queryset.search(value)
+
     @staticmethod
     def filter_is_closed(
-        queryset: QuerySet[StudyGroup], name: str, value: bool
-    ) -> QuerySet[StudyGroup]:
+        queryset: StudyGroupQuerySet, name: str, value: bool
+    ) -> StudyGroupQuerySet:
         """
         모집 마감에 따라 스터디그룹을 필터링합니다.
         """
-        filtered_queryset = queryset.annotate(members_count=Count("members")).filter(
-            Q(deadline__lt=date.today()) | Q(members_count=F("member_limit"))
-        )
         if value is True:
-            return filtered_queryset
+            return queryset.closed()
         else:
-            return queryset.exclude(id__in=filtered_queryset)
+            return queryset.opened()
 
     class Meta:
         model = StudyGroup
@@ -0,0 +1,215 @@
+import random
+import statistics
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef, Q, QuerySet
+from django.utils.datetime_safe import date
+
+from apps.accounts.models import User
+from apps.studygroup.filters import MyStudyGroupFilter, my_studygroup_conditions
+from apps.studygroup.models import (
+    StudyGroup,
+    StudyGroupMember,
+    StudyGroupMemberRequest,
+    StudyGroupUserRelation,
+)
+from apps.studygroup.models.member import Relationship
+
+RELATIONSHIP_WEIGHTS = {
+    Relationship.MEMBER: 6,
+    Relationship.REQUESTED: 2,
+    Relationship.DISAPPROVED: 1,
+    Relationship.LEADER: 1,
+}
+
+
+def source_condition(relationship: str, user: User) -> Q:
+    """
+    관계 테이블 없이, 멤버, 가입 요청 테이블의 EXISTS 서브쿼리로 relationship 을 판단하는 조건입니다.
+    (relationship_of 와 같은 규칙입니다.)
+    """
+    members = StudyGroupMember.objects.filter(studygroup=OuterRef("pk"), user=user)
+    requests = StudyGroupMemberRequest.objects.filter(
+        studygroup=OuterRef("pk"), user=user
+    )
+    if relationship == Relationship.LEADER:
+        return Q(Exists(members.filter(is_leader=True)))
+    if relationship == Relationship.MEMBER:
+        return Q(Exists(members.filter(is_leader=False)))
+    if relationship == Relationship.REQUESTED:
+        return Q(Exists(requests.filter(processed=False))) & ~Q(Exists(members))
+    return Q(Exists(requests.filter(processed=True, is_approved=False))) & ~Q(
+        Exists(members)
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "임의의 스터디그룹, 유저, 멤버, 가입 요청 데이터를 만들어 "
+        "내 스터디그룹 목록(filter) 쿼리의 지연 시간을 측정합니다. "
+        "filter 값마다 관계 테이블 JOIN(현재 MyStudyGroupFilter), 관계 테이블 EXISTS, "
+        "멤버/가입 요청 테이블 EXISTS 방식의 p50/p95 를 출력합니다. "
+        "DEBUG=True 인 환경에서만 실행되며, 만든 데이터는 항상 롤백됩니다. "
+        "운영 DB 엔진(Oracle)과 같은 엔진에서 측정한 결과로만 방식을 비교하세요."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--studies", type=int, default=100_000)
+        parser.add_argument("--memberships", type=int, default=1_000_000)
+        parser.add_argument("--users", type=int, default=10_000)
+        parser.add_argument(
+            "--repeat", type=int, default=20, help="filter 값마다 측정할 유저 수입니다."
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번의 INSERT 로 저장할 행 수, 한 번에 만들 스터디그룹 수입니다.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if not settings.DEBUG:
+            raise CommandError("benchmark_my_studies 는 DEBUG=True 인 환경에서만 실행할 수 있습니다.")
+        random.seed(options["seed"])
+        with transaction.atomic():
+            try:
+                users = self.seed(options)
+                self.benchmark(random.sample(users, min(options["repeat"], len(users))))
+            finally:
+                # 측정이 끝나거나 실패하면, 만든 데이터는 모두 롤백합니다.
+                transaction.set_rollback(True)
+
+    def seed(self, options: dict[str, Any]) -> list[User]:
+        """
+        유저, 스터디그룹, 멤버, 가입 요청을 만들고, 관계와 인원 수는 모델의 재계산 함수로 채웁니다.
+        """
+        batch_size = options["batch_size"]
+        started = time.perf_counter()
+        prefix = f"bench-{time.time_ns()}"
+        users = User.objects.bulk_create(
+            [
+                User(email=f"{prefix}-{i}@bench.local", username=f"{prefix}-{i}")
+                for i in range(options["users"])
+            ],
+            batch_size=batch_size,
+        )
+        per_studygroup = min(
+            len(users), max(1, options["memberships"] // max(1, options["studies"]))
+        )
+        relationships = list(RELATIONSHIP_WEIGHTS)
+        weights = list(RELATIONSHIP_WEIGHTS.values())
+        today = date.today()
+        counts = dict.fromkeys(["members", "requests", "relations"], 0)
+        for offset in range(0, options["studies"], batch_size):
+            studygroups = []
+            for i in range(offset, min(offset + batch_size, options["studies"])):
+                start_date = today + timedelta(days=random.randint(-60, 60))
+                studygroups.append(
+                    StudyGroup(
+                        name=f"{prefix}-{i}",
+                        title=f"{prefix}-{i}",
+                        content="",
+                        member_limit=per_studygroup,
+                        deadline=start_date - timedelta(days=7),
+                        start_date=start_date,
+                        end_date=start_date + timedelta(days=random.randint(7, 90)),
+                    )
+                )
+            studygroups = StudyGroup.objects.bulk_create(studygroups)
+            members, requests = [], []
+            for studygroup in studygroups:
+                for user in random.sample(users, per_studygroup):
+                    relationship = random.choices(relationships, weights)[0]
+                    if relationship in (Relationship.LEADER, Relationship.MEMBER):
+                        members.append(
+                            StudyGroupMember(
+                                user=user,
+                                studygroup=studygroup,
+                                is_leader=relationship == Relationship.LEADER,
+                            )
+                        )
+                    if relationship != Relationship.LEADER:
+                        requests.append(
+                            StudyGroupMemberRequest(
+                                user=user,
+                                studygroup=studygroup,
+                                request_message="benchmark",
+                                processed=relationship != Relationship.REQUESTED,
+                                is_approved=relationship == Relationship.MEMBER,
+                            )
+                        )
+            StudyGroupMember.objects.bulk_create(members, batch_size=batch_size)
+            StudyGroupMemberRequest.objects.bulk_create(requests, batch_size=batch_size)
+
+            studygroup_ids = [studygroup.pk for studygroup in studygroups]
+            relations = StudyGroupUserRelation.objects.build_relations(
+                StudyGroupMember.objects.filter(studygroup_id__in=studygroup_ids),
+                StudyGroupMemberRequest.objects.filter(
+                    studygroup_id__in=studygroup_ids
+                ),
+            )
+            StudyGroupUserRelation.objects.bulk_create(relations, batch_size=batch_size)
+            StudyGroup.objects.filter(pk__in=studygroup_ids).rebuild_member_counts()
+            counts["members"] += len(members)
+            counts["requests"] += len(requests)
+            counts["relations"] += len(relations)
+        self.stdout.write(
+            f"seeded users={len(users)} studies={options['studies']} "
+            f"members={counts['members']} requests={counts['requests']} "
+            f"relations={counts['relations']} in {time.perf_counter() - started:.1f}s"
+        )
+        return users
+
+    def benchmark(self, users: list[User]) -> None:
+        page_size = 8
+        self.stdout.write(f"engine={connection.vendor}")
+        self.stdout.write(f"{'filter':<12} {'method':<7} {'p50(ms)':>9} {'p95(ms)':>9}")
+        for name, (relationship, condition) in my_studygroup_conditions().items():
+
+            def join(user: User) -> QuerySet[StudyGroup]:
+                return MyStudyGroupFilter(
+                    data={"filter": name},
+                    queryset=StudyGroup.objects.all(),
+                    request=SimpleNamespace(user=user),
+                ).qs
+
+            def exists(user: User) -> QuerySet[StudyGroup]:
+                relations = StudyGroupUserRelation.objects.filter(
+                    studygroup=OuterRef("pk"), user=user, relationship=relationship
+                )
+                return StudyGroup.objects.filter(Exists(relations), condition)
+
+            def source(user: User) -> QuerySet[StudyGroup]:
+                return StudyGroup.objects.filter(
+                    source_condition(relationship, user), condition
+                )
+
+            methods: dict[str, Callable[[User], QuerySet[StudyGroup]]] = {
+                "join": join,
+                "exists": exists,
+                "source": source,
+            }
+            pages: dict[str, list[list[Any]]] = {}
+            for method, build in methods.items():
+                latencies = []
+                for user in users:
+                    queryset = build(user).order_by("-created_at", "-pk")
+                    started = time.perf_counter()
+                    page = list(queryset.values_list("pk", flat=True)[: page_size + 1])
+                    latencies.append((time.perf_counter() - started) * 1000)
+                    pages.setdefault(method, []).append(page)
+                latencies.sort()
+                p95 = latencies[max(0, round(len(latencies) * 0.95) - 1)]
+                self.stdout.write(
+                    f"{name:<12} {method:<7} "
+                    f"{statistics.median(latencies):>9.2f} {p95:>9.2f}"
+                )
+            if any(result != pages["join"] for result in pages.values()):
+                self.stderr.write(f"{name}: 방식마다 조회된 스터디그룹이 다릅니다.")
@@ -0,0 +1,15 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from apps.studygroup.caches import bump_studies_version
+from apps.studygroup.models import StudyGroup
+
+
+class Command(BaseCommand):
+    help = "모집 마감일이 지난 스터디그룹들의 저장된 모집 상태를 마감으로 변경합니다."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        closed = StudyGroup.objects.close_expired()
+        bump_studies_version()
+        self.stdout.write(self.style.SUCCESS(f"{closed}개 스터디그룹의 모집을 마감했습니다."))
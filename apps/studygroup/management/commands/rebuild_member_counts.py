@@ -0,0 +1,32 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+
+from apps.studygroup.caches import bump_studies_version
+from apps.studygroup.models import StudyGroup
+
+
+class Command(BaseCommand):
+    help = "스터디그룹에 저장된 인원 수(member_count)와 모집 상태를 실제 멤버 수로 다시 계산합니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번의 UPDATE 로 갱신할 스터디그룹 수입니다.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size = options["batch_size"]
+        pks = list(StudyGroup.objects.order_by("pk").values_list("pk", flat=True))
+        updated = 0
+        for start in range(0, len(pks), batch_size):
+            batch = pks[start : start + batch_size]
+            with transaction.atomic():
+                updated += StudyGroup.objects.filter(
+                    pk__range=(batch[0], batch[-1])
+                ).rebuild_member_counts()
+        bump_studies_version()
+        self.stdout.write(self.style.SUCCESS(f"{updated}개 스터디그룹의 인원 수를 다시 계산했습니다."))
@@ -0,0 +1,17 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from apps.studygroup.models import StudyGroup, StudyGroupSearchToken
+
+
+class Command(BaseCommand):
+    help = "모든 스터디그룹의 검색 색인(StudyGroupSearchToken)을 다시 만듭니다."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        studygroups = StudyGroup.objects.only("pk", "title", "name")
+        count = 0
+        for studygroup in studygroups.iterator():
+            StudyGroupSearchToken.objects.rebuild_for(studygroup)
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f"{count}개 스터디그룹의 검색 색인을 다시 만들었습니다."))
@@ -0,0 +1,24 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.studygroup.caches import bump_studies_version
+from apps.studygroup.models import StudyGroupUserRelation
+
+
+class Command(BaseCommand):
+    help = "멤버, 가입 요청 테이블로부터 유저와 스터디그룹의 관계(StudyGroupUserRelation)를 모두 다시 만듭니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번의 INSERT 로 저장할 관계 수입니다.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        count = StudyGroupUserRelation.objects.rebuild(batch_size=options["batch_size"])
+        # rebuild 는 signal 없이 지우고 만들므로, 캐시된 유저별 스터디그룹 수를 모두 다시 계산하게 합니다.
+        bump_studies_version()
+        self.stdout.write(self.style.SUCCESS(f"{count}개의 관계를 다시 만들었습니다."))
@@ -0,0 +1,27 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.studygroup.caches import get_studies_version, studygroup_list_cache
+
+
+class Command(BaseCommand):
+    help = "스터디그룹 목록 응답 캐시의 적중(hit)/실패(miss) 횟수를 출력합니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="출력한 뒤 적중/실패 횟수를 초기화합니다.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        stats = studygroup_list_cache.stats()
+        total = stats["hit"] + stats["miss"]
+        hit_ratio = stats["hit"] / total * 100 if total else 0
+        self.stdout.write(
+            f"version={get_studies_version()} hit={stats['hit']} "
+            f"miss={stats['miss']} hit_ratio={hit_ratio:.1f}%"
+        )
+        if options["reset"]:
+            studygroup_list_cache.reset_stats()
@@ -0,0 +1,51 @@
+from typing import Any, Iterable
+
+from apps.studygroup.caches import (
+    bump_studies_version,
+    bump_studygroup_versions,
+    membership_cache,
+    my_studygroup_counts_cache,
+)
+from apps.studygroup.models import StudyGroup, StudyGroupUserRelation
+
+
+def sync_membership(
+    studygroup_id: Any,
+    user_ids: Iterable[Any],
+    member_delta: int = 0,
+    members_changed: bool = True,
+    refresh_relations: bool = True,
+    studygroup_uuid: Any = None,
+) -> None:
+    """
+    스터디그룹의 멤버, 가입 요청이 바뀐 뒤 함께 바뀌어야 하는 값들을 갱신합니다.
+    signal 과, signal 이 발생하지 않는 bulk 연산 모두 이 함수를 사용하므로, 새 부수 효과는 여기에 추가합니다.
+
+    - member_delta: 스터디그룹 인원 수를 F() 로 변경하고, 모집 상태를 다시 계산합니다.
+    - members_changed: 목록, 상세 버전을 올리고 유저들의 캐시된 멤버 정보를 지웁니다.
+    - refresh_relations: 유저들과 스터디그룹의 관계를 다시 계산하고, 캐시된 유저의 스터디그룹 수를 지웁니다.
+    """
+    user_ids = set(user_ids)
+    if member_delta:
+        StudyGroup.objects.filter(pk=studygroup_id).add_member_count(member_delta)
+    if members_changed:
+        bump_studies_version()
+        bump_studygroup_versions([studygroup_id])
+        if studygroup_uuid is None:
+            studygroup_uuid = (
+                StudyGroup.objects.filter(pk=studygroup_id)
+                .values_list("uuid", flat=True)
+                .first()
+            )
+        if studygroup_uuid is not None:
+            for user_id in user_ids:
+                membership_cache.invalidate(
+                    membership_cache.role_key(studygroup_uuid, user_id)
+                )
+    if refresh_relations and user_ids:
+        if len(user_ids) == 1:
+            StudyGroupUserRelation.objects.refresh_for(*user_ids, studygroup_id)
+        else:
+            StudyGroupUserRelation.objects.refresh_many(user_ids, studygroup_id)
+        for user_id in user_ids:
+            my_studygroup_counts_cache.invalidate(user_id)
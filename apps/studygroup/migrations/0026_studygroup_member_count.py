@@ -0,0 +1,33 @@
+# Generated by Django 4.2.11 on 2026-10-18 08:30
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_member_count(apps, schema_editor):
+    StudyGroup = apps.get_model("studygroup", "StudyGroup")
+    StudyGroupMember = apps.get_model("studygroup", "StudyGroupMember")
+    member_count = (
+        StudyGroupMember.objects.filter(studygroup=OuterRef("pk"))
+        .order_by()
+        .values("studygroup")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    StudyGroup.objects.update(member_count=Coalesce(Subquery(member_count), 0))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("studygroup", "0025_alter_studygroupmemberrequest_request_message"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="studygroup",
+            name="member_count",
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_member_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2.11 on 2026-10-18 08:32
+
+from django.db import migrations, models
+from django.db.models import Case, F, Q, Value, When
+from django.utils.datetime_safe import date
+
+
+def fill_recruitment_status(apps, schema_editor):
+    StudyGroup = apps.get_model("studygroup", "StudyGroup")
+    StudyGroup.objects.update(
+        recruitment_status=Case(
+            When(
+                Q(deadline__lt=date.today()) | Q(member_limit__lte=F("member_count")),
+                then=Value("closed"),
+            ),
+            default=Value("open"),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("studygroup", "0026_studygroup_member_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="studygroup",
+            name="recruitment_status",
+            field=models.CharField(
+                choices=[("open", "Open"), ("closed", "Closed")],
+                default="open",
+                editable=False,
+                max_length=10,
+            ),
+        ),
+        migrations.RunPython(fill_recruitment_status, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="studygroup",
+            index=models.Index(
+                fields=["recruitment_status", "-created_at"],
+                name="studygroup_status_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="studygroup",
+            index=models.Index(
+                fields=["recruitment_status", "deadline"],
+                name="studygroup_status_deadline_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,100 @@
+# Generated by Django 4.2.11 on 2026-10-18 08:34
+
+import re
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def tokenize(text):
+    """
+    이 마이그레이션 시점의 토크나이저입니다. (단어별 bigram, 한 글자 단어는 그 글자)
+    """
+    tokens = set()
+    for word in re.findall(r"\w+", unicodedata.normalize("NFKC", text).lower()):
+        if len(word) == 1:
+            tokens.add(word)
+        tokens.update(word[i : i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def fill_search_tokens(apps, schema_editor):
+    StudyGroup = apps.get_model("studygroup", "StudyGroup")
+    StudyGroupSearchToken = apps.get_model("studygroup", "StudyGroupSearchToken")
+    for studygroup in StudyGroup.objects.prefetch_related("tags", "categories"):
+        texts = {
+            "title": [studygroup.title],
+            "name": [studygroup.name],
+            "tag": [tag.name for tag in studygroup.tags.all()],
+            "category": [category.name for category in studygroup.categories.all()],
+        }
+        StudyGroupSearchToken.objects.bulk_create(
+            [
+                StudyGroupSearchToken(token=token, studygroup=studygroup, source=source)
+                for source, values in texts.items()
+                for token in set().union(*map(tokenize, values))
+            ]
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("studygroup", "0027_studygroup_recruitment_status"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StudyGroupSearchToken",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("token", models.CharField(max_length=2)),
+                (
+                    "source",
+                    models.CharField(
+                        choices=[
+                            ("title", "Title"),
+                            ("name", "Name"),
+                            ("tag", "Tag"),
+                            ("category", "Category"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "studygroup",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_tokens",
+                        to="studygroup.studygroup",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "StudyGroup Search Token",
+                "verbose_name_plural": "StudyGroup Search Tokens",
+                "indexes": [
+                    models.Index(
+                        fields=["studygroup", "source"],
+                        name="search_token_studygroup_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="studygroupsearchtoken",
+            constraint=models.UniqueConstraint(
+                fields=("token", "studygroup", "source"),
+                name="unique_studygroup_search_token",
+            ),
+        ),
+        migrations.RunPython(fill_search_tokens, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 4.2.11 on 2026-10-18 08:35
+
+import random
+
+from django.db import migrations, models
+
+import apps.studygroup.models.studygroup
+
+
+def fill_random_key(apps, schema_editor):
+    """
+    AddField 의 default 는 한 번만 계산되므로, 기존 스터디그룹마다 랜덤 키를 다시 부여합니다.
+    """
+    StudyGroup = apps.get_model("studygroup", "StudyGroup")
+    studygroups = list(StudyGroup.objects.only("pk"))
+    for studygroup in studygroups:
+        studygroup.random_key = random.randint(0, 2**31 - 1)
+    StudyGroup.objects.bulk_update(studygroups, ["random_key"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("studygroup", "0028_studygroupsearchtoken"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="studygroup",
+            name="random_key",
+            field=models.PositiveIntegerField(
+                default=apps.studygroup.models.studygroup.generate_random_key,
+                editable=False,
+            ),
+        ),
+        migrations.RunPython(fill_random_key, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="studygroup",
+            index=models.Index(
+                fields=["random_key", "id"], name="studygroup_random_key_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.11 on 2026-10-18 08:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("studygroup", "0029_studygroup_random_key"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="assignmentrequest",
+            index=models.Index(
+                fields=["studygroup", "-created_at", "-id"],
+                name="assignment_sg_created_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="studygroup",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="studygroup_created_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="studygroup",
+            index=models.Index(
+                fields=["deadline", "id"], name="studygroup_deadline_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,130 @@
+# Generated by Django 4.2.11 on 2026-10-18 09:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def relationship_of(is_leader, request_statuses):
+    """
+    이 마이그레이션 시점의 관계 계산입니다.
+    """
+    if is_leader is not None:
+        return "leader" if is_leader else "member"
+    request_statuses = list(request_statuses)
+    if any(not processed for processed, is_approved in request_statuses):
+        return "requested"
+    if any(not is_approved for processed, is_approved in request_statuses):
+        return "disapproved"
+    return None
+
+
+def fill_user_relations(apps, schema_editor):
+    StudyGroupMember = apps.get_model("studygroup", "StudyGroupMember")
+    StudyGroupMemberRequest = apps.get_model("studygroup", "StudyGroupMemberRequest")
+    StudyGroupUserRelation = apps.get_model("studygroup", "StudyGroupUserRelation")
+    is_leader_of = {
+        (user_id, studygroup_id): is_leader
+        for user_id, studygroup_id, is_leader in StudyGroupMember.objects.values_list(
+            "user_id", "studygroup_id", "is_leader"
+        )
+    }
+    request_statuses_of = {}
+    for (
+        user_id,
+        studygroup_id,
+        processed,
+        is_approved,
+    ) in StudyGroupMemberRequest.objects.values_list(
+        "user_id", "studygroup_id", "processed", "is_approved"
+    ):
+        request_statuses_of.setdefault((user_id, studygroup_id), []).append(
+            (processed, is_approved)
+        )
+    relations = []
+    for user_id, studygroup_id in is_leader_of.keys() | request_statuses_of.keys():
+        relationship = relationship_of(
+            is_leader_of.get((user_id, studygroup_id)),
+            request_statuses_of.get((user_id, studygroup_id), []),
+        )
+        if relationship is not None:
+            relations.append(
+                StudyGroupUserRelation(
+                    user_id=user_id,
+                    studygroup_id=studygroup_id,
+                    relationship=relationship,
+                )
+            )
+    StudyGroupUserRelation.objects.bulk_create(relations, batch_size=1000)
+
+
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("studygroup", "0030_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StudyGroupUserRelation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "relationship",
+                    models.CharField(
+                        choices=[
+                            ("leader", "Leader"),
+                            ("member", "Member"),
+                            ("requested", "Requested"),
+                            ("disapproved", "Disapproved"),
+                        ],
+                        max_length=11,
+                    ),
+                ),
+                (
+                    "studygroup",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="user_relations",
+                        to="studygroup.studygroup",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="studygroup_relations",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "StudyGroup User Relation",
+                "verbose_name_plural": "StudyGroup User Relations",
+                "indexes": [
+                    models.Index(
+                        fields=["user", "relationship"], name="user_relation_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="studygroupuserrelation",
+            constraint=models.UniqueConstraint(
+                fields=("user", "studygroup"), name="unique_user_relation"
+            ),
+        ),
+        migrations.RunPython(fill_user_relations, migrations.RunPython.noop),
+    ]
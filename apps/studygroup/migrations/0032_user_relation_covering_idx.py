@@ -0,0 +1,22 @@
+# Generated by Django 4.2.11 on 2026-10-18 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("studygroup", "0031_studygroupuserrelation"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="studygroupuserrelation",
+            name="user_relation_idx",
+        ),
+        migrations.AddIndex(
+            model_name="studygroupuserrelation",
+            index=models.Index(
+                fields=["user", "relationship", "studygroup"], name="user_relation_idx"
+            ),
+        ),
+    ]
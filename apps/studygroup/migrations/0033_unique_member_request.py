@@ -0,0 +1,40 @@
+# Generated by Django 4.2.11 on 2026-10-18 09:08
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def remove_duplicate_requests(apps, schema_editor):
+    """
+    (user, studygroup) 마다 가입 요청을 하나만 남깁니다.
+    처리되지 않은 요청, 거절된 요청, 승인된 요청 순서로, 같으면 최근 요청을 남기므로
+    유저와 스터디그룹의 관계(StudyGroupUserRelation)는 바뀌지 않습니다.
+    """
+    StudyGroupMemberRequest = apps.get_model("studygroup", "StudyGroupMemberRequest")
+    duplicates = (
+        StudyGroupMemberRequest.objects.values("user_id", "studygroup_id")
+        .annotate(request_count=Count("id"))
+        .filter(request_count__gt=1)
+    )
+    for duplicate in duplicates.iterator():
+        requests = StudyGroupMemberRequest.objects.filter(
+            user_id=duplicate["user_id"], studygroup_id=duplicate["studygroup_id"]
+        )
+        keep = requests.order_by("processed", "is_approved", "-pk").first()
+        requests.exclude(pk=keep.pk).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("studygroup", "0032_user_relation_covering_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_requests, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="studygroupmemberrequest",
+            constraint=models.UniqueConstraint(
+                fields=("user", "studygroup"), name="unique_member_request"
+            ),
+        ),
+    ]
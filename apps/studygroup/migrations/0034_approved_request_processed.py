@@ -0,0 +1,32 @@
+# Generated by Django 4.2.11 on 2026-10-18 09:31
+
+from django.db import migrations, models
+
+
+def process_approved_requests(apps, schema_editor):
+    """
+    승인되었지만 처리되지 않은 것으로 남아 있는 요청은 처리된 것으로 바꿉니다.
+    """
+    StudyGroupMemberRequest = apps.get_model("studygroup", "StudyGroupMemberRequest")
+    StudyGroupMemberRequest.objects.filter(is_approved=True, processed=False).update(
+        processed=True
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("studygroup", "0033_unique_member_request"),
+    ]
+
+    operations = [
+        migrations.RunPython(process_approved_requests, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="studygroupmemberrequest",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    ("processed", True), ("is_approved", False), _connector="OR"
+                ),
+                name="approved_request_processed",
+            ),
+        ),
+    ]
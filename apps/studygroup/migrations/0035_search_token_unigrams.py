@@ -0,0 +1,50 @@
+# Generated by Django 4.2.11 on 2026-10-18 10:05
+
+import re
+import unicodedata
+
+from django.db import migrations
+
+
+def tokenize(text):
+    """
+    이 마이그레이션 시점의 토크나이저입니다. (단어별 unigram, bigram)
+    """
+    tokens = set()
+    for word in re.findall(r"\w+", unicodedata.normalize("NFKC", text).lower()):
+        tokens.update(word)
+        tokens.update(word[i : i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def rebuild_search_tokens(apps, schema_editor):
+    """
+    한 글자 검색어로도 찾을 수 있도록, 모든 스터디그룹의 검색 토큰을 글자 단위 토큰을 포함해 다시 만듭니다.
+    """
+    StudyGroup = apps.get_model("studygroup", "StudyGroup")
+    StudyGroupSearchToken = apps.get_model("studygroup", "StudyGroupSearchToken")
+    StudyGroupSearchToken.objects.all().delete()
+    for studygroup in StudyGroup.objects.prefetch_related("tags", "categories"):
+        texts = {
+            "title": [studygroup.title],
+            "name": [studygroup.name],
+            "tag": [tag.name for tag in studygroup.tags.all()],
+            "category": [category.name for category in studygroup.categories.all()],
+        }
+        StudyGroupSearchToken.objects.bulk_create(
+            [
+                StudyGroupSearchToken(token=token, studygroup=studygroup, source=source)
+                for source, values in texts.items()
+                for token in set().union(*map(tokenize, values))
+            ]
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("studygroup", "0034_approved_request_processed"),
+    ]
+
+    operations = [
+        migrations.RunPython(rebuild_search_tokens, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,11 @@
 from apps.studygroup.models.assignment import AssignmentRequest, AssignmentSubmission
 from apps.studygroup.models.category import Category
-from apps.studygroup.models.member import StudyGroupMember, StudyGroupMemberRequest
+from apps.studygroup.models.member import (
+    StudyGroupMember,
+    StudyGroupMemberRequest,
+    StudyGroupUserRelation,
+)
+from apps.studygroup.models.search import StudyGroupSearchToken
 from apps.studygroup.models.studygroup import StudyGroup
 from apps.studygroup.models.tag import Tag
 
@@ -10,6 +15,8 @@ __all__ = [
     "StudyGroup",
     "StudyGroupMember",
     "StudyGroupMemberRequest",
+    "StudyGroupUserRelation",
     "AssignmentRequest",
     "AssignmentSubmission",
+    "StudyGroupSearchToken",
 ]
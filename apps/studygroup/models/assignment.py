@@ -11,6 +11,12 @@ class AssignmentRequest(TimestampedModel):
         verbose_name = _("StudyGroup Assignment Request")
         verbose_name_plural = _("StudyGroup Assignment Requests")
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["studygroup", "-created_at", "-id"],
+                name="assignment_sg_created_id_idx",
+            ),
+        ]
 
     studygroup = models.ForeignKey(
         StudyGroup, on_delete=models.CASCADE, related_name="assignments"
@@ -1,20 +1,34 @@
 from django.db import models
+from django.db.models import Count, QuerySet
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 
+class CategoryQuerySet(QuerySet["Category"]):
+    def with_studygroups_count(self) -> "CategoryQuerySet":
+        """
+        카테고리별 스터디그룹 수를 하나의 GROUP BY 쿼리로 함께 조회합니다.
+        """
+        return self.annotate(studygroups_count=Count("studygroups"))
+
+
 class Category(models.Model):
     class Meta:
         verbose_name = _("Category")
         verbose_name_plural = _("Categories")
 
+    objects = CategoryQuerySet.as_manager()
+
     name = models.CharField(max_length=20, unique=True)
 
     @cached_property
     def related_studygroups_count(self) -> int:
         """
         연관된 스터디그룹 수를 반환합니다.
+        with_studygroups_count() 로 조회했다면, 추가 쿼리 없이 그 값을 사용합니다.
         """
+        if hasattr(self, "studygroups_count"):
+            return self.studygroups_count
         return self.studygroups.count()
 
     def __str__(self) -> str:
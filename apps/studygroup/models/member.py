@@ -1,7 +1,9 @@
-from typing import Any
+from typing import Any, Iterable
 
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
 
 from apps.accounts.models import User
 from apps.core.models import TimestampedModel
@@ -12,6 +14,17 @@ class StudyGroupMemberRequest(models.Model):
     스터디그룹 가입 요청 모델
     """
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "studygroup"], name="unique_member_request"
+            ),
+            models.CheckConstraint(
+                check=models.Q(processed=True) | models.Q(is_approved=False),
+                name="approved_request_processed",
+            ),
+        ]
+
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="studygroup_member_request"
     )
@@ -30,9 +43,68 @@ class StudyGroupMemberRequest(models.Model):
         if self.is_approved is True and self.processed is False:
             raise ValidationError("is_approved가 True이면 processed는 True여야 합니다.")
 
+    @classmethod
+    def from_db(
+        cls, db: str | None, field_names: Iterable[str], values: Iterable[Any]
+    ) -> "StudyGroupMemberRequest":
+        """
+        DB 에서 불러온 값을 기억해 두고, 저장할 때 바뀐 필드를 찾는 데 사용합니다.
+        """
+        field_names, values = list(field_names), list(values)
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))  # type: ignore
+        return instance
+
+    def get_changed_fields(self) -> set[str]:
+        """
+        DB 에서 불러온 뒤 바뀐 필드 이름들을 반환합니다. 새로 만드는 요청이면 모든 필드를 반환합니다.
+        """
+        fields = self._meta.concrete_fields
+        loaded_values = getattr(self, "_loaded_values", None)
+        if self._state.adding or loaded_values is None:
+            return {field.name for field in fields}
+        return {
+            field.name
+            for field in fields
+            if field.attname not in loaded_values
+            or getattr(self, field.attname) != loaded_values[field.attname]
+        }
+
     def save(self, *args: Any, **kwargs: Any) -> None:
-        self.full_clean()
+        """
+        바뀐 필드만 검증합니다.
+        외래 키, (user, studygroup) 중복, is_approved/processed 조합은 DB 제약조건이 막으므로,
+        저장 전에 따로 조회하지 않습니다. (clean() 은 쿼리 없이 오류 메시지를 만들기 위해 유지합니다.)
+        """
+        changed_fields = self.get_changed_fields()
+        self.full_clean(
+            exclude=[
+                field.name
+                for field in self._meta.concrete_fields
+                if field.name not in changed_fields or field.is_relation
+            ],
+            validate_unique=False,
+            validate_constraints=False,
+        )
         super().save(*args, **kwargs)
+        self._remember_values(field.attname for field in self._meta.concrete_fields)
+
+    def refresh_from_db(
+        self, using: str | None = None, fields: Iterable[str] | None = None
+    ) -> None:
+        super().refresh_from_db(using=using, fields=fields)
+        if fields is None:
+            fields = [field.attname for field in self._meta.concrete_fields]
+        self._remember_values(self._meta.get_field(name).attname for name in fields)
+
+    def _remember_values(self, attnames: Iterable[str]) -> None:
+        """
+        현재 값을 DB 에 저장된 값으로 기억합니다.
+        """
+        loaded_values = getattr(self, "_loaded_values", {})
+        for attname in attnames:
+            loaded_values[attname] = getattr(self, attname)
+        self._loaded_values = loaded_values  # type: ignore
 
 
 class StudyGroupMember(TimestampedModel):
@@ -57,3 +129,183 @@ class StudyGroupMember(TimestampedModel):
         if self.is_leader is True:
             return f"리더 멤버 {self.user.username}"
         return f"일반 멤버 {self.user.username}"
+
+
+class Relationship(models.TextChoices):
+    LEADER = "leader", _("Leader")
+    MEMBER = "member", _("Member")
+    REQUESTED = "requested", _("Requested")
+    DISAPPROVED = "disapproved", _("Disapproved")
+
+
+def relationship_of(
+    is_leader: bool | None, request_statuses: Iterable[tuple[bool, bool]]
+) -> str | None:
+    """
+    멤버 여부(리더 여부)와 가입 요청들의 (processed, is_approved) 로 유저와 스터디그룹의 관계를 정합니다.
+    멤버이면 리더/멤버, 처리되지 않은 요청이 있으면 요청, 거절된 요청만 있으면 거절입니다.
+    """
+    if is_leader is not None:
+        return Relationship.LEADER if is_leader else Relationship.MEMBER
+    request_statuses = list(request_statuses)
+    if any(not processed for processed, is_approved in request_statuses):
+        return Relationship.REQUESTED
+    if any(not is_approved for processed, is_approved in request_statuses):
+        return Relationship.DISAPPROVED
+    return None
+
+
+class StudyGroupUserRelationQuerySet(models.QuerySet["StudyGroupUserRelation"]):
+    def refresh_for(self, user_id: Any, studygroup_id: Any) -> None:
+        """
+        멤버, 가입 요청 테이블에서 유저와 스터디그룹의 관계를 다시 계산해 저장합니다.
+        """
+        is_leader = (
+            StudyGroupMember.objects.filter(
+                user_id=user_id, studygroup_id=studygroup_id
+            )
+            .values_list("is_leader", flat=True)
+            .first()
+        )
+        request_statuses = (
+            StudyGroupMemberRequest.objects.filter(
+                user_id=user_id, studygroup_id=studygroup_id
+            ).values_list("processed", "is_approved")
+            if is_leader is None
+            else []
+        )
+        relationship = relationship_of(is_leader, request_statuses)
+        if relationship is None:
+            self.filter(user_id=user_id, studygroup_id=studygroup_id).delete()
+            return
+        self.update_or_create(
+            user_id=user_id,
+            studygroup_id=studygroup_id,
+            defaults={"relationship": relationship},
+        )
+
+    def refresh_many(self, user_ids: Iterable[Any], studygroup_id: Any) -> int:
+        """
+        한 스터디그룹에 대한 여러 유저의 관계를 한 번에 다시 계산해 저장하고, 저장한 관계 수를 반환합니다.
+        bulk_update, bulk_create 처럼 signal 이 발생하지 않는 변경 뒤에 사용합니다.
+        """
+        user_ids = set(user_ids)
+        relations = self.build_relations(
+            StudyGroupMember.objects.filter(
+                studygroup_id=studygroup_id, user_id__in=user_ids
+            ),
+            StudyGroupMemberRequest.objects.filter(
+                studygroup_id=studygroup_id, user_id__in=user_ids
+            ),
+        )
+        with transaction.atomic():
+            # refresh_for 의 update_or_create 처럼 있는 행은 수정하므로, created_at 이 유지됩니다.
+            existing = {
+                relation.user_id: relation
+                for relation in self.select_for_update().filter(
+                    studygroup_id=studygroup_id, user_id__in=user_ids
+                )
+            }
+            updated, created = [], []
+            now = timezone.now()
+            for relation in relations:
+                current = existing.pop(relation.user_id, None)
+                if current is None:
+                    created.append(relation)
+                elif current.relationship != relation.relationship:
+                    current.relationship = relation.relationship
+                    current.updated_at = now
+                    updated.append(current)
+            if existing:
+                self.filter(
+                    pk__in=[relation.pk for relation in existing.values()]
+                ).delete()
+            self.bulk_update(updated, ["relationship", "updated_at"])
+            self.bulk_create(created)
+        return len(relations)
+
+    def rebuild(self, batch_size: int = 1000) -> int:
+        """
+        모든 관계를 멤버, 가입 요청 테이블로부터 다시 만들고, 만든 관계 수를 반환합니다.
+        signal 이 발생하지 않으므로, 캐시된 유저별 스터디그룹 수는 호출한 쪽에서 지워야 합니다.
+        """
+        relations = self.build_relations(
+            StudyGroupMember.objects.all(), StudyGroupMemberRequest.objects.all()
+        )
+        with transaction.atomic():
+            # 관계를 참조하는 모델이 없으므로, 행마다 signal 을 보내는 Collector 를 거치지 않고 한 번에 지웁니다.
+            self.all()._raw_delete(self.db)
+            self.bulk_create(relations, batch_size=batch_size)
+        return len(relations)
+
+    def build_relations(
+        self,
+        members: models.QuerySet[StudyGroupMember],
+        requests: models.QuerySet[StudyGroupMemberRequest],
+    ) -> list["StudyGroupUserRelation"]:
+        """
+        멤버, 가입 요청 쿼리셋으로부터 유저-스터디그룹 쌍마다 관계 인스턴스를 만듭니다. (저장하지 않습니다.)
+        """
+        is_leader_of = {
+            (user_id, studygroup_id): is_leader
+            for user_id, studygroup_id, is_leader in members.values_list(
+                "user_id", "studygroup_id", "is_leader"
+            ).iterator()
+        }
+        request_statuses_of: dict[tuple[Any, Any], list[tuple[bool, bool]]] = {}
+        for user_id, studygroup_id, processed, is_approved in requests.values_list(
+            "user_id", "studygroup_id", "processed", "is_approved"
+        ).iterator():
+            request_statuses_of.setdefault((user_id, studygroup_id), []).append(
+                (processed, is_approved)
+            )
+        relations = []
+        for user_id, studygroup_id in is_leader_of.keys() | request_statuses_of.keys():
+            relationship = relationship_of(
+                is_leader_of.get((user_id, studygroup_id)),
+                request_statuses_of.get((user_id, studygroup_id), []),
+            )
+            if relationship is not None:
+                relations.append(
+                    self.model(
+                        user_id=user_id,
+                        studygroup_id=studygroup_id,
+                        relationship=relationship,
+                    )
+                )
+        return relations
+
+
+class StudyGroupUserRelation(TimestampedModel):
+    """
+    유저와 스터디그룹의 관계(리더, 멤버, 가입 요청, 거절)를 유저-스터디그룹 쌍마다 한 행으로 저장합니다.
+    멤버, 가입 요청이 바뀔 때 signal 에서 갱신하며, 내 스터디그룹 목록을 (user, relationship) 인덱스로 조회합니다.
+    """
+
+    class Meta:
+        verbose_name = _("StudyGroup User Relation")
+        verbose_name_plural = _("StudyGroup User Relations")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "studygroup"], name="unique_user_relation"
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["user", "relationship", "studygroup"],
+                name="user_relation_idx",
+            ),
+        ]
+
+    objects = StudyGroupUserRelationQuerySet.as_manager()
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="studygroup_relations"
+    )
+    studygroup = models.ForeignKey(
+        "StudyGroup", on_delete=models.CASCADE, related_name="user_relations"
+    )
+    relationship = models.CharField(max_length=11, choices=Relationship.choices)
+
+    def __str__(self) -> str:
+        return f"{self.user} 와 {self.studygroup} 의 관계 '{self.relationship}'"
@@ -0,0 +1,115 @@
+import re
+import unicodedata
+from typing import TYPE_CHECKING, Iterable
+
+from django.db import models, transaction
+from django.utils.translation import gettext_lazy as _
+
+if TYPE_CHECKING:
+    from apps.studygroup.models.studygroup import StudyGroup
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def _words(text: str) -> list[str]:
+    return WORD_PATTERN.findall(unicodedata.normalize("NFKC", text).lower())
+
+
+def tokenize(text: str) -> set[str]:
+    """
+    문자열을 색인할 토큰들로 나눕니다.
+    띄어쓰기 없이 쓰인 한글에서도 부분 검색이 되도록, 각 단어를 글자 단위 bigram 으로 나누고
+    한 글자 검색어도 찾을 수 있도록 각 글자(unigram)도 함께 색인합니다.
+    ex) "웹개발" -> {"웹", "개", "발", "웹개", "개발"}
+    """
+    tokens = set()
+    for word in _words(text):
+        tokens.update(word)
+        tokens.update(word[i : i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def tokenize_query(text: str) -> set[str]:
+    """
+    검색어를 토큰들로 나눕니다. 두 글자 이상인 단어는 bigram 으로, 한 글자 단어는 그 글자로 나눕니다.
+    ex) "웹 파이썬" -> {"웹", "파이", "이썬"}
+    """
+    tokens = set()
+    for word in _words(text):
+        if len(word) == 1:
+            tokens.add(word)
+        tokens.update(word[i : i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+class SearchTokenSource(models.TextChoices):
+    TITLE = "title", _("Title")
+    NAME = "name", _("Name")
+    TAG = "tag", _("Tag")
+    CATEGORY = "category", _("Category")
+
+
+class StudyGroupSearchTokenQuerySet(models.QuerySet["StudyGroupSearchToken"]):
+    def rebuild_for(
+        self,
+        studygroup: "StudyGroup",
+        sources: Iterable[str] = SearchTokenSource.values,
+    ) -> None:
+        """
+        스터디그룹의 sources 에 해당하는 토큰들을 다시 만듭니다.
+        """
+        sources = list(sources)
+        texts: dict[str, Iterable[str]] = {
+            SearchTokenSource.TITLE: [studygroup.title],
+            SearchTokenSource.NAME: [studygroup.name],
+        }
+        if SearchTokenSource.TAG in sources:
+            texts[SearchTokenSource.TAG] = studygroup.tags.values_list(
+                "name", flat=True
+            )
+        if SearchTokenSource.CATEGORY in sources:
+            texts[SearchTokenSource.CATEGORY] = studygroup.categories.values_list(
+                "name", flat=True
+            )
+        search_tokens = [
+            self.model(token=token, studygroup=studygroup, source=source)
+            for source in sources
+            for token in set().union(*map(tokenize, texts[source]))
+        ]
+        with transaction.atomic():
+            self.filter(studygroup=studygroup, source__in=sources).delete()
+            self.bulk_create(search_tokens)
+
+
+class StudyGroupSearchToken(models.Model):
+    """
+    스터디그룹 검색을 위한 역색인(inverted index) 모델입니다.
+    제목, 이름, 태그, 카테고리를 tokenize() 로 나눈 토큰을 저장합니다.
+    """
+
+    class Meta:
+        verbose_name = _("StudyGroup Search Token")
+        verbose_name_plural = _("StudyGroup Search Tokens")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["token", "studygroup", "source"],
+                name="unique_studygroup_search_token",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["studygroup", "source"],
+                name="search_token_studygroup_idx",
+            ),
+        ]
+
+    objects = StudyGroupSearchTokenQuerySet.as_manager()
+
+    token = models.CharField(max_length=2)
+    studygroup = models.ForeignKey(
+        "StudyGroup", on_delete=models.CASCADE, related_name="search_tokens"
+    )
+    source = models.CharField(max_length=10, choices=SearchTokenSource.choices)
+
+    def __str__(self) -> str:
+        return f"{self.studygroup} 의 {self.source} 토큰 '{self.token}'"
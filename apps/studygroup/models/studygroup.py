@@ -1,14 +1,174 @@
+import random
 import uuid
+from typing import Any
 
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
-from django.db.models import QuerySet
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    OuterRef,
+    Prefetch,
+    Q,
+    QuerySet,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
 from django.utils.datetime_safe import date
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from apps.core.models import TimestampedModel
 from apps.studygroup.models.member import StudyGroupMember
+from apps.studygroup.models.search import StudyGroupSearchToken, tokenize_query
+
+
+class RecruitmentStatus(models.TextChoices):
+    OPEN = "open", _("Open")
+    CLOSED = "closed", _("Closed")
+
+
+def recruitment_status_of(member_count: Any) -> Case:
+    """
+    주어진 인원 수로 계산한 모집 상태를 SQL 표현식으로 반환합니다.
+    오늘 날짜 > deadline or 현재 인원 >= member_limit 이면 마감입니다.
+    """
+    return Case(
+        When(
+            Q(deadline__lt=date.today()) | Q(member_limit__lte=member_count),
+            then=Value(RecruitmentStatus.CLOSED),
+        ),
+        default=Value(RecruitmentStatus.OPEN),
+    )
+
+
+# 모집 상태(recruitment_status)를 계산할 때 사용하는 필드들입니다.
+RECRUITMENT_STATUS_SOURCE_FIELDS = {"deadline", "member_limit", "member_count"}
+
+
+def recruiting_condition() -> Q:
+    """
+    모집 중인 스터디그룹의 조건입니다.
+    저장된 모집 상태는 모집 마감일이 지나도 close_expired_studygroups 커맨드가 실행되기 전까지 바뀌지 않으므로,
+    모집 마감일도 함께 확인합니다.
+    """
+    return Q(recruitment_status=RecruitmentStatus.OPEN, deadline__gte=date.today())
+
+
+RANDOM_KEY_MAX = 2**31 - 1
+
+
+def generate_random_key() -> int:
+    """
+    랜덤 정렬에 사용할 키를 생성합니다.
+    """
+    return random.randint(0, RANDOM_KEY_MAX)
+
+
+# 멤버 변경 시 signals 에서만 갱신되는 필드들입니다.
+COUNTER_FIELDS = ("member_count", "recruitment_status")
+
+
+class StudyGroupQuerySet(models.QuerySet["StudyGroup"]):
+    def for_list(self) -> "StudyGroupQuerySet":
+        """
+        목록 조회에 필요한 정보를 한 번에 가져오는 쿼리셋을 반환합니다.
+        리더(유저 포함), 태그, 카테고리를 미리 가져오므로 페이지 크기와 관계없이 쿼리 수가 일정합니다.
+        """
+        return self.prefetch_related(
+            Prefetch(
+                "members",
+                queryset=StudyGroupMember.objects.filter(is_leader=True).select_related(
+                    "user"
+                ),
+                to_attr="prefetched_leaders",
+            ),
+            "tags",
+            "categories",
+        )
+
+    def closed(self) -> "StudyGroupQuerySet":
+        """
+        모집이 마감된 스터디그룹들을 필터링합니다.
+        """
+        return self.filter(~recruiting_condition())
+
+    def opened(self) -> "StudyGroupQuerySet":
+        """
+        모집 중인 스터디그룹들을 필터링합니다.
+        """
+        return self.filter(recruiting_condition())
+
+    def search(self, keyword: str) -> "StudyGroupQuerySet":
+        """
+        검색어의 모든 토큰을 포함하는 스터디그룹들을 필터링합니다.
+        토큰별 posting list 의 교집합을 구하고, 일치한 토큰 수를 search_rank 로 annotate 합니다.
+        """
+        tokens = tokenize_query(keyword)
+        if not tokens:
+            return self.none()
+        search_tokens = StudyGroupSearchToken.objects.filter(token__in=tokens)
+        matched_studygroups = (
+            search_tokens.values("studygroup")
+            .annotate(matched_tokens=Count("token", distinct=True))
+            .filter(matched_tokens=len(tokens))
+            .values("studygroup")
+        )
+        search_rank = (
+            search_tokens.filter(studygroup=OuterRef("pk"))
+            .order_by()
+            .values("studygroup")
+            .annotate(hits=Count("pk"))
+            .values("hits")
+        )
+        return self.filter(pk__in=matched_studygroups).annotate(
+            search_rank=Subquery(search_rank)
+        )
+
+    def add_member_count(self, delta: int) -> int:
+        """
+        저장된 인원 수를 delta 만큼 원자적으로 변경하고, 모집 상태도 함께 갱신합니다.
+        """
+        member_count = F("member_count") + delta
+        return self.update(
+            member_count=member_count,
+            recruitment_status=recruitment_status_of(member_count),
+        )
+
+    def refresh_recruitment_status(self) -> int:
+        """
+        저장된 인원 수와 모집 마감일로 모집 상태를 다시 계산합니다.
+        """
+        return self.update(recruitment_status=recruitment_status_of(F("member_count")))
+
+    def close_expired(self) -> int:
+        """
+        모집 마감일이 지난 모집 중인 스터디그룹들을 마감 처리합니다.
+        """
+        return self.filter(
+            recruitment_status=RecruitmentStatus.OPEN,
+            deadline__lt=date.today(),
+        ).update(recruitment_status=RecruitmentStatus.CLOSED)
+
+    def rebuild_member_counts(self) -> int:
+        """
+        저장된 인원 수를 실제 멤버 수로 다시 계산합니다.
+        """
+        member_count = (
+            StudyGroupMember.objects.filter(studygroup=OuterRef("pk"))
+            .order_by()
+            .values("studygroup")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        member_count = Coalesce(Subquery(member_count), 0)
+        return self.update(
+            member_count=member_count,
+            recruitment_status=recruitment_status_of(member_count),
+        )
 
 
 class StudyGroup(TimestampedModel):
@@ -16,12 +176,45 @@ class StudyGroup(TimestampedModel):
         verbose_name = _("StudyGroup")
         verbose_name_plural = _("StudyGroups")
         ordering = ["-pk"]
+        indexes = [
+            models.Index(
+                fields=["recruitment_status", "-created_at"],
+                name="studygroup_status_created_idx",
+            ),
+            models.Index(
+                fields=["recruitment_status", "deadline"],
+                name="studygroup_status_deadline_idx",
+            ),
+            models.Index(
+                fields=["random_key", "id"],
+                name="studygroup_random_key_idx",
+            ),
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="studygroup_created_id_idx",
+            ),
+            models.Index(
+                fields=["deadline", "id"],
+                name="studygroup_deadline_id_idx",
+            ),
+        ]
+
+    objects = StudyGroupQuerySet.as_manager()
 
     uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
     name = models.CharField(max_length=80)
     member_limit = models.PositiveSmallIntegerField(
         validators=[MinValueValidator(2), MaxValueValidator(10)]
     )
+    # 멤버가 추가/삭제될 때 signals 에서 갱신되는 현재 인원 수입니다.
+    member_count = models.PositiveSmallIntegerField(default=0, editable=False)
+    # 인원 수, 모집 마감일이 바뀔 때 함께 갱신되는 모집 상태입니다.
+    recruitment_status = models.CharField(
+        max_length=10,
+        choices=RecruitmentStatus.choices,
+        default=RecruitmentStatus.OPEN,
+        editable=False,
+    )
     start_date = models.DateField()
     end_date = models.DateField()
     head_image = models.ImageField(
@@ -32,6 +225,10 @@ class StudyGroup(TimestampedModel):
     deadline = models.DateField()
     categories = models.ManyToManyField("Category", related_name="studygroups")
     tags = models.ManyToManyField("Tag", related_name="studygroups", blank=True)
+    # 랜덤 정렬(ordering=random)을 인덱스로 처리하기 위한 키입니다.
+    random_key = models.PositiveIntegerField(
+        default=generate_random_key, editable=False
+    )
 
     @property
     def default_head_image(self) -> str:
@@ -48,18 +245,22 @@ class StudyGroup(TimestampedModel):
         return self.members.all()
 
     @cached_property
-    def leaders(self) -> QuerySet[StudyGroupMember]:
+    def leaders(self) -> list[StudyGroupMember] | QuerySet[StudyGroupMember]:
         """
         스터디그룹장들을 반환합니다.
+        for_list() 로 미리 가져온 리더가 있다면 그것을 사용합니다.
         """
+        prefetched_leaders = getattr(self, "prefetched_leaders", None)
+        if prefetched_leaders is not None:
+            return prefetched_leaders
         return self.members.filter(is_leader=True)
 
-    @cached_property
+    @property
     def current_member_count(self) -> int:
         """
         현재 스터디그룹의 인원 수를 반환합니다.
         """
-        return self.approved_members.count()
+        return self.member_count
 
     @property
     def until_deadline(self) -> int:
@@ -68,16 +269,56 @@ class StudyGroup(TimestampedModel):
         """
         return (self.deadline - date.today()).days
 
-    @cached_property
+    @property
     def is_closed(self) -> bool:
         """
         스터디그룹이 모집이 완료되었는지 여부를 반환합니다.
-        오늘 날짜 > deadline or 현재 인원 == member_limit
+        저장된 모집 상태(recruitment_status)가 마감이거나, 모집 마감일이 지났으면 마감입니다.
         """
         return (
-            date.today() > self.deadline
-            or self.current_member_count == self.member_limit
+            self.recruitment_status == RecruitmentStatus.CLOSED
+            or date.today() > self.deadline
         )
 
+    def _calculate_recruitment_status(self) -> str:
+        if (
+            date.today() > self.deadline
+            or self.current_member_count >= self.member_limit
+        ):
+            return RecruitmentStatus.CLOSED
+        return RecruitmentStatus.OPEN
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """
+        member_count, recruitment_status 는 멤버 변경 시에만 갱신되므로, 이미 저장된 스터디그룹을
+        수정할 때는 오래된 값으로 덮어쓰지 않도록 저장 대상에서 제외합니다.
+        대신 저장 후, 모집 마감일과 모집 인원의 변경을 반영해 모집 상태를 다시 계산합니다.
+        update_fields 가 주어지면 그 필드만 저장하고, 모집 상태에 영향을 주는 필드가 있을 때만 다시 계산합니다.
+        """
+        self.recruitment_status = self._calculate_recruitment_status()
+        if self._state.adding:
+            super().save(*args, **kwargs)
+            return
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            if not update_fields & RECRUITMENT_STATUS_SOURCE_FIELDS:
+                super().save(*args, **kwargs)
+                return
+            kwargs["update_fields"] = update_fields | {"recruitment_status"}
+            super().save(*args, **kwargs)
+            StudyGroup.objects.filter(pk=self.pk).refresh_recruitment_status()
+            return
+        deferred_fields = self.get_deferred_fields()
+        kwargs["update_fields"] = [
+            field.attname
+            for field in self._meta.concrete_fields
+            if not field.primary_key
+            and field.name not in COUNTER_FIELDS
+            and field.attname not in deferred_fields
+        ]
+        super().save(*args, **kwargs)
+        StudyGroup.objects.filter(pk=self.pk).refresh_recruitment_status()
+
     def __str__(self) -> str:
         return self.name
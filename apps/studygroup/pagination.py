@@ -1,15 +1,272 @@
-from rest_framework.pagination import CursorPagination
+import json
+from base64 import b64decode, b64encode
+from collections import namedtuple
+from datetime import date
+from typing import Any
+from urllib import parse
 
+from django.db.models import Model, Q, QuerySet
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import Cursor, CursorPagination
+from rest_framework.request import Request
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
 
-class StudyGroupPagination(CursorPagination):
+from apps.studygroup.models import StudyGroup
+from apps.studygroup.models.studygroup import RANDOM_KEY_MAX, generate_random_key
+
+RandomCursor = namedtuple("RandomCursor", ["seed", "random_key", "pk"])
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    정렬 필드들과 pk 를 함께 커서에 담는 keyset 방식의 커서 페이지네이션입니다.
+    rest_framework 의 CursorPagination 은 첫 번째 정렬 필드만 커서에 담고, 값이 같은 행들은 offset 으로 건너뜁니다.
+    여기서는 정렬 필드 뒤에 pk 를 붙여 순서를 유일하게 만들고, 마지막 행의 값들보다 뒤에 있는 행만 조회하므로
+    몇 번째 페이지든 페이지 크기만큼만 읽습니다.
+    """
+
+    tie_breaker = "pk"
+
+    def get_ordering(
+        self, request: Request, queryset: QuerySet[Any], view: APIView | None
+    ) -> tuple[str, ...]:
+        """
+        정렬 필드들 뒤에, 첫 번째 정렬 필드와 같은 방향으로 pk 를 붙입니다.
+        """
+        ordering = super().get_ordering(request, queryset, view)
+        fields = [field.lstrip("-") for field in ordering]
+        if self.tie_breaker in fields or "id" in fields:
+            return ordering
+        prefix = "-" if ordering[0].startswith("-") else ""
+        return (*ordering, prefix + self.tie_breaker)
+
+    def paginate_queryset(
+        self, queryset: QuerySet[Any], request: Request, view: APIView = None
+    ) -> list[Model] | None:
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor is not None and self.cursor.reverse
+        self.position = self.decode_position(self.cursor)
+
+        ordering = (
+            [self._reverse_field(field) for field in self.ordering]
+            if reverse
+            else list(self.ordering)
+        )
+        queryset = queryset.order_by(*ordering)
+        if self.position is not None:
+            queryset = queryset.filter(self.get_seek_filter(ordering, self.position))
+
+        results = list(queryset[: self.page_size + 1])
+        has_following = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        if reverse:
+            self.page.reverse()
+            self.has_next = self.position is not None
+            self.has_previous = has_following
+        else:
+            self.has_next = has_following
+            self.has_previous = self.position is not None
+        return self.page
+
+    @staticmethod
+    def _reverse_field(field: str) -> str:
+        return field[1:] if field.startswith("-") else "-" + field
+
+    @staticmethod
+    def get_seek_filter(ordering: list[str], position: list[Any]) -> Q:
+        """
+        (a, b, pk) > (x, y, z) 를 다음과 같이 풀어 씁니다.
+        a > x OR (a = x AND b > y) OR (a = x AND b = y AND pk > z)
+        첫 번째 필드의 범위 조건(a >= x)을 함께 걸어, 인덱스에서 바로 위치를 찾을 수 있게 합니다.
+        """
+        first = ordering[0].lstrip("-")
+        first_lookup = "lte" if ordering[0].startswith("-") else "gte"
+        seek = Q()
+        equals: dict[str, Any] = {}
+        for field, value in zip(ordering, position):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            seek |= Q(**equals, **{f"{name}__{lookup}": value})
+            equals[name] = value
+        return Q(**{f"{first}__{first_lookup}": position[0]}) & seek
+
+    def decode_position(self, cursor: Cursor | None) -> list[Any] | None:
+        if cursor is None or cursor.position is None:
+            return None
+        try:
+            position = json.loads(cursor.position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def get_position_from_instance(self, instance: Model) -> str:
+        values = []
+        for field in self.ordering:
+            value = getattr(instance, field.lstrip("-"))
+            values.append(value.isoformat() if isinstance(value, date) else value)
+        return json.dumps(values)
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next:
+            return None
+        position = (
+            self.get_position_from_instance(self.page[-1])
+            if self.page
+            else self.cursor.position
+        )
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+    def get_previous_link(self) -> str | None:
+        if not self.has_previous:
+            return None
+        position = (
+            self.get_position_from_instance(self.page[0])
+            if self.page
+            else self.cursor.position
+        )
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=position))
+
+
+class StudyGroupPagination(KeysetCursorPagination):
     page_size = 8
     cursor_query_param = "cursor"
     cursor_query_description = "커서 값입니다."
     invalid_cursor_message = "잘못된 커서 값입니다."
     ordering = "-created_at"
+    random_ordering = "random_key"
+    seed_query_param = "seed"
+    seed_query_description = (
+        "랜덤 정렬(ordering=random)의 시작 위치입니다. 방문자마다 다른 값을 사용하면 서로 다른 순서로 보입니다. "
+        "지정하지 않으면 임의의 값이 사용되며, 다음 페이지 커서에 포함되어 유지됩니다."
+    )
+
+    def paginate_queryset(
+        self, queryset: QuerySet[StudyGroup], request: Request, view: APIView = None
+    ) -> list[StudyGroup] | None:
+        """
+        ordering=random 이면, random_key 인덱스를 이용해 seek 방식으로 페이지를 나눕니다.
+        """
+        self.is_random = (
+            self.get_ordering(request, queryset, view)[0] == self.random_ordering
+        )
+        if not self.is_random:
+            return super().paginate_queryset(queryset, request, view)
+        return self.paginate_random_queryset(queryset, request)
+
+    def paginate_random_queryset(
+        self, queryset: QuerySet[StudyGroup], request: Request
+    ) -> list[StudyGroup]:
+        """
+        random_key 를 seed 에서 시작해 한 바퀴 도는 순서로 정렬합니다.
+        1. random_key >= seed 인 스터디그룹들을 (random_key, pk) 순서로 가져옵니다.
+        2. 이어서 random_key < seed 인 스터디그룹들을 같은 순서로 가져옵니다.
+        커서에는 seed 와 마지막 (random_key, pk) 가 담기므로, 같은 커서는 항상 같은 페이지를 반환하고
+        페이지 사이에 중복되거나 빠지는 스터디그룹이 없습니다.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.random_cursor = self.decode_random_cursor(request)
+        seed, last_random_key, last_pk = self.random_cursor
+
+        queryset = queryset.order_by("random_key", "pk")
+        after_last = (
+            Q(random_key__gt=last_random_key)
+            | Q(random_key=last_random_key, pk__gt=last_pk)
+            if last_random_key is not None
+            else Q()
+        )
+        limit = self.page_size + 1
+        if last_random_key is None or last_random_key >= seed:
+            results = list(queryset.filter(after_last, random_key__gte=seed)[:limit])
+            if len(results) < limit:
+                results += list(
+                    queryset.filter(random_key__lt=seed)[: limit - len(results)]
+                )
+        else:
+            results = list(queryset.filter(after_last, random_key__lt=seed)[:limit])
+
+        self.page = results[: self.page_size]
+        self.has_next = len(results) > self.page_size
+        self.has_previous = False
+        return self.page
+
+    def decode_random_cursor(self, request: Request) -> RandomCursor:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return RandomCursor(self.get_seed(request), None, None)
+        try:
+            querystring = b64decode(encoded.encode("ascii")).decode("ascii")
+            tokens = parse.parse_qs(querystring, keep_blank_values=True)
+            return RandomCursor(
+                int(tokens["s"][0]), int(tokens["k"][0]), int(tokens["i"][0])
+            )
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_random_cursor(self, cursor: RandomCursor) -> str:
+        querystring = parse.urlencode(
+            {"s": cursor.seed, "k": cursor.random_key, "i": cursor.pk}, doseq=True
+        )
+        encoded = b64encode(querystring.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_seed(self, request: Request) -> int:
+        seed = request.query_params.get(self.seed_query_param)
+        if seed is None:
+            return generate_random_key()
+        try:
+            return int(seed) % (RANDOM_KEY_MAX + 1)
+        except ValueError:
+            raise ValidationError(detail={self.seed_query_param: "숫자만 입력할 수 있습니다."})
+
+    def get_next_link(self) -> str | None:
+        if not self.is_random:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        return self.encode_random_cursor(
+            RandomCursor(self.random_cursor.seed, last.random_key, last.pk)
+        )
+
+    def get_previous_link(self) -> str | None:
+        """
+        랜덤 정렬은 다음 페이지로만 이동할 수 있습니다.
+        """
+        if not self.is_random:
+            return super().get_previous_link()
+        return None
+
+    def get_schema_operation_parameters(self, view: APIView) -> list[dict[str, Any]]:
+        parameters = super().get_schema_operation_parameters(view)
+        if not any(
+            hasattr(filter_cls, "get_ordering")
+            for filter_cls in getattr(view, "filter_backends", [])
+        ):
+            return parameters
+        parameters.append(
+            {
+                "name": self.seed_query_param,
+                "required": False,
+                "in": "query",
+                "description": self.seed_query_description,
+                "schema": {"type": "integer"},
+            }
+        )
+        return parameters
 
 
-class StudyGroupAssignmentPagination(CursorPagination):
+class StudyGroupAssignmentPagination(KeysetCursorPagination):
     page_size = 5
     cursor_query_param = "cursor"
     cursor_query_description = "커서 값입니다."
@@ -1,18 +1,8 @@
-from django.utils.translation import gettext_lazy as _
 from rest_framework import permissions
-from rest_framework.generics import get_object_or_404
 from rest_framework.request import Request
 from rest_framework.views import APIView
 
-from apps.studygroup.models import AssignmentSubmission
-
-
-def _get_submission(view: APIView) -> AssignmentSubmission:
-    assert view.kwargs.get("submission_id") is not None, _(
-        f"{view.__class__.__name__} requires assignment_submission_id argument in view"
-    )
-    submission_id = view.kwargs.get("submission_id")
-    return get_object_or_404(AssignmentSubmission, id=submission_id)
+from apps.studygroup.context import get_assignment_submission
 
 
 class IsAssignmentSubmissionAuthor(permissions.BasePermission):
@@ -21,8 +11,8 @@ class IsAssignmentSubmissionAuthor(permissions.BasePermission):
     """
 
     def has_permission(self, request: Request, view: APIView) -> bool:
-        submission = _get_submission(view)
-        return submission.author.user == request.user
+        submission = get_assignment_submission(request, view)
+        return submission.author.user_id == request.user.pk
 
 
 class IsAssignmentSubmissionAuthorOrReadOnly(permissions.BasePermission):
@@ -31,8 +21,8 @@ class IsAssignmentSubmissionAuthorOrReadOnly(permissions.BasePermission):
     """
 
     def has_permission(self, request: Request, view: APIView) -> bool:
-        submission = _get_submission(view)
+        submission = get_assignment_submission(request, view)
         return (
-            submission.author.user == request.user
+            submission.author.user_id == request.user.pk
             or request.method in permissions.SAFE_METHODS
         )
@@ -1,18 +1,8 @@
-from django.utils.translation import gettext_lazy as _
 from rest_framework import permissions
-from rest_framework.generics import get_object_or_404
 from rest_framework.request import Request
 from rest_framework.views import APIView
 
-from apps.studygroup.models import StudyGroup
-
-
-def _get_studygroup(view: APIView) -> StudyGroup:
-    assert view.kwargs.get("studygroup_uuid") is not None, _(
-        f"{view.__class__.__name__} requires studygroup_uuid argument in view"
-    )
-    studygroup_uuid = view.kwargs.get("studygroup_uuid")
-    return get_object_or_404(StudyGroup, uuid=studygroup_uuid)
+from apps.studygroup.context import get_studygroup_context
 
 
 class IsStudygroupMember(permissions.BasePermission):
@@ -21,11 +11,7 @@ class IsStudygroupMember(permissions.BasePermission):
     """
 
     def has_permission(self, request: Request, view: APIView) -> bool:
-        studygroup = _get_studygroup(view)
-        return (
-            request.user.is_authenticated
-            and studygroup.members.filter(user=request.user).exists()
-        )
+        return get_studygroup_context(request, view).is_member
 
 
 class IsStudygroupMemberOrReadOnly(permissions.BasePermission):
@@ -34,10 +20,8 @@ class IsStudygroupMemberOrReadOnly(permissions.BasePermission):
     """
 
     def has_permission(self, request: Request, view: APIView) -> bool:
-        studygroup = _get_studygroup(view)
         return (
-            request.user.is_authenticated
-            and studygroup.members.filter(user=request.user).exists()
+            get_studygroup_context(request, view).is_member
             or request.method in permissions.SAFE_METHODS
         )
 
@@ -48,8 +32,4 @@ class IsStudygroupLeader(permissions.BasePermission):
     """
 
     def has_permission(self, request: Request, view: APIView) -> bool:
-        studygroup = _get_studygroup(view)
-        return (
-            request.user.is_authenticated
-            and studygroup.leaders.filter(user=request.user).exists()
-        )
+        return get_studygroup_context(request, view).is_leader
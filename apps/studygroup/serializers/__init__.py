@@ -10,11 +10,15 @@ from apps.studygroup.serializers.category import CategoryReadSerializer
 from apps.studygroup.serializers.member import (
     LeaderReadSerializer,
     StudyGroupMemberReadSerializer,
+    StudyGroupMemberRequestBulkResponseSerializer,
+    StudyGroupMemberRequestBulkResultSerializer,
+    StudyGroupMemberRequestBulkSerializer,
     StudyGroupMemberRequestCreateSerializer,
     StudyGroupMemberRequestManageSerializer,
     StudyGroupMemberRequestReadSerializer,
 )
 from apps.studygroup.serializers.studygroup import (
+    MyStudyGroupCountsSerializer,
     MyStudyGroupReadSerializer,
     StudyGroupDetailSerializer,
     StudyGroupListSerializer,
@@ -26,11 +30,15 @@ __all__ = [
     "CategoryReadSerializer",
     "StudyGroupListSerializer",
     "MyStudyGroupReadSerializer",
+    "MyStudyGroupCountsSerializer",
     "StudyGroupDetailSerializer",
     "StudyGroupMemberReadSerializer",
     "StudyGroupMemberRequestReadSerializer",
     "StudyGroupMemberRequestCreateSerializer",
     "StudyGroupMemberRequestManageSerializer",
+    "StudyGroupMemberRequestBulkSerializer",
+    "StudyGroupMemberRequestBulkResultSerializer",
+    "StudyGroupMemberRequestBulkResponseSerializer",
     "AssignmentReadSerializer",
     "AssignmentCreateSerializer",
     "AssignmentSubmissionListReadSerializer",
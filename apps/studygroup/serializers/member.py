@@ -1,10 +1,14 @@
 from collections import OrderedDict
 from typing import Any
 
+from django.db.models import Exists, OuterRef
+from django.utils.datetime_safe import date
 from rest_framework import serializers
+from rest_framework.exceptions import NotFound
 
 from apps.accounts.serializers import ProfileSerializer
 from apps.studygroup.models import StudyGroup, StudyGroupMember, StudyGroupMemberRequest
+from apps.studygroup.models.studygroup import RecruitmentStatus
 
 
 class LeaderReadSerializer(serializers.ModelSerializer[StudyGroupMember]):
@@ -47,6 +51,10 @@ class StudyGroupMemberRequestCreateSerializer(
     스터디그룹 가입 요청을 생성하기 위한 serializer 입니다.
     """
 
+    DUPLICATE_REQUEST_MESSAGE = (
+        "You have already sent a request to join this studygroup."
+    )
+
     class Meta:
         model = StudyGroupMemberRequest
         fields = [
@@ -55,32 +63,52 @@ class StudyGroupMemberRequestCreateSerializer(
 
     def validate(self, attrs: OrderedDict[str, Any]) -> OrderedDict[str, Any]:
         """
-        1. 스터디그룹의 모집이 마감되었는지 확인합니다.
+        아래 항목을 한 번의 쿼리로 확인하고, 확인한 스터디그룹의 pk 를 attrs 에 담습니다.
+        1. 스터디그룹의 모집이 마감되었는지(모집 마감일이 지났는지) 확인합니다.
         2. 이미 스터디그룹에 가입되어 있는지 확인합니다.
         3. 이미 스터디그룹 가입 요청을 보냈는지 확인합니다.
+        동시에 보낸 중복 요청은 DB 의 unique 제약조건으로 막습니다.
         """
-        studygroup_uuid = self.__dict__["_context"]["view"].kwargs["studygroup_uuid"]
-        studygroup = StudyGroup.objects.get(uuid=studygroup_uuid)
-
-        if studygroup.is_closed:
+        studygroup_uuid = self.context["view"].kwargs["studygroup_uuid"]
+        request_user = self.context["request"].user
+        studygroup = (
+            StudyGroup.objects.filter(uuid=studygroup_uuid)
+            .annotate(
+                is_member=Exists(
+                    StudyGroupMember.objects.filter(
+                        studygroup=OuterRef("pk"), user=request_user
+                    )
+                ),
+                has_requested=Exists(
+                    StudyGroupMemberRequest.objects.filter(
+                        studygroup=OuterRef("pk"), user=request_user
+                    )
+                ),
+            )
+            .values(
+                "pk", "recruitment_status", "deadline", "is_member", "has_requested"
+            )
+            .first()
+        )
+        if studygroup is None:
+            raise NotFound
+
+        if (
+            studygroup["recruitment_status"] == RecruitmentStatus.CLOSED
+            or studygroup["deadline"] < date.today()
+        ):
             raise serializers.ValidationError(
                 "The studygroup is already closed. You can't join it."
             )
 
-        request_user = self.__dict__["_context"]["request"].user
-        if StudyGroupMember.objects.filter(
-            studygroup=studygroup, user=request_user
-        ).exists():
+        if studygroup["is_member"]:
             raise serializers.ValidationError(
                 "You are already a member of this studygroup."
             )
 
-        if StudyGroupMemberRequest.objects.filter(
-            studygroup=studygroup, user=request_user
-        ).exists():
-            raise serializers.ValidationError(
-                "You have already sent a request to join this studygroup."
-            )
+        if studygroup["has_requested"]:
+            raise serializers.ValidationError(self.DUPLICATE_REQUEST_MESSAGE)
+        attrs["studygroup_id"] = studygroup["pk"]
         return attrs
 
 
@@ -114,3 +142,53 @@ class StudyGroupMemberRequestManageSerializer(
     class Meta:
         model = StudyGroupMemberRequest
         fields = []
+
+
+class StudyGroupMemberRequestBulkSerializer(serializers.Serializer):  # type: ignore
+    """
+    여러 스터디그룹 가입 요청을 한 번에 승인하거나 거절하기 위한 serializer 입니다.
+    """
+
+    APPROVE = "approve"
+    REJECT = "reject"
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        min_length=1,
+        max_length=100,
+        help_text="처리할 가입 요청 id 목록입니다. 최대 100개까지 보낼 수 있습니다.",
+    )
+    action = serializers.ChoiceField(choices=[(APPROVE, "승인"), (REJECT, "거절")])
+
+
+class StudyGroupMemberRequestBulkResultSerializer(
+    serializers.Serializer  # type: ignore
+):
+    """
+    가입 요청 일괄 처리의 요청별 결과를 보여주기 위한 serializer 입니다.
+    """
+
+    APPROVED = "approved"
+    REJECTED = "rejected"
+    NOT_FOUND = "not_found"
+    ALREADY_PROCESSED = "already_processed"
+    ALREADY_MEMBER = "already_member"
+    FULL = "full"
+
+    id = serializers.IntegerField()
+    result = serializers.ChoiceField(
+        choices=[
+            (APPROVED, "승인됨"),
+            (REJECTED, "거절됨"),
+            (NOT_FOUND, "해당 스터디그룹의 가입 요청이 아님"),
+            (ALREADY_PROCESSED, "이미 처리된 요청"),
+            (ALREADY_MEMBER, "이미 스터디그룹의 멤버"),
+            (FULL, "스터디그룹 인원이 가득 참"),
+        ]
+    )
+
+
+class StudyGroupMemberRequestBulkResponseSerializer(
+    serializers.Serializer  # type: ignore
+):
+    results = StudyGroupMemberRequestBulkResultSerializer(many=True)
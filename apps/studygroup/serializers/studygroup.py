@@ -190,3 +190,15 @@ class MyStudyGroupReadSerializer(serializers.ModelSerializer[StudyGroup]):
         if not ret["head_image"]:
             ret["head_image"] = self.get_head_image(instance)
         return ret
+
+
+class MyStudyGroupCountsSerializer(serializers.Serializer):  # type: ignore
+    """
+    나와 관련된 스터디그룹 수를 filter 값별로 보여주기 위한 serializer 입니다.
+    """
+
+    current = serializers.IntegerField()
+    requested = serializers.IntegerField()
+    approved = serializers.IntegerField()
+    disapproved = serializers.IntegerField()
+    as_leader = serializers.IntegerField()
@@ -0,0 +1,360 @@
+from typing import Any, Iterable
+
+from django.db.models import Model, QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from apps.accounts.models import User
+from apps.studygroup.caches import (
+    bump_studies_version,
+    bump_studygroup_versions,
+    category_catalogue,
+    membership_cache,
+    my_studygroup_counts_cache,
+    tag_pool,
+)
+from apps.studygroup.membership import sync_membership
+from apps.studygroup.models import (
+    Category,
+    StudyGroup,
+    StudyGroupMember,
+    StudyGroupMemberRequest,
+    StudyGroupSearchToken,
+    StudyGroupUserRelation,
+    Tag,
+)
+from apps.studygroup.models.search import SearchTokenSource
+from apps.studygroup.models.studygroup import COUNTER_FIELDS
+
+
+def _is_cascaded(origin: Model | QuerySet[Any] | None) -> bool:
+    """
+    스터디그룹이나 유저가 삭제되면서 함께 삭제되는 경우인지 확인합니다.
+    이때는 유저와 스터디그룹의 관계도 함께 삭제되므로 다시 계산하지 않습니다.
+    """
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return origin_model in (StudyGroup, User)
+
+
+def _cached_studygroup_uuid(instance: StudyGroupMember) -> Any:
+    if StudyGroupMember.studygroup.is_cached(instance):
+        return instance.studygroup.uuid
+    return None
+
+
+def _refresh_cached_counters(member: StudyGroupMember) -> None:
+    """
+    메모리에 올라와 있는 스터디그룹 인스턴스가 있다면 갱신된 인원 수, 모집 상태로 맞춰줍니다.
+    """
+    if StudyGroupMember.studygroup.is_cached(member):
+        counters = (
+            StudyGroup.objects.filter(pk=member.studygroup_id)
+            .values(*COUNTER_FIELDS)
+            .first()
+        )
+        if counters is not None:
+            for field, value in counters.items():
+                setattr(member.studygroup, field, value)
+
+
+@receiver(post_save, sender=StudyGroupMember)
+def sync_saved_member(
+    sender: type[StudyGroupMember],
+    instance: StudyGroupMember,
+    created: bool,
+    raw: bool,
+    **kwargs: Any,
+) -> None:
+    """
+    스터디그룹 멤버가 추가되거나 리더 여부가 바뀌면 sync_membership 으로 관련 값들을 갱신합니다.
+    추가된 경우에는 스터디그룹의 인원 수를 1 늘립니다.
+    """
+    if raw:
+        return
+    sync_membership(
+        instance.studygroup_id,
+        [instance.user_id],
+        member_delta=1 if created else 0,
+        studygroup_uuid=_cached_studygroup_uuid(instance),
+    )
+    if created:
+        _refresh_cached_counters(instance)
+
+
+@receiver(post_delete, sender=StudyGroupMember)
+def sync_deleted_member(
+    sender: type[StudyGroupMember],
+    instance: StudyGroupMember,
+    origin: Model | QuerySet[Any] | None = None,
+    **kwargs: Any,
+) -> None:
+    """
+    스터디그룹 멤버가 삭제되면 스터디그룹의 인원 수를 1 줄이고, sync_membership 으로 관련 값들을 갱신합니다.
+    """
+    sync_membership(
+        instance.studygroup_id,
+        [instance.user_id],
+        member_delta=-1,
+        refresh_relations=not _is_cascaded(origin),
+        studygroup_uuid=_cached_studygroup_uuid(instance),
+    )
+    _refresh_cached_counters(instance)
+
+
+@receiver(post_save, sender=StudyGroupMemberRequest)
+@receiver(post_delete, sender=StudyGroupMemberRequest)
+def sync_member_request(
+    sender: type[StudyGroupMemberRequest],
+    instance: StudyGroupMemberRequest,
+    raw: bool = False,
+    origin: Model | QuerySet[Any] | None = None,
+    **kwargs: Any,
+) -> None:
+    """
+    가입 요청이 바뀌면 유저와 스터디그룹의 관계(StudyGroupUserRelation)를 다시 계산합니다.
+    """
+    if raw or _is_cascaded(origin):
+        return
+    sync_membership(instance.studygroup_id, [instance.user_id], members_changed=False)
+
+
+def _rebuild_search_tokens(studygroups: Iterable[StudyGroup], source: str) -> None:
+    for studygroup in studygroups:
+        StudyGroupSearchToken.objects.rebuild_for(studygroup, [source])
+
+
+@receiver(post_save, sender=StudyGroup)
+def index_studygroup(
+    sender: type[StudyGroup],
+    instance: StudyGroup,
+    raw: bool,
+    update_fields: frozenset[str] | None,
+    **kwargs: Any,
+) -> None:
+    """
+    스터디그룹이 저장되면 제목, 이름의 검색 토큰을 다시 만듭니다.
+    """
+    if raw:
+        return
+    if update_fields is not None and not {"title", "name"} & update_fields:
+        return
+    StudyGroupSearchToken.objects.rebuild_for(
+        instance, [SearchTokenSource.TITLE, SearchTokenSource.NAME]
+    )
+
+
+def _index_studygroup_relation(
+    source: str,
+    instance: Model,
+    action: str,
+    reverse: bool,
+    pk_set: set[int] | None,
+) -> None:
+    """
+    스터디그룹의 태그, 카테고리가 바뀌면 해당하는 검색 토큰을 다시 만듭니다.
+    reverse 인 경우(tag.studygroups.add() 등) 영향을 받는 스터디그룹들을 모두 다시 만듭니다.
+    """
+    if action == "pre_clear" and reverse:
+        instance._cleared_studygroups = list(instance.studygroups.all())  # type: ignore
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        assert isinstance(instance, StudyGroup)
+        _rebuild_search_tokens([instance], source)
+    elif action == "post_clear":
+        _rebuild_search_tokens(getattr(instance, "_cleared_studygroups", []), source)
+    else:
+        _rebuild_search_tokens(StudyGroup.objects.filter(pk__in=pk_set or []), source)
+
+
+@receiver(m2m_changed, sender=StudyGroup.tags.through)
+def index_studygroup_tags(
+    sender: type[Model],
+    instance: Model,
+    action: str,
+    reverse: bool,
+    pk_set: set[int] | None,
+    **kwargs: Any,
+) -> None:
+    _index_studygroup_relation(SearchTokenSource.TAG, instance, action, reverse, pk_set)
+    if action in ("post_add", "post_remove", "post_clear"):
+        tag_pool.invalidate()
+
+
+@receiver(m2m_changed, sender=StudyGroup.categories.through)
+def index_studygroup_categories(
+    sender: type[Model],
+    instance: Model,
+    action: str,
+    reverse: bool,
+    pk_set: set[int] | None,
+    **kwargs: Any,
+) -> None:
+    _index_studygroup_relation(
+        SearchTokenSource.CATEGORY, instance, action, reverse, pk_set
+    )
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_save, sender=Category)
+def reindex_renamed_relation(
+    sender: type[Tag | Category],
+    instance: Tag | Category,
+    created: bool,
+    raw: bool,
+    **kwargs: Any,
+) -> None:
+    """
+    태그, 카테고리의 이름이 바뀌면 연결된 스터디그룹들의 검색 토큰을 다시 만듭니다.
+    """
+    if created or raw:
+        return
+    source = SearchTokenSource.TAG if sender is Tag else SearchTokenSource.CATEGORY
+    _rebuild_search_tokens(instance.studygroups.all(), source)
+
+
+@receiver(pre_delete, sender=Tag)
+@receiver(pre_delete, sender=Category)
+def remember_deleted_relation_studygroups(
+    sender: type[Tag | Category], instance: Tag | Category, **kwargs: Any
+) -> None:
+    instance._deleted_studygroups = list(instance.studygroups.all())  # type: ignore
+
+
+@receiver(post_delete, sender=Tag)
+@receiver(post_delete, sender=Category)
+def reindex_deleted_relation(
+    sender: type[Tag | Category], instance: Tag | Category, **kwargs: Any
+) -> None:
+    """
+    태그, 카테고리가 삭제되면 연결되어 있던 스터디그룹들의 검색 토큰을 다시 만듭니다.
+    """
+    source = SearchTokenSource.TAG if sender is Tag else SearchTokenSource.CATEGORY
+    _rebuild_search_tokens(getattr(instance, "_deleted_studygroups", []), source)
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(post_delete, sender=StudyGroup)
+def invalidate_tag_pool(sender: type[Model], **kwargs: Any) -> None:
+    """
+    태그가 바뀌거나 스터디그룹이 삭제되면, 랜덤 태그 목록에 사용하는 tag_pool 을 비웁니다.
+    """
+    tag_pool.invalidate()
+
+
+@receiver(post_save, sender=StudyGroup)
+@receiver(post_delete, sender=StudyGroup)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(m2m_changed, sender=StudyGroup.tags.through)
+@receiver(m2m_changed, sender=StudyGroup.categories.through)
+def bump_studies_version_on_change(
+    sender: type[Model], action: str | None = None, **kwargs: Any
+) -> None:
+    """
+    스터디그룹 목록에 보이는 정보가 바뀌면 목록 버전을 올려, 캐시된 목록 응답을 무효화합니다.
+    """
+    if action is None or action in ("post_add", "post_remove", "post_clear"):
+        bump_studies_version()
+
+
+@receiver(post_save, sender=User)
+def bump_leading_studygroup_versions(
+    sender: type[User], instance: User, created: bool, raw: bool, **kwargs: Any
+) -> None:
+    """
+    유저 정보가 바뀌면, 유저가 리더인 스터디그룹들의 버전을 올립니다. (상세 정보에 리더 프로필이 보입니다.)
+    """
+    if created or raw:
+        return
+    bump_studygroup_versions(
+        StudyGroupMember.objects.filter(user=instance, is_leader=True).values_list(
+            "studygroup_id", flat=True
+        )
+    )
+
+
+@receiver(m2m_changed, sender=StudyGroup.tags.through)
+@receiver(m2m_changed, sender=StudyGroup.categories.through)
+def bump_relation_studygroup_versions(
+    sender: type[Model],
+    instance: Model,
+    action: str,
+    reverse: bool,
+    pk_set: set[int] | None,
+    **kwargs: Any,
+) -> None:
+    """
+    스터디그룹의 태그, 카테고리 연결이 바뀌면 영향을 받는 스터디그룹들의 버전을 올립니다.
+    """
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        bump_studygroup_versions([instance.pk])
+    elif action == "post_clear":
+        bump_studygroup_versions(
+            studygroup.pk
+            for studygroup in getattr(instance, "_cleared_studygroups", [])
+        )
+    else:
+        bump_studygroup_versions(pk_set or [])
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_save, sender=Category)
+def bump_renamed_relation_studygroup_versions(
+    sender: type[Tag | Category],
+    instance: Tag | Category,
+    created: bool,
+    raw: bool,
+    **kwargs: Any,
+) -> None:
+    """
+    태그, 카테고리의 이름이 바뀌면 연결된 스터디그룹들의 버전을 올립니다.
+    """
+    if created or raw:
+        return
+    bump_studygroup_versions(instance.studygroups.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Tag)
+@receiver(post_delete, sender=Category)
+def bump_deleted_relation_studygroup_versions(
+    sender: type[Tag | Category], instance: Tag | Category, **kwargs: Any
+) -> None:
+    bump_studygroup_versions(
+        studygroup.pk for studygroup in getattr(instance, "_deleted_studygroups", [])
+    )
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_catalogue(sender: type[Model], **kwargs: Any) -> None:
+    """
+    카테고리가 바뀌면, 카테고리 목록에 사용하는 category_catalogue 를 비웁니다.
+    """
+    category_catalogue.invalidate()
+
+
+@receiver(post_delete, sender=StudyGroup)
+def invalidate_deleted_studygroup(
+    sender: type[StudyGroup], instance: StudyGroup, **kwargs: Any
+) -> None:
+    membership_cache.invalidate(membership_cache.studygroup_key(instance.uuid))
+
+
+@receiver(post_save, sender=StudyGroupUserRelation)
+@receiver(post_delete, sender=StudyGroupUserRelation)
+def invalidate_my_studygroup_counts(
+    sender: type[StudyGroupUserRelation],
+    instance: StudyGroupUserRelation,
+    **kwargs: Any,
+) -> None:
+    """
+    유저와 스터디그룹의 관계가 바뀌면, 캐시된 유저의 스터디그룹 수를 지웁니다.
+    """
+    my_studygroup_counts_cache.invalidate(instance.user_id)
@@ -51,3 +51,18 @@ class AssignmentCreateTestCase(APITestCase):
 
         response = self.client.post(url, data)
         self.assertEqual(response.status_code, 201, f"response: {response.data}")
+
+    def test_create_assignment_query_count(self):
+        """
+        권한 확인과 과제 생성에서 스터디그룹, 멤버 정보를 한 번만 조회합니다.
+        스터디그룹과 멤버 정보 조회 1번, 과제 생성 1번입니다.
+        """
+        self.client.force_authenticate(self.studygroup.leaders[0].user)
+        url = reverse(
+            "assignment-request-list",
+            kwargs={"studygroup_uuid": self.studygroup.uuid},
+        )
+        data = {"title": "test title", "content": "test content"}
+        with self.assertNumQueries(2):
+            response = self.client.post(url, data)
+        self.assertEqual(response.status_code, 201, f"response: {response.data}")
@@ -0,0 +1,85 @@
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from apps.studygroup.models import AssignmentSubmission
+from apps.studygroup.tests.factories import (
+    AssignmentRequestFactory,
+    ClosedByDeadlineStudyGroupFactory,
+    StudyGroupGeneralMemberFactory,
+)
+
+
+class AssignmentSubmissionUpdateDeleteTestCase(APITestCase):
+    """
+    과제 제출 수정, 삭제 API 테스트
+    """
+
+    def setUp(self) -> None:
+        self.studygroup = ClosedByDeadlineStudyGroupFactory()
+        self.author = StudyGroupGeneralMemberFactory(studygroup=self.studygroup)
+        self.another_member = StudyGroupGeneralMemberFactory(studygroup=self.studygroup)
+        self.assignment = AssignmentRequestFactory(
+            studygroup=self.studygroup, author=self.studygroup.leaders[0]
+        )
+        self.submission = AssignmentSubmission.objects.create(
+            studygroup=self.studygroup,
+            author=self.author,
+            assignment=self.assignment,
+            title="제출합니다.",
+            content="과제 내용입니다.",
+        )
+        self.url = reverse(
+            "assignment-submission-detail",
+            kwargs={
+                "studygroup_uuid": self.studygroup.uuid,
+                "assignment_id": self.assignment.id,
+                "submission_id": self.submission.id,
+            },
+        )
+
+    def test_only_author_can_update_submission(self):
+        self.client.force_authenticate(user=self.another_member.user)
+        response = self.client.put(self.url, {"title": "수정", "content": "수정"})
+        self.assertEqual(response.status_code, 403, f"response: {response.data}")
+
+    def test_update_submission_query_count(self):
+        """
+        스터디그룹과 멤버 정보 조회 1번, 과제 제출(작성자 포함) 조회 1번, 수정 1번입니다.
+        """
+        self.client.force_authenticate(user=self.author.user)
+        with self.assertNumQueries(3):
+            response = self.client.put(self.url, {"title": "수정", "content": "수정"})
+        self.assertEqual(response.status_code, 200, f"response: {response.data}")
+        self.submission.refresh_from_db()
+        self.assertEqual(self.submission.title, "수정")
+
+    def test_destroy_submission_query_count(self):
+        """
+        스터디그룹과 멤버 정보 조회 1번, 과제 제출(작성자 포함) 조회 1번, 삭제 1번입니다.
+        """
+        self.client.force_authenticate(user=self.author.user)
+        with self.assertNumQueries(3):
+            response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(AssignmentSubmission.objects.exists())
+
+    def test_leader_can_destroy_submission(self):
+        self.client.force_authenticate(user=self.studygroup.leaders[0].user)
+        response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, 204)
+
+    def test_submission_of_another_assignment_is_not_found(self):
+        another_assignment = AssignmentRequestFactory(
+            studygroup=self.studygroup, author=self.studygroup.leaders[0]
+        )
+        url = reverse(
+            "assignment-submission-detail",
+            kwargs={
+                "studygroup_uuid": self.studygroup.uuid,
+                "assignment_id": another_assignment.id,
+                "submission_id": self.submission.id,
+            },
+        )
+        self.client.force_authenticate(user=self.author.user)
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, 404)
@@ -2,8 +2,12 @@ from rest_framework import status
 from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
 
+from apps.studygroup.caches import CategoryCatalogue
 from apps.studygroup.models import Category
-from apps.studygroup.tests.factories import CategoryFactory
+from apps.studygroup.tests.factories import (
+    CategoryFactory,
+    OpenedByDeadlineStudyGroupFactory,
+)
 
 
 class CategoryTestCase(APITestCase):
@@ -30,3 +34,42 @@ class CategoryTestCase(APITestCase):
             ],
             f"response: {response.data}",
         )
+
+    def test_read_categories_without_query_when_cached(self):
+        url = reverse("category-list")
+        self.client.get(url)
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(len(response.data), 3, f"response: {response.data}")
+
+    def test_categories_cache_is_invalidated(self):
+        url = reverse("category-list")
+        self.client.get(url)
+        CategoryFactory(name="모바일")
+        response = self.client.get(url)
+        self.assertEqual(response.data[-1], {"name": "모바일"})
+
+    def test_categories_cache_is_invalidated_in_other_processes(self):
+        """
+        다른 프로세스(워커)의 category_catalogue 도 공유 캐시의 버전으로 다시 불러와야 합니다.
+        """
+        other_process_catalogue = CategoryCatalogue()
+        other_process_catalogue.get()
+        Category.objects.get(name="데브옵스").delete()
+        self.assertEqual(
+            [category.name for category in other_process_catalogue.get()],
+            ["백엔드", "프론트엔드"],
+        )
+
+    def test_studygroups_count_in_one_query(self):
+        """
+        카테고리별 스터디그룹 수는 하나의 쿼리로 조회됩니다.
+        """
+        studygroup = OpenedByDeadlineStudyGroupFactory()
+        studygroup.categories.add(*Category.objects.filter(name__in=["백엔드", "데브옵스"]))
+        with self.assertNumQueries(1):
+            counts = {
+                category.name: category.related_studygroups_count
+                for category in Category.objects.with_studygroups_count()
+            }
+        self.assertEqual(counts, {"백엔드": 1, "프론트엔드": 0, "데브옵스": 1})
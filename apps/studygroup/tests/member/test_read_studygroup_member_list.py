@@ -1,6 +1,7 @@
 from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
 
+from apps.studygroup.caches import membership_cache
 from apps.studygroup.tests.factories import (
     OpenedByDeadlineStudyGroupFactory,
     StudyGroupGeneralMemberFactory,
@@ -117,3 +118,60 @@ class StudyGroupMemberReadTestCase(APITestCase):
         self.client.force_authenticate(user=self.another_studygroup.leaders[0].user)
         response = self.client.get(url)
         self.assertEqual(response.status_code, 403, f"response: {response.data}")
+
+    def test_read_studygroup_member_query_count(self):
+        """
+        권한 확인과 목록 조회에서 스터디그룹, 멤버 정보를 한 번만 조회합니다.
+        스터디그룹과 멤버 정보 조회 1번, 멤버 목록 조회 1번(유저 포함)입니다.
+        """
+        url = reverse(
+            "studygroupmember-list",
+            kwargs={"studygroup_uuid": self.studygroup_for_read.uuid},
+        )
+        self.client.force_authenticate(user=self.general_member.user)
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, f"response: {response.data}")
+        self.assertEqual(len(response.data), 2)
+
+    def test_read_not_existing_studygroup_member(self):
+        url = reverse(
+            "studygroupmember-list",
+            kwargs={"studygroup_uuid": "00000000-0000-0000-0000-000000000000"},
+        )
+        self.client.force_authenticate(user=self.general_member.user)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 404, f"response: {response.data}")
+
+    def test_membership_is_cached_and_invalidated(self):
+        """
+        멤버 정보는 캐시되어 권한 확인 시 DB 를 조회하지 않고, 멤버가 탈퇴하면 캐시가 지워집니다.
+        """
+        url = reverse(
+            "studygroupmember-list",
+            kwargs={"studygroup_uuid": self.studygroup_for_read.uuid},
+        )
+        self.client.force_authenticate(user=self.general_member.user)
+        self.client.get(url)
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, f"response: {response.data}")
+
+        self.general_member.delete()
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 403, f"response: {response.data}")
+
+    def test_membership_is_read_from_shared_cache_after_local_expiry(self):
+        """
+        프로세스 메모리 LRU 의 항목이 만료되어도, 공유 캐시에서 읽어 권한 확인 시 DB 를 조회하지 않습니다.
+        """
+        url = reverse(
+            "studygroupmember-list",
+            kwargs={"studygroup_uuid": self.studygroup_for_read.uuid},
+        )
+        self.client.force_authenticate(user=self.general_member.user)
+        self.client.get(url)
+        membership_cache.local.clear()
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, f"response: {response.data}")
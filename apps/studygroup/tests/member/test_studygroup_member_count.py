@@ -0,0 +1,107 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.utils.datetime_safe import date
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from apps.studygroup.models import StudyGroup
+from apps.studygroup.tests.factories import (
+    CategoryFactory,
+    OpenedByDeadlineStudyGroupFactory,
+    StudyGroupGeneralMemberFactory,
+    StudyGroupMemberRequestFactory,
+    UserFactory,
+)
+
+
+class StudyGroupMemberCountTestCase(APITestCase):
+    """
+    스터디그룹에 저장된 인원 수(member_count)가 멤버 변경과 함께 갱신되는지 테스트합니다.
+    """
+
+    def setUp(self) -> None:
+        self.studygroup = OpenedByDeadlineStudyGroupFactory(member_limit=3)
+        self.leader = self.studygroup.leaders[0]
+        self.general_member = StudyGroupGeneralMemberFactory(studygroup=self.studygroup)
+
+    def test_member_count_after_create_studygroup(self):
+        """
+        스터디그룹을 생성하면, 스터디그룹장이 첫 번째 멤버로 집계됩니다.
+        """
+        CategoryFactory(name="Django")
+        self.client.force_authenticate(user=UserFactory())
+        data = {
+            "post_title": "스터디그룹 개설합니다.",
+            "post_content": "Django 스터디그룹입니다.",
+            "study_name": "Django 스터디",
+            "start_date": date.today() + timedelta(days=7),
+            "end_date": date.today() + timedelta(days=14),
+            "deadline": date.today() + timedelta(days=3),
+            "member_limit": 10,
+            "categories": "Django",
+        }
+        response = self.client.post(reverse("studygroup-list"), data=data)
+        self.assertEqual(response.status_code, 201, f"response: {response.data}")
+        self.assertEqual(response.data["current_member_count"], 1)
+        studygroup = StudyGroup.objects.get(uuid=response.data["uuid"])
+        self.assertEqual(studygroup.member_count, 1)
+
+    def test_member_count_after_approve_and_delete_member(self):
+        """
+        가입 요청을 승인하면 인원 수가 늘고, 멤버를 탈퇴시키면 인원 수가 줄어듭니다.
+        """
+        self.studygroup.refresh_from_db()
+        self.assertEqual(self.studygroup.member_count, 2)
+
+        member_request = StudyGroupMemberRequestFactory(studygroup=self.studygroup)
+        self.client.force_authenticate(user=self.leader.user)
+        response = self.client.post(
+            reverse(
+                "studygroupmember-request-detail",
+                kwargs={
+                    "studygroup_uuid": self.studygroup.uuid,
+                    "pk": member_request.pk,
+                },
+            )
+        )
+        self.assertEqual(response.status_code, 201, f"response: {response.data}")
+        self.studygroup.refresh_from_db()
+        self.assertEqual(self.studygroup.member_count, 3)
+        self.assertTrue(StudyGroup.objects.closed().filter(pk=self.studygroup.pk))
+
+        response = self.client.delete(
+            reverse(
+                "studygroupmember-detail",
+                kwargs={
+                    "studygroup_uuid": self.studygroup.uuid,
+                    "pk": self.general_member.pk,
+                },
+            )
+        )
+        self.assertEqual(response.status_code, 204)
+        self.studygroup.refresh_from_db()
+        self.assertEqual(self.studygroup.member_count, 2)
+        self.assertTrue(StudyGroup.objects.opened().filter(pk=self.studygroup.pk))
+
+    def test_update_studygroup_does_not_overwrite_member_count(self):
+        """
+        오래된 인스턴스로 스터디그룹을 수정해도 인원 수가 덮어써지지 않습니다.
+        """
+        stale_studygroup = StudyGroup.objects.get(pk=self.studygroup.pk)
+        StudyGroupGeneralMemberFactory(studygroup=self.studygroup)
+        stale_studygroup.title = "수정된 제목"
+        stale_studygroup.save()
+        self.studygroup.refresh_from_db()
+        self.assertEqual(self.studygroup.title, "수정된 제목")
+        self.assertEqual(self.studygroup.member_count, 3)
+
+    def test_rebuild_member_counts_command(self):
+        """
+        rebuild_member_counts 커맨드는 인원 수를 실제 멤버 수로 다시 계산합니다.
+        """
+        StudyGroup.objects.update(member_count=0)
+        call_command("rebuild_member_counts", batch_size=1, stdout=StringIO())
+        self.studygroup.refresh_from_db()
+        self.assertEqual(self.studygroup.member_count, 2)
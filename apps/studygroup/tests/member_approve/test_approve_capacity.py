@@ -0,0 +1,180 @@
+import threading
+from unittest import mock
+
+from django.db import connection
+from django.db.models import QuerySet
+from django.test import TransactionTestCase, skipUnlessDBFeature
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from apps.studygroup.models import StudyGroup, StudyGroupMember
+from apps.studygroup.tests.factories import (
+    OpenedByDeadlineStudyGroupFactory,
+    StudyGroupGeneralMemberFactory,
+    StudyGroupMemberRequestFactory,
+)
+
+
+def approve_url(studygroup, studygroup_request) -> str:
+    return reverse(
+        "studygroupmember-request-detail",
+        kwargs={"studygroup_uuid": studygroup.uuid, "pk": studygroup_request.pk},
+    )
+
+
+class ApproveStudyGroupMemberCapacityTestCase(APITestCase):
+    """
+    스터디그룹 가입 승인 시 정원 확인 테스트
+    """
+
+    def setUp(self) -> None:
+        self.studygroup = OpenedByDeadlineStudyGroupFactory(member_limit=2)
+        self.leader = self.studygroup.leaders[0].user
+        self.studygroup_request = StudyGroupMemberRequestFactory(
+            studygroup=self.studygroup
+        )
+        self.client.force_authenticate(user=self.leader)
+
+    def test_cannot_approve_when_studygroup_is_full(self):
+        StudyGroupGeneralMemberFactory(studygroup=self.studygroup)
+        response = self.client.post(
+            approve_url(self.studygroup, self.studygroup_request)
+        )
+        self.assertEqual(response.status_code, 400, f"response: {response.data}")
+        self.assertEqual(self.studygroup.members.count(), 2)
+        self.studygroup_request.refresh_from_db()
+        self.assertFalse(self.studygroup_request.processed)
+
+    def test_cannot_approve_processed_request_twice(self):
+        url = approve_url(self.studygroup, self.studygroup_request)
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, 201, f"response: {response.data}")
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, 400, f"response: {response.data}")
+        self.assertEqual(self.studygroup.members.count(), 2)
+
+    def test_cannot_approve_existing_member(self):
+        StudyGroupMember.objects.create(
+            user=self.studygroup_request.user, studygroup=self.studygroup
+        )
+        response = self.client.post(
+            approve_url(self.studygroup, self.studygroup_request)
+        )
+        self.assertEqual(response.status_code, 400, f"response: {response.data}")
+        self.assertEqual(self.studygroup.members.count(), 2)
+        self.studygroup_request.refresh_from_db()
+        self.assertFalse(self.studygroup_request.processed)
+
+    def test_cannot_approve_request_of_another_studygroup(self):
+        another_request = StudyGroupMemberRequestFactory(
+            studygroup=OpenedByDeadlineStudyGroupFactory()
+        )
+        response = self.client.post(approve_url(self.studygroup, another_request))
+        self.assertEqual(response.status_code, 404, f"response: {response.data}")
+
+
+class ApproveStudyGroupMemberLockTestCase(APITestCase):
+    """
+    가입 승인이 스터디그룹 행을 잠근 뒤에 읽은 인원 수로 정원을 확인하는지 테스트합니다.
+    SQLite 에서도 실행되도록, 잠금을 얻기 직전에 다른 승인이 커밋된 상황을 mock 으로 만듭니다.
+    """
+
+    def setUp(self) -> None:
+        self.studygroup = OpenedByDeadlineStudyGroupFactory(member_limit=2)
+        self.leader = self.studygroup.leaders[0].user
+        self.studygroup_request = StudyGroupMemberRequestFactory(
+            studygroup=self.studygroup
+        )
+        self.client.force_authenticate(user=self.leader)
+
+    def _approve_after_concurrent_approval(self, url: str, data=None):
+        """
+        스터디그룹 행의 잠금을 기다리는 동안 다른 승인이 마지막 자리를 채우고 커밋된 것처럼,
+        select_for_update() 가 호출될 때 멤버를 추가합니다.
+        """
+        locked_models = []
+        select_for_update = QuerySet.select_for_update
+
+        def record_lock(queryset, *args, **kwargs):
+            if queryset.model is StudyGroup and StudyGroup not in locked_models:
+                with mock.patch.object(
+                    QuerySet, "select_for_update", select_for_update
+                ):
+                    StudyGroupGeneralMemberFactory(studygroup=self.studygroup)
+            locked_models.append(queryset.model)
+            return select_for_update(queryset, *args, **kwargs)
+
+        with mock.patch.object(QuerySet, "select_for_update", record_lock):
+            response = self.client.post(url, data, "json")
+        return response, locked_models
+
+    def test_approve_checks_capacity_after_locking_studygroup(self):
+        response, locked_models = self._approve_after_concurrent_approval(
+            approve_url(self.studygroup, self.studygroup_request)
+        )
+        self.assertEqual(response.status_code, 400, f"response: {response.data}")
+        # 요청 행보다 스터디그룹 행을 먼저 잠가야, 승인끼리 같은 순서로 기다립니다.
+        self.assertEqual(locked_models[0], StudyGroup)
+        self.assertIn(type(self.studygroup_request), locked_models)
+        self.assertFalse(
+            self.studygroup.members.filter(user=self.studygroup_request.user).exists()
+        )
+        self.studygroup_request.refresh_from_db()
+        self.assertFalse(self.studygroup_request.processed)
+
+    def test_bulk_approve_checks_capacity_after_locking_studygroup(self):
+        response, locked_models = self._approve_after_concurrent_approval(
+            reverse(
+                "studygroupmember-request-bulk",
+                kwargs={"studygroup_uuid": self.studygroup.uuid},
+            ),
+            {"ids": [self.studygroup_request.pk], "action": "approve"},
+        )
+        self.assertEqual(response.status_code, 200, f"response: {response.data}")
+        self.assertEqual(
+            [item["result"] for item in response.data["results"]], ["full"]
+        )
+        self.assertEqual(locked_models[0], StudyGroup)
+        self.assertEqual(self.studygroup.members.count(), 2)
+
+
+@skipUnlessDBFeature("has_select_for_update")
+class ConcurrentApproveStudyGroupMemberTestCase(TransactionTestCase):
+    """
+    같은 스터디그룹에 동시에 가입 승인을 해도 정원을 넘지 않아야 합니다.
+    SQLite 는 select_for_update 를 지원하지 않으므로 건너뜁니다.
+    (잠금 순서와 잠근 뒤의 정원 확인은 ApproveStudyGroupMemberLockTestCase 에서 확인합니다.)
+    """
+
+    def test_concurrent_approvals_do_not_exceed_member_limit(self):
+        studygroup = OpenedByDeadlineStudyGroupFactory(member_limit=3)
+        leader = studygroup.leaders[0].user
+        requests = StudyGroupMemberRequestFactory.create_batch(5, studygroup=studygroup)
+        barrier = threading.Barrier(len(requests))
+        status_codes = []
+
+        def approve(studygroup_request) -> None:
+            client = APIClient()
+            client.force_authenticate(user=leader)
+            try:
+                barrier.wait()
+                response = client.post(approve_url(studygroup, studygroup_request))
+                status_codes.append(response.status_code)
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=approve, args=(studygroup_request,))
+            for studygroup_request in requests
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(status_codes), [201, 201, 400, 400, 400])
+        self.assertEqual(
+            StudyGroupMember.objects.filter(studygroup=studygroup).count(), 3
+        )
+        studygroup.refresh_from_db()
+        self.assertEqual(studygroup.member_count, 3)
@@ -0,0 +1,169 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from apps.studygroup.caches import get_studygroup_version
+from apps.studygroup.models import StudyGroupMember, StudyGroupUserRelation
+from apps.studygroup.models.member import Relationship
+from apps.studygroup.tests.factories import (
+    OpenedByDeadlineStudyGroupFactory,
+    StudyGroupGeneralMemberFactory,
+    StudyGroupMemberRequestFactory,
+)
+
+
+class BulkManageStudyGroupMemberRequestTestCase(APITestCase):
+    """
+    스터디그룹 가입 요청 일괄 승인/거절 테스트
+    """
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.studygroup = OpenedByDeadlineStudyGroupFactory(member_limit=3)
+        self.leader = self.studygroup.leaders[0].user
+        self.studygroup_requests = StudyGroupMemberRequestFactory.create_batch(
+            3, studygroup=self.studygroup
+        )
+        self.url = reverse(
+            "studygroupmember-request-bulk",
+            kwargs={"studygroup_uuid": self.studygroup.uuid},
+        )
+
+    def _post(self, ids: list[int], action: str):
+        self.client.force_authenticate(user=self.leader)
+        return self.client.post(self.url, {"ids": ids, "action": action}, "json")
+
+    def _relationship(self, studygroup_request) -> str:
+        return StudyGroupUserRelation.objects.get(
+            user_id=studygroup_request.user_id, studygroup=self.studygroup
+        ).relationship
+
+    def test_general_member_cannot_bulk_manage(self):
+        self.client.force_authenticate(
+            user=StudyGroupGeneralMemberFactory(studygroup=self.studygroup).user
+        )
+        response = self.client.post(
+            self.url, {"ids": [self.studygroup_requests[0].pk], "action": "approve"}
+        )
+        self.assertEqual(response.status_code, 403, f"response: {response.data}")
+
+    def test_bulk_approve_respects_member_limit(self):
+        """
+        남은 자리(2명)만큼만 승인되고, 다른 스터디그룹의 요청은 not_found 로 처리됩니다.
+        """
+        another_request = StudyGroupMemberRequestFactory(
+            studygroup=OpenedByDeadlineStudyGroupFactory()
+        )
+        ids = [r.pk for r in self.studygroup_requests] + [another_request.pk]
+        response = self._post(ids, "approve")
+        self.assertEqual(response.status_code, 200, f"response: {response.data}")
+        self.assertEqual(
+            [item["result"] for item in response.data["results"]],
+            ["approved", "approved", "full", "not_found"],
+        )
+
+        self.studygroup.refresh_from_db()
+        self.assertEqual(self.studygroup.member_count, 3)
+        self.assertTrue(self.studygroup.is_closed)
+        self.assertEqual(self.studygroup.members.count(), 3)
+        approved, _, full = self.studygroup_requests
+        approved.refresh_from_db()
+        full.refresh_from_db()
+        self.assertTrue(approved.processed and approved.is_approved)
+        self.assertFalse(full.processed)
+        self.assertEqual(self._relationship(approved), Relationship.MEMBER)
+        self.assertEqual(self._relationship(full), Relationship.REQUESTED)
+
+        another_request.refresh_from_db()
+        self.assertFalse(another_request.processed)
+
+    def test_bulk_approve_updates_relations_in_place(self):
+        """
+        bulk 승인은 단건 승인처럼 기존 관계 행을 수정하므로, 행과 created_at 이 유지되어야 합니다.
+        """
+        studygroup_request = self.studygroup_requests[0]
+        relation = StudyGroupUserRelation.objects.get(
+            user_id=studygroup_request.user_id, studygroup=self.studygroup
+        )
+        self._post([studygroup_request.pk], "approve")
+        approved = StudyGroupUserRelation.objects.get(pk=relation.pk)
+        self.assertEqual(approved.relationship, Relationship.MEMBER)
+        self.assertEqual(approved.created_at, relation.created_at)
+        self.assertGreater(approved.updated_at, relation.updated_at)
+
+    def test_approved_member_can_access_studygroup(self):
+        """
+        승인된 유저는 캐시된 멤버 정보와 관계 없이 바로 멤버로 인정됩니다.
+        """
+        studygroup_request = self.studygroup_requests[0]
+        members_url = reverse(
+            "studygroupmember-list", kwargs={"studygroup_uuid": self.studygroup.uuid}
+        )
+        self.client.force_authenticate(user=studygroup_request.user)
+        self.assertEqual(self.client.get(members_url).status_code, 403)
+
+        self._post([studygroup_request.pk], "approve")
+        self.client.force_authenticate(user=studygroup_request.user)
+        self.assertEqual(self.client.get(members_url).status_code, 200)
+
+    def test_bulk_approve_bumps_studygroup_version(self):
+        """
+        bulk 승인도 멤버 추가 signal 과 같은 부수 효과(스터디그룹 상세 버전 등)를 적용해야 합니다.
+        """
+        version = get_studygroup_version(self.studygroup.pk)
+        self._post([self.studygroup_requests[0].pk], "approve")
+        self.assertNotEqual(get_studygroup_version(self.studygroup.pk), version)
+
+    def test_bulk_reject(self):
+        ids = [r.pk for r in self.studygroup_requests]
+        response = self._post(ids, "reject")
+        self.assertEqual(response.status_code, 200, f"response: {response.data}")
+        self.assertEqual(
+            [item["result"] for item in response.data["results"]], ["rejected"] * 3
+        )
+        for studygroup_request in self.studygroup_requests:
+            studygroup_request.refresh_from_db()
+            self.assertTrue(studygroup_request.processed)
+            self.assertFalse(studygroup_request.is_approved)
+            self.assertEqual(
+                self._relationship(studygroup_request), Relationship.DISAPPROVED
+            )
+        self.assertEqual(self.studygroup.members.count(), 1)
+
+    def test_processed_request_and_existing_member_are_skipped(self):
+        rejected, member_request, _ = self.studygroup_requests
+        self._post([rejected.pk], "reject")
+        StudyGroupMember.objects.create(
+            user=member_request.user, studygroup=self.studygroup
+        )
+        response = self._post([rejected.pk, member_request.pk], "approve")
+        self.assertEqual(
+            [item["result"] for item in response.data["results"]],
+            ["already_processed", "already_member"],
+        )
+
+    def test_invalid_payload(self):
+        response = self._post([], "approve")
+        self.assertEqual(response.status_code, 400, f"response: {response.data}")
+        response = self._post([self.studygroup_requests[0].pk], "delete")
+        self.assertEqual(response.status_code, 400, f"response: {response.data}")
+
+    def test_query_count_does_not_grow_with_request_count(self):
+        self.studygroup.member_limit = 30
+        self.studygroup.save()
+        few = StudyGroupMemberRequestFactory.create_batch(2, studygroup=self.studygroup)
+        many = StudyGroupMemberRequestFactory.create_batch(
+            20, studygroup=self.studygroup
+        )
+
+        self._post([], "approve")  # 리더 권한 확인 결과를 캐시합니다.
+        with CaptureQueriesContext(connection) as few_queries:
+            self._post([r.pk for r in few], "approve")
+        with CaptureQueriesContext(connection) as many_queries:
+            response = self._post([r.pk for r in many], "approve")
+        self.assertEqual(
+            [item["result"] for item in response.data["results"]], ["approved"] * 20
+        )
+        self.assertEqual(len(many_queries), len(few_queries))
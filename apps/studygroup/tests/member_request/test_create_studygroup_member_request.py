@@ -1,10 +1,22 @@
+import uuid
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest import mock
+
+from django.db import IntegrityError, connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils.datetime_safe import date
 from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
 
+from apps.accounts.models import User
+from apps.studygroup.models import StudyGroup, StudyGroupMemberRequest
+from apps.studygroup.serializers import StudyGroupMemberRequestCreateSerializer
 from apps.studygroup.tests.factories import (
     ClosedByDeadlineStudyGroupFactory,
     OpenedByDeadlineStudyGroupFactory,
     StudyGroupGeneralMemberFactory,
+    StudyGroupMemberRequestFactory,
     UserFactory,
 )
 
@@ -83,3 +95,116 @@ class StudyGroupMemberRequestCreateTestCase(APITestCase):
         self.client.force_authenticate(user=self.logged_in_user)
         response = self.client.post(url, data=data)
         self.assertEqual(response.status_code, 400, f"response: {response.data}")
+
+    def test_validation_runs_single_query(self):
+        """
+        모집 마감, 멤버 여부, 중복 요청 여부는 한 번의 쿼리로 확인합니다.
+        """
+        serializer = StudyGroupMemberRequestCreateSerializer(
+            data={"request_message": "가입 신청합니다."},
+            context={
+                "request": SimpleNamespace(user=self.logged_in_user),
+                "view": SimpleNamespace(
+                    kwargs={"studygroup_uuid": self.studygroup_for_requested.uuid}
+                ),
+            },
+        )
+        with self.assertNumQueries(1):
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(
+            serializer.validated_data["studygroup_id"],
+            self.studygroup_for_requested.pk,
+        )
+
+    def test_request_to_studygroup_past_deadline(self):
+        """
+        저장된 모집 상태가 모집 중이어도, 모집 마감일이 지났다면 가입 요청을 할 수 없습니다.
+        """
+        StudyGroup.objects.filter(pk=self.studygroup_for_requested.pk).update(
+            deadline=date.today() - timedelta(days=1)
+        )
+        url = reverse(
+            "studygroupmember-request-list",
+            kwargs={"studygroup_uuid": self.studygroup_for_requested.uuid},
+        )
+        self.client.force_authenticate(user=self.logged_in_user)
+        response = self.client.post(url, data={"request_message": "가입 신청합니다."})
+        self.assertEqual(response.status_code, 400, f"response: {response.data}")
+        self.assertFalse(self.studygroup_for_requested.requests.exists())
+
+    def test_create_request_loads_studygroup_once(self):
+        """
+        가입 요청 생성 시 스터디그룹은 serializer 의 validate 에서 한 번만 조회합니다.
+        """
+        url = reverse(
+            "studygroupmember-request-list",
+            kwargs={"studygroup_uuid": self.studygroup_for_requested.uuid},
+        )
+        self.client.force_authenticate(user=self.logged_in_user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(url, data={"request_message": "가입 신청합니다."})
+        self.assertEqual(response.status_code, 201, f"response: {response.data}")
+        tables = (StudyGroup._meta.db_table, User._meta.db_table)
+        self.assertEqual(
+            len(
+                [
+                    query
+                    for query in queries.captured_queries
+                    if any(f'FROM "{table}"' in query["sql"] for table in tables)
+                ]
+            ),
+            1,
+        )
+
+    def test_request_to_unknown_studygroup(self):
+        url = reverse(
+            "studygroupmember-request-list", kwargs={"studygroup_uuid": uuid.uuid4()}
+        )
+        self.client.force_authenticate(user=self.logged_in_user)
+        response = self.client.post(url, data={"request_message": "가입 신청합니다."})
+        self.assertEqual(response.status_code, 404, f"response: {response.data}")
+
+    def test_duplicate_request_is_rejected_by_database(self):
+        """
+        validate 이후 같은 요청이 먼저 저장되더라도, unique 제약조건으로 400 에러를 반환합니다.
+        """
+        StudyGroupMemberRequestFactory(
+            user=self.logged_in_user, studygroup=self.studygroup_for_requested
+        )
+        with transaction.atomic(), self.assertRaises(IntegrityError):
+            StudyGroupMemberRequest.objects.create(
+                user=self.logged_in_user,
+                studygroup=self.studygroup_for_requested,
+                request_message="가입 신청합니다.",
+            )
+
+        url = reverse(
+            "studygroupmember-request-list",
+            kwargs={"studygroup_uuid": self.studygroup_for_requested.uuid},
+        )
+        self.client.force_authenticate(user=self.logged_in_user)
+        with mock.patch.object(
+            StudyGroupMemberRequestCreateSerializer,
+            "validate",
+            lambda serializer, attrs: {
+                **attrs,
+                "studygroup_id": self.studygroup_for_requested.pk,
+            },
+        ):
+            response = self.client.post(url, data={"request_message": "가입 신청합니다."})
+        self.assertEqual(response.status_code, 400, f"response: {response.data}")
+        self.assertEqual(self.studygroup_for_requested.requests.count(), 1)
+
+    def test_other_integrity_error_is_not_translated(self):
+        """
+        중복 요청이 아닌 무결성 오류는 400 에러로 바꾸지 않습니다.
+        """
+        url = reverse(
+            "studygroupmember-request-list",
+            kwargs={"studygroup_uuid": self.studygroup_for_requested.uuid},
+        )
+        self.client.force_authenticate(user=self.logged_in_user)
+        with mock.patch.object(
+            StudyGroupMemberRequest, "save", side_effect=IntegrityError
+        ), self.assertRaises(IntegrityError):
+            self.client.post(url, data={"request_message": "가입 신청합니다."})
@@ -0,0 +1,66 @@
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from apps.accounts.models import User
+from apps.studygroup.models import StudyGroup, StudyGroupMemberRequest
+from apps.studygroup.tests.factories import (
+    OpenedByDeadlineStudyGroupFactory,
+    StudyGroupMemberRequestFactory,
+)
+
+
+class StudyGroupMemberRequestValidationTestCase(APITestCase):
+    """
+    스터디그룹 가입 요청 저장 시 검증 테스트
+    """
+
+    def setUp(self) -> None:
+        self.studygroup = OpenedByDeadlineStudyGroupFactory()
+        StudyGroupMemberRequestFactory(studygroup=self.studygroup)
+        self.studygroup_request = StudyGroupMemberRequest.objects.get(
+            studygroup=self.studygroup
+        )
+
+    def _related_table_queries(self, queries: CaptureQueriesContext) -> list[str]:
+        tables = (StudyGroup._meta.db_table, User._meta.db_table)
+        return [
+            query["sql"]
+            for query in queries.captured_queries
+            if any(f'FROM "{table}"' in query["sql"] for table in tables)
+        ]
+
+    def test_approved_request_must_be_processed(self):
+        """
+        is_approved 가 True 이면 processed 도 True 여야 합니다.
+        save() 는 clean() 으로, bulk 수정은 DB 의 check 제약조건으로 막습니다.
+        """
+        self.studygroup_request.is_approved = True
+        with self.assertRaises(ValidationError):
+            self.studygroup_request.save()
+
+        with transaction.atomic(), self.assertRaises(IntegrityError):
+            StudyGroupMemberRequest.objects.filter(
+                pk=self.studygroup_request.pk
+            ).update(is_approved=True)
+
+    def test_processing_request_does_not_validate_unchanged_fields(self):
+        """
+        승인, 거절처럼 상태만 바꾸는 저장은 외래 키나 다른 필드를 검증하지 않습니다.
+        """
+        StudyGroupMemberRequest.objects.filter(pk=self.studygroup_request.pk).update(
+            request_message=""
+        )
+        self.studygroup_request.refresh_from_db()
+        self.studygroup_request.processed = True
+        self.studygroup_request.is_approved = True
+        with CaptureQueriesContext(connection) as queries:
+            self.studygroup_request.save()
+        self.assertEqual(self._related_table_queries(queries), [])
+
+        self.studygroup_request.request_message = ""
+        self.studygroup_request.save()
+        self.studygroup_request.request_message = "a" * 501
+        with self.assertRaises(ValidationError):
+            self.studygroup_request.save()
@@ -1,6 +1,7 @@
 from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
 
+from apps.studygroup.caches import membership_cache
 from apps.studygroup.models import StudyGroup
 from apps.studygroup.tests.factories import (
     OpenedByDeadlineStudyGroupFactory,
@@ -50,3 +51,24 @@ class DeleteStudyGroupTestCase(APITestCase):
         response = self.client.delete(url)
         self.assertEqual(response.status_code, 204, f"response: {response.data}")
         self.assertEqual(StudyGroup.objects.count(), 0, f"response: {response.data}")
+
+    def test_delete_studygroup_with_stale_membership_cache(self):
+        """
+        캐시된 스터디그룹이 이미 삭제되었다면 404 에러를 반환합니다.
+        """
+        leader = self.studygroup_be_deleted.leaders[0]
+        url = reverse(
+            "studygroup-detail",
+            kwargs={"studygroup_uuid": self.studygroup_be_deleted.uuid},
+        )
+        uuid = str(self.studygroup_be_deleted.uuid)
+        membership_cache.set(membership_cache.studygroup_key(uuid), 0)
+        membership_cache.set(
+            membership_cache.role_key(uuid, leader.user.pk), (leader.pk, True)
+        )
+        self.client.force_authenticate(user=leader.user)
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, 404, f"response: {response.data}")
+        self.assertTrue(
+            StudyGroup.objects.filter(pk=self.studygroup_be_deleted.pk).exists()
+        )
@@ -7,6 +7,12 @@ from rest_framework.test import APITestCase
 
 from apps.accounts.models import User
 from apps.studygroup.models import Category, StudyGroup, StudyGroupMember, Tag
+from apps.studygroup.tests.factories import (
+    CategoryFactory,
+    OpenedByDeadlineStudyGroupFactory,
+    StudyGroupGeneralMemberFactory,
+    TagFactory,
+)
 from apps.studygroup.tests.utils import create_dummy_image
 
 DETAIL_FORMAT_KEYS = {
@@ -140,3 +146,98 @@ class BaseStudyGroupTestCase(APITestCase):
             LEADER_FORMAT_KEYS,
             f"response: {response.data}",
         )
+
+
+class StudyGroupDetailETagTestCase(APITestCase):
+    """
+    스터디그룹 상세 조회의 ETag / If-None-Match, 수정의 If-Match 테스트
+    """
+
+    def setUp(self) -> None:
+        self.studygroup = OpenedByDeadlineStudyGroupFactory()
+        self.studygroup.categories.add(CategoryFactory(name="백엔드"))
+        self.leader = self.studygroup.leaders[0].user
+        self.url = reverse(
+            "studygroup-detail", kwargs={"studygroup_uuid": self.studygroup.uuid}
+        )
+
+    def _update_data(self, title: str) -> dict:
+        return {
+            "post_title": title,
+            "post_content": "내용",
+            "study_name": "스터디",
+            "start_date": date.today() + timedelta(days=7),
+            "end_date": date.today() + timedelta(days=14),
+            "deadline": date.today() + timedelta(days=3),
+            "member_limit": 10,
+            "categories": "백엔드",
+        }
+
+    def test_read_detail_not_modified(self):
+        etag = self.client.get(self.url)["ETag"]
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_etag_changes_when_studygroup_changes(self):
+        etag = self.client.get(self.url)["ETag"]
+        StudyGroupGeneralMemberFactory(studygroup=self.studygroup)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+        etag = response["ETag"]
+        self.studygroup.tags.add(TagFactory(name="Django"))
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["tags"], ["Django"])
+
+    def test_update_with_stale_if_match(self):
+        """
+        다른 스터디그룹장이 먼저 수정했다면, 오래된 ETag 로는 수정할 수 없습니다.
+        """
+        self.client.force_authenticate(user=self.leader)
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.put(
+            self.url, self._update_data("첫 번째 수정"), HTTP_IF_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200, f"response: {response.data}")
+        self.assertNotEqual(response["ETag"], etag)
+
+        response = self.client.put(
+            self.url, self._update_data("두 번째 수정"), HTTP_IF_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 412, f"response: {response.data}")
+        self.studygroup.refresh_from_db()
+        self.assertEqual(self.studygroup.title, "첫 번째 수정")
+
+    def test_etag_changes_when_leaders_change(self):
+        """
+        인원 수가 같더라도 리더가 바뀌거나 리더의 프로필이 바뀌면 ETag 가 달라져야 합니다.
+        """
+        member = StudyGroupGeneralMemberFactory(studygroup=self.studygroup)
+        etag = self.client.get(self.url)["ETag"]
+        member.is_leader = True
+        member.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["leaders"]), 2)
+
+        etag = response["ETag"]
+        self.leader.username = "new-leader-name"
+        self.leader.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            "new-leader-name",
+            [leader["username"] for leader in response.data["leaders"]],
+        )
+
+    def test_etag_ignores_other_studygroups_tags(self):
+        etag = self.client.get(self.url)["ETag"]
+        other = OpenedByDeadlineStudyGroupFactory()
+        other.tags.add(TagFactory(name="Django"))
+        other.categories.add(CategoryFactory(name="프론트엔드"))
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
@@ -1,7 +1,23 @@
+from unittest.mock import patch
+
+import factory
+from django.core.cache import cache
 from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
 
-from apps.studygroup.tests.factories import OpenedByDeadlineStudyGroupFactory
+from apps.studygroup.caches import (
+    bump_studies_version,
+    get_studies_version,
+    studygroup_list_cache,
+)
+from apps.studygroup.models import StudyGroup
+from apps.studygroup.pagination import StudyGroupPagination
+from apps.studygroup.tests.factories import (
+    CategoryFactory,
+    OpenedByDeadlineStudyGroupFactory,
+    StudyGroupGeneralMemberFactory,
+    TagFactory,
+)
 
 PAGINATION_LIST_FORMAT_KEYS = {
     "next",
@@ -60,3 +76,237 @@ class StudyGroupListTestCase(APITestCase):
                     LEADERS_FORMAT_KEYS,
                     f"response: {response.data}",
                 )
+
+    def test_read_list_query_count_does_not_depend_on_page_size(self):
+        """
+        목록 조회 쿼리 수는 페이지 크기와 관계없이 일정해야 합니다.
+        스터디그룹 조회 1번, 리더(유저 포함), 태그, 카테고리 조회 각 1번입니다.
+        """
+        for studygroup in StudyGroup.objects.all():
+            studygroup.tags.add(TagFactory(name=factory.Faker("uuid4")))
+            studygroup.categories.add(CategoryFactory(name=factory.Faker("uuid4")))
+            StudyGroupGeneralMemberFactory(studygroup=studygroup)
+
+        url = reverse("studygroup-list")
+        for page_size in [1, 4, 8, 10]:
+            # 페이지 크기는 캐시 키에 포함되지 않으므로, 매번 캐시를 비워 응답을 새로 만듭니다.
+            cache.clear()
+            with patch.object(StudyGroupPagination, "page_size", page_size):
+                with self.assertNumQueries(4):
+                    response = self.client.get(url)
+            self.assertEqual(response.status_code, 200, f"response: {response.data}")
+            self.assertEqual(len(response.data["results"]), page_size)
+            for item in response.data["results"]:
+                self.assertEqual(item["current_member_count"], 2)
+                self.assertEqual(len(item["leaders"]), 1)
+                self.assertEqual(len(item["tags"]), 1)
+                self.assertEqual(len(item["categories"]), 1)
+
+
+class StudyGroupRandomListTestCase(APITestCase):
+    """
+    스터디그룹 랜덤 정렬(ordering=random) 목록 조회 API 테스트
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        OpenedByDeadlineStudyGroupFactory.create_batch(20)
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def _read_all_pages(self, params: dict) -> list[str]:
+        uuids = []
+        url = reverse("studygroup-list")
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, 200, f"response: {response.data}")
+            self.assertIsNone(response.data["previous"])
+            uuids += [item["uuid"] for item in response.data["results"]]
+            url, params = response.data["next"], {}
+        return uuids
+
+    def test_random_pages_have_no_duplicates(self):
+        uuids = self._read_all_pages({"ordering": "random", "seed": 12345})
+        self.assertEqual(len(uuids), 20)
+        self.assertEqual(
+            set(uuids),
+            {str(uuid) for uuid in StudyGroup.objects.values_list("uuid", flat=True)},
+        )
+
+    def test_random_pages_are_repeatable_with_same_seed(self):
+        first = self._read_all_pages({"ordering": "random", "seed": 2**30})
+        second = self._read_all_pages({"ordering": "random", "seed": 2**30})
+        self.assertEqual(first, second)
+
+    def test_random_order_starts_from_seed(self):
+        """
+        seed 이상인 random_key 부터 시작해, 한 바퀴 돌아 seed 미만인 random_key 로 이어집니다.
+        """
+        seed = 2**30
+        uuids = self._read_all_pages({"ordering": "random", "seed": seed})
+        expected = list(
+            StudyGroup.objects.filter(random_key__gte=seed)
+            .order_by("random_key", "pk")
+            .values_list("uuid", flat=True)
+        ) + list(
+            StudyGroup.objects.filter(random_key__lt=seed)
+            .order_by("random_key", "pk")
+            .values_list("uuid", flat=True)
+        )
+        self.assertEqual(uuids, [str(uuid) for uuid in expected])
+
+    def test_random_page_uses_one_studygroup_query(self):
+        """
+        seed 가 0 이면 모든 스터디그룹이 첫 구간에 있으므로, 일반 목록 조회와 쿼리 수가 같습니다.
+        """
+        with self.assertNumQueries(4):
+            response = self.client.get(
+                reverse("studygroup-list"), {"ordering": "random", "seed": 0}
+            )
+        self.assertEqual(len(response.data["results"]), StudyGroupPagination.page_size)
+
+    def test_invalid_seed(self):
+        response = self.client.get(
+            reverse("studygroup-list"), {"ordering": "random", "seed": "abc"}
+        )
+        self.assertEqual(response.status_code, 400, f"response: {response.data}")
+
+
+class StudyGroupListCacheTestCase(APITestCase):
+    """
+    로그인하지 않은 사용자의 스터디그룹 목록 조회 응답 캐시 테스트
+    """
+
+    def setUp(self) -> None:
+        cache.clear()
+        studygroup_list_cache.reset_stats()
+        self.studygroup = OpenedByDeadlineStudyGroupFactory()
+        self.url = reverse("studygroup-list")
+
+    def test_anonymous_list_is_cached(self):
+        response = self.client.get(
+            self.url, {"is_closed": False, "ordering": "-created_at"}
+        )
+        self.assertEqual(response["X-Cache"], "MISS")
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                self.url, {"ordering": "-created_at", "is_closed": False}
+            )
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(studygroup_list_cache.stats(), {"hit": 1, "miss": 1})
+
+    def test_stats_are_flushed_to_cache_in_batches(self):
+        for _ in range(studygroup_list_cache.stats_flush_every - 1):
+            studygroup_list_cache._count("hit")
+        self.assertIsNone(cache.get(studygroup_list_cache._stats_key("hit")))
+        studygroup_list_cache._count("miss")
+        self.assertEqual(
+            cache.get(studygroup_list_cache._stats_key("hit")),
+            studygroup_list_cache.stats_flush_every - 1,
+        )
+        self.assertEqual(
+            studygroup_list_cache.stats(),
+            {"hit": studygroup_list_cache.stats_flush_every - 1, "miss": 1},
+        )
+
+    def test_version_is_bumped_again_after_commit(self):
+        """
+        커밋 전에 이전 데이터로 캐시된 목록은, 커밋 후 버전이 한 번 더 올라가 사용되지 않습니다.
+        """
+        version = get_studies_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_studies_version()
+            bumped_version = get_studies_version()
+            self.assertNotEqual(bumped_version, version)
+        self.assertNotEqual(get_studies_version(), bumped_version)
+
+    def test_cache_is_invalidated_when_studies_change(self):
+        self.client.get(self.url)
+        StudyGroupGeneralMemberFactory(studygroup=self.studygroup)
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["results"][0]["current_member_count"], 2)
+
+        self.studygroup.tags.add(TagFactory(name="Django"))
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["results"][0]["tags"], ["Django"])
+
+    def test_authenticated_list_is_not_cached(self):
+        self.client.force_authenticate(user=self.studygroup.leaders[0].user)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200, f"response: {response.data}")
+        self.assertNotIn("X-Cache", response)
+
+    def test_random_list_without_seed_is_not_cached(self):
+        response = self.client.get(self.url, {"ordering": "random"})
+        self.assertEqual(response.status_code, 200, f"response: {response.data}")
+        self.assertNotIn("X-Cache", response)
+
+
+class StudyGroupKeysetListTestCase(APITestCase):
+    """
+    생성일, 모집 마감일이 같은 스터디그룹들이 있을 때의 커서 페이지네이션 테스트
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        OpenedByDeadlineStudyGroupFactory.create_batch(20)
+        StudyGroup.objects.update(
+            created_at=StudyGroup.objects.first().created_at,
+            deadline=StudyGroup.objects.first().deadline,
+        )
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def _read_pages(self, url: str, params: dict, link: str) -> list[list[str]]:
+        pages = []
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, 200, f"response: {response.data}")
+            pages.append([item["uuid"] for item in response.data["results"]])
+            url, params = response.data[link], {}
+        return pages
+
+    def test_pages_have_no_duplicates_with_equal_created_at(self):
+        pages = self._read_pages(reverse("studygroup-list"), {}, "next")
+        uuids = sum(pages, [])
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(len(set(uuids)), 20)
+        expected = StudyGroup.objects.order_by("-created_at", "-pk")
+        self.assertEqual(uuids, [str(item.uuid) for item in expected])
+
+    def test_pages_have_no_duplicates_with_equal_deadline(self):
+        pages = self._read_pages(
+            reverse("studygroup-list"), {"ordering": "deadline"}, "next"
+        )
+        uuids = sum(pages, [])
+        self.assertEqual(len(set(uuids)), 20)
+        expected = StudyGroup.objects.order_by("deadline", "pk")
+        self.assertEqual(uuids, [str(item.uuid) for item in expected])
+
+    def test_previous_pages(self):
+        """
+        마지막 페이지에서 이전 페이지로 돌아가면, 다음 페이지로 이동할 때와 같은 페이지들이 나옵니다.
+        """
+        url = reverse("studygroup-list")
+        next_pages = self._read_pages(url, {}, "next")
+        response = self.client.get(url)
+        while response.data["next"]:
+            response = self.client.get(response.data["next"])
+        previous_pages = self._read_pages(response.data["previous"], {}, "previous")
+        self.assertEqual(previous_pages, next_pages[-2::-1])
+
+    def test_deep_page_query_count(self):
+        response = self.client.get(reverse("studygroup-list"))
+        response = self.client.get(response.data["next"])
+        with self.assertNumQueries(4):
+            response = self.client.get(response.data["next"])
+        self.assertEqual(len(response.data["results"]), 4)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse("studygroup-list"), {"cursor": "abc"})
+        self.assertEqual(response.status_code, 404, f"response: {response.data}")
@@ -0,0 +1,82 @@
+from django.test import SimpleTestCase
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from apps.studygroup.models.search import tokenize, tokenize_query
+from apps.studygroup.tests.factories import (
+    CategoryFactory,
+    OpenedByDeadlineStudyGroupFactory,
+    TagFactory,
+)
+
+
+class TokenizeTestCase(SimpleTestCase):
+    def test_tokenize_hangul_without_spaces(self):
+        self.assertEqual(tokenize("웹개발"), {"웹", "개", "발", "웹개", "개발"})
+
+    def test_tokenize_query_hangul_without_spaces(self):
+        self.assertEqual(tokenize_query("파이썬스터디"), {"파이", "이썬", "썬스", "스터", "터디"})
+
+    def test_tokenize_query_normalizes_case_and_keeps_single_character_words(self):
+        self.assertEqual(
+            tokenize_query("Django 중 C"), {"dj", "ja", "an", "ng", "go", "중", "c"}
+        )
+
+
+class StudyGroupSearchTestCase(APITestCase):
+    """
+    스터디그룹 통합 검색(search) 테스트
+    """
+
+    def setUp(self) -> None:
+        self.python_study = OpenedByDeadlineStudyGroupFactory(
+            name="파이썬스터디", title="함께 공부해요"
+        )
+        self.django_study = OpenedByDeadlineStudyGroupFactory(
+            name="장고 스터디", title="파이썬 웹 프레임워크 장고를 공부합니다"
+        )
+        self.react_study = OpenedByDeadlineStudyGroupFactory(
+            name="리액트 모임", title="프론트엔드 공부"
+        )
+        self.react_tag = TagFactory(name="React")
+        self.react_study.tags.add(self.react_tag)
+        self.react_study.categories.add(CategoryFactory(name="프론트엔드"))
+
+    def _search(self, keyword: str) -> list[str]:
+        response = self.client.get(reverse("studygroup-list"), {"search": keyword})
+        self.assertEqual(response.status_code, 200, f"response: {response.data}")
+        return [item["study_name"] for item in response.data["results"]]
+
+    def test_search_hangul_substring(self):
+        self.assertEqual(self._search("썬스터"), ["파이썬스터디"])
+
+    def test_search_single_character(self):
+        """
+        한 글자 검색어는 띄어쓰기 없이 쓰인 단어의 일부도 찾습니다.
+        """
+        self.assertCountEqual(self._search("썬"), ["파이썬스터디", "장고 스터디"])
+
+    def test_search_requires_every_token(self):
+        self.assertEqual(self._search("장고 공부"), ["장고 스터디"])
+        self.assertEqual(self._search("장고 리액트"), [])
+
+    def test_search_is_ranked_by_match_count(self):
+        """
+        이름과 제목 모두에 일치하는 스터디그룹이 더 앞에 정렬됩니다.
+        """
+        self.python_study.title = "파이썬 기초"
+        self.python_study.save()
+        self.assertEqual(self._search("파이썬"), ["파이썬스터디", "장고 스터디"])
+
+    def test_search_tags_and_categories(self):
+        self.assertEqual(self._search("react"), ["리액트 모임"])
+        self.assertEqual(self._search("프론트"), ["리액트 모임"])
+
+    def test_search_index_follows_tag_changes(self):
+        self.react_tag.name = "Vue"
+        self.react_tag.save()
+        self.assertEqual(self._search("react"), [])
+        self.assertEqual(self._search("vue"), ["리액트 모임"])
+
+        self.react_study.tags.clear()
+        self.assertEqual(self._search("vue"), [])
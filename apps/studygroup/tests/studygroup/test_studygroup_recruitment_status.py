@@ -0,0 +1,126 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.utils.datetime_safe import date
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from apps.studygroup.models import StudyGroup
+from apps.studygroup.models.studygroup import RecruitmentStatus
+from apps.studygroup.tests.factories import (
+    ClosedByDeadlineStudyGroupFactory,
+    OpenedByDeadlineStudyGroupFactory,
+    StudyGroupGeneralMemberFactory,
+)
+
+
+class StudyGroupRecruitmentStatusTestCase(APITestCase):
+    """
+    스터디그룹에 저장된 모집 상태(recruitment_status) 테스트
+    """
+
+    def setUp(self) -> None:
+        self.opened_studygroup = OpenedByDeadlineStudyGroupFactory(member_limit=2)
+        self.closed_by_deadline_studygroup = ClosedByDeadlineStudyGroupFactory()
+
+    def test_recruitment_status_is_calculated_on_create(self):
+        self.opened_studygroup.refresh_from_db()
+        self.closed_by_deadline_studygroup.refresh_from_db()
+        self.assertEqual(
+            self.opened_studygroup.recruitment_status, RecruitmentStatus.OPEN
+        )
+        self.assertEqual(
+            self.closed_by_deadline_studygroup.recruitment_status,
+            RecruitmentStatus.CLOSED,
+        )
+
+    def test_recruitment_status_follows_member_changes(self):
+        """
+        인원이 가득 차면 마감되고, 멤버가 빠지면 다시 모집 중이 됩니다.
+        """
+        member = StudyGroupGeneralMemberFactory(studygroup=self.opened_studygroup)
+        self.opened_studygroup.refresh_from_db()
+        self.assertTrue(self.opened_studygroup.is_closed)
+
+        member.delete()
+        self.opened_studygroup.refresh_from_db()
+        self.assertFalse(self.opened_studygroup.is_closed)
+
+    def test_recruitment_status_follows_member_limit_update(self):
+        self.opened_studygroup.member_limit = 1
+        self.opened_studygroup.save()
+        self.opened_studygroup.refresh_from_db()
+        self.assertTrue(self.opened_studygroup.is_closed)
+
+    def test_recruitment_status_follows_update_fields(self):
+        """
+        update_fields 로 모집 마감일이나 모집 인원만 저장해도 모집 상태가 다시 계산되어야 합니다.
+        """
+        self.opened_studygroup.member_limit = 1
+        self.opened_studygroup.save(update_fields=["member_limit"])
+        self.opened_studygroup.refresh_from_db()
+        self.assertEqual(
+            self.opened_studygroup.recruitment_status, RecruitmentStatus.CLOSED
+        )
+
+        self.opened_studygroup.member_limit = 2
+        self.opened_studygroup.deadline = date.today() - timedelta(days=1)
+        self.opened_studygroup.save(update_fields=["member_limit"])
+        self.opened_studygroup.save(update_fields=["deadline"])
+        self.opened_studygroup.refresh_from_db()
+        self.assertEqual(
+            self.opened_studygroup.recruitment_status, RecruitmentStatus.CLOSED
+        )
+
+        self.opened_studygroup.deadline = date.today() + timedelta(days=1)
+        self.opened_studygroup.save(update_fields=["deadline"])
+        self.opened_studygroup.refresh_from_db()
+        self.assertEqual(
+            self.opened_studygroup.recruitment_status, RecruitmentStatus.OPEN
+        )
+
+    def test_filter_is_closed(self):
+        url = reverse("studygroup-list")
+        response = self.client.get(url, {"is_closed": True})
+        self.assertEqual(
+            [item["uuid"] for item in response.data["results"]],
+            [str(self.closed_by_deadline_studygroup.uuid)],
+        )
+        response = self.client.get(url, {"is_closed": False})
+        self.assertEqual(
+            [item["uuid"] for item in response.data["results"]],
+            [str(self.opened_studygroup.uuid)],
+        )
+
+    def test_expired_studygroup_is_closed_before_command_runs(self):
+        """
+        모집 마감일이 지나면, 저장된 모집 상태가 바뀌기 전에도 마감으로 보여야 합니다.
+        """
+        StudyGroup.objects.filter(pk=self.opened_studygroup.pk).update(
+            deadline=date.today() - timedelta(days=1)
+        )
+        self.opened_studygroup.refresh_from_db()
+        self.assertEqual(
+            self.opened_studygroup.recruitment_status, RecruitmentStatus.OPEN
+        )
+        self.assertTrue(self.opened_studygroup.is_closed)
+
+        url = reverse("studygroup-list")
+        response = self.client.get(url, {"is_closed": False})
+        self.assertEqual(response.data["results"], [])
+        response = self.client.get(url, {"is_closed": True})
+        self.assertEqual(len(response.data["results"]), 2)
+
+    def test_close_expired_studygroups_command(self):
+        """
+        모집 마감일이 지난 스터디그룹의 저장된 모집 상태는 close_expired_studygroups 커맨드로 마감됩니다.
+        """
+        StudyGroup.objects.filter(pk=self.opened_studygroup.pk).update(
+            deadline=date.today() - timedelta(days=1)
+        )
+        call_command("close_expired_studygroups", stdout=StringIO())
+        self.opened_studygroup.refresh_from_db()
+        self.assertEqual(
+            self.opened_studygroup.recruitment_status, RecruitmentStatus.CLOSED
+        )
@@ -3,6 +3,7 @@ from rest_framework import status
 from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
 
+from apps.studygroup.caches import WeightedTagPool, tag_pool
 from apps.studygroup.tests.factories import (
     OpenedByDeadlineStudyGroupFactory,
     TagFactory,
@@ -40,3 +41,52 @@ class TagTestCase(APITestCase):
         url = reverse("tag-list")
         response = self.client.get(url, {"random_count": 11})
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TagPoolTestCase(APITestCase):
+    """
+    랜덤 태그 목록에 사용하는 tag_pool 테스트
+    """
+
+    def setUp(self):
+        tag_pool.invalidate()
+        self.studygroup = OpenedByDeadlineStudyGroupFactory()
+        self.studygroup.tags.add(
+            *TagFactory.create_batch(3, name=factory.Faker("uuid4"))
+        )
+        self.unused_tag = TagFactory(name="unused")
+
+    def _read_tag_names(self, random_count: int) -> set[str]:
+        response = self.client.get(reverse("tag-list"), {"random_count": random_count})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {item["name"] for item in response.data}
+
+    def test_read_random_tags_without_query_when_cached(self):
+        self._read_tag_names(3)
+        with self.assertNumQueries(0):
+            self._read_tag_names(3)
+
+    def test_read_random_tags_are_distinct_and_in_use(self):
+        names = self._read_tag_names(10)
+        self.assertEqual(
+            names, set(self.studygroup.tags.values_list("name", flat=True))
+        )
+
+    def test_tag_pool_is_invalidated_when_tags_change(self):
+        self._read_tag_names(10)
+        self.studygroup.tags.add(self.unused_tag)
+        self.assertIn("unused", self._read_tag_names(10))
+
+        self.studygroup.tags.clear()
+        self.assertEqual(self._read_tag_names(10), set())
+
+    def test_tag_pool_is_invalidated_in_other_processes(self):
+        """
+        다른 프로세스(워커)의 tag_pool 도 공유 캐시의 버전으로 다시 불러와야 합니다.
+        """
+        other_process_pool = WeightedTagPool()
+        other_process_pool.get()
+        self.unused_tag.name = "renamed"
+        self.unused_tag.save()
+        self.studygroup.tags.add(self.unused_tag)
+        self.assertIn("renamed", {tag.name for tag, _ in other_process_pool.get()})
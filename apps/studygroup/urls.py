@@ -8,6 +8,7 @@ from apps.studygroup.views import (
     StudyGroupAPISet,
     StudyGroupMemberDetailAPI,
     StudyGroupMemberListAPI,
+    StudyGroupMemberRequestBulkAPI,
     StudyGroupMemberRequestDetailAPI,
     StudyGroupMemberRequestListAPI,
     TagRandomListAPI,
@@ -52,6 +53,11 @@ urlpatterns = [
         StudyGroupMemberRequestListAPI.as_view(),
         name="studygroupmember-request-list",
     ),
+    path(
+        "studies/<uuid:studygroup_uuid>/requests/bulk/",
+        StudyGroupMemberRequestBulkAPI.as_view(),
+        name="studygroupmember-request-bulk",
+    ),
     path(
         "studies/<uuid:studygroup_uuid>/requests/<int:pk>/",
         StudyGroupMemberRequestDetailAPI.as_view(),
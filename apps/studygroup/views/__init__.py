@@ -6,6 +6,7 @@ from apps.studygroup.views.category import CategoryListAPI
 from apps.studygroup.views.member import (
     StudyGroupMemberDetailAPI,
     StudyGroupMemberListAPI,
+    StudyGroupMemberRequestBulkAPI,
     StudyGroupMemberRequestDetailAPI,
     StudyGroupMemberRequestListAPI,
 )
@@ -20,6 +21,7 @@ __all__ = [
     "AssignmentSubmissionAPISet",
     "StudyGroupMemberRequestListAPI",
     "StudyGroupMemberRequestDetailAPI",
+    "StudyGroupMemberRequestBulkAPI",
     "StudyGroupMemberListAPI",
     "StudyGroupMemberDetailAPI",
 ]
@@ -6,12 +6,8 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.serializers import BaseSerializer
 
-from apps.studygroup.models import (
-    AssignmentRequest,
-    AssignmentSubmission,
-    StudyGroup,
-    StudyGroupMember,
-)
+from apps.studygroup.context import get_assignment_submission, get_studygroup_context
+from apps.studygroup.models import AssignmentRequest, AssignmentSubmission
 from apps.studygroup.pagination import StudyGroupAssignmentPagination
 from apps.studygroup.permissions.assignment import IsAssignmentSubmissionAuthor
 from apps.studygroup.permissions.studygroup import (
@@ -62,8 +58,8 @@ class AssignmentRequestAPISet(viewsets.ModelViewSet):
     pagination_class = StudyGroupAssignmentPagination
 
     def get_queryset(self) -> QuerySet[AssignmentRequest]:
-        studygroup_uuid = self.kwargs.get("studygroup_uuid")
-        return self.queryset.filter(studygroup__uuid=studygroup_uuid)
+        studygroup_id = get_studygroup_context(self.request, self).studygroup_id
+        return self.queryset.filter(studygroup_id=studygroup_id)
 
     def get_permissions(self) -> list:
         return [
@@ -120,12 +116,10 @@ class AssignmentRequestAPISet(viewsets.ModelViewSet):
         return super().create(request, *args, **kwargs)
 
     def perform_create(self, serializer) -> None:
-        studygroup_uuid = self.kwargs.get("studygroup_uuid")
-        studygroup = StudyGroup.objects.get(uuid=studygroup_uuid)
-        author = StudyGroupMember.objects.get(
-            studygroup=studygroup, user=self.request.user
+        context = get_studygroup_context(self.request, self)
+        serializer.save(
+            author_id=context.member_id, studygroup_id=context.studygroup_id
         )
-        serializer.save(author=author, studygroup=studygroup)
 
     @extend_schema(summary="스터디그룹 과제를 상세 조회합니다.")
     def retrieve(self, request, *args, **kwargs) -> Response:
@@ -159,12 +153,7 @@ class AssignmentRequestAPISet(viewsets.ModelViewSet):
         """
         멤버인지 확인합니다.
         """
-        studygroup_uuid = self.kwargs.get("studygroup_uuid")
-        if request.user.is_authenticated:
-            return StudyGroupMember.objects.filter(
-                studygroup__uuid=studygroup_uuid, user=request.user
-            ).exists()
-        return False
+        return get_studygroup_context(request, self).is_member
 
     @staticmethod
     def _get_truncate_content(content: str, truncate: int) -> str:
@@ -236,8 +225,18 @@ class AssignmentSubmissionAPISet(viewsets.ModelViewSet):
     pagination_class = StudyGroupAssignmentPagination
 
     def get_queryset(self) -> QuerySet[AssignmentSubmission]:
-        studygroup_uuid = self.kwargs.get("studygroup_uuid")
-        return self.queryset.filter(studygroup__uuid=studygroup_uuid)
+        studygroup_id = get_studygroup_context(self.request, self).studygroup_id
+        return self.queryset.filter(studygroup_id=studygroup_id).select_related(
+            "author__user"
+        )
+
+    def get_object(self) -> AssignmentSubmission:
+        """
+        권한 확인 시 조회한 과제 제출을 그대로 사용합니다.
+        """
+        submission = get_assignment_submission(self.request, self)
+        self.check_object_permissions(self.request, submission)
+        return submission
 
     def get_permissions(self) -> list:
         return [
@@ -292,11 +291,11 @@ class AssignmentSubmissionAPISet(viewsets.ModelViewSet):
         """
         과제 제출을 생성할 때, author, studygroup, assignment를 자동으로 추가합니다.
         """
-        studygroup_uuid = self.kwargs.get("studygroup_uuid")
-        studygroup = StudyGroup.objects.get(uuid=studygroup_uuid)
-        author = StudyGroupMember.objects.get(
-            studygroup=studygroup, user=self.request.user
-        )
+        context = get_studygroup_context(self.request, self)
         assignment_id = self.kwargs.get("assignment_id")
         assignment = AssignmentRequest.objects.get(id=assignment_id)
-        serializer.save(author=author, studygroup=studygroup, assignment=assignment)
+        serializer.save(
+            author_id=context.member_id,
+            studygroup_id=context.studygroup_id,
+            assignment=assignment,
+        )
@@ -6,12 +6,17 @@ from rest_framework.permissions import AllowAny
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from apps.studygroup.caches import category_catalogue
 from apps.studygroup.models import Category
 from apps.studygroup.serializers import CategoryReadSerializer
 
 
 @extend_schema(tags=["카테고리 API"])
 class CategoryListAPI(generics.ListAPIView):
+    """
+    카테고리 목록은 메모리에 캐시된 category_catalogue 에서 반환하므로, DB 를 조회하지 않습니다.
+    """
+
     pagination_class = None
     permission_classes = (AllowAny,)
     queryset = Category.objects.all()
@@ -20,3 +25,7 @@ class CategoryListAPI(generics.ListAPIView):
     @extend_schema(summary="카테고리 목록을 조회합니다.")
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         return super().get(request, *args, **kwargs)
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        serializer = self.get_serializer(category_catalogue.get(), many=True)
+        return Response(serializer.data)
@@ -1,14 +1,18 @@
 from typing import Any, Sequence
 
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.db.models import QuerySet
 from drf_spectacular.utils import extend_schema
 from rest_framework import generics, mixins
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import BasePermission, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.serializers import BaseSerializer
 
+from apps.studygroup.context import get_studygroup_context
+from apps.studygroup.membership import sync_membership
 from apps.studygroup.models import StudyGroup, StudyGroupMember, StudyGroupMemberRequest
 from apps.studygroup.permissions.studygroup import (
     IsStudygroupLeader,
@@ -16,6 +20,9 @@ from apps.studygroup.permissions.studygroup import (
 )
 from apps.studygroup.serializers import (
     StudyGroupMemberReadSerializer,
+    StudyGroupMemberRequestBulkResponseSerializer,
+    StudyGroupMemberRequestBulkResultSerializer,
+    StudyGroupMemberRequestBulkSerializer,
     StudyGroupMemberRequestCreateSerializer,
     StudyGroupMemberRequestManageSerializer,
     StudyGroupMemberRequestReadSerializer,
@@ -44,7 +51,7 @@ class StudyGroupMemberRequestListAPI(generics.ListCreateAPIView):
 
     def get_queryset(self) -> QuerySet[StudyGroupMemberRequest]:
         return self.queryset.filter(
-            studygroup__uuid=self.kwargs["studygroup_uuid"],
+            studygroup_id=get_studygroup_context(self.request, self).studygroup_id,
             is_approved=False,
             processed=False,
         )
@@ -64,11 +71,22 @@ class StudyGroupMemberRequestListAPI(generics.ListCreateAPIView):
         self, serializer: BaseSerializer[StudyGroupMemberRequest]
     ) -> None:
         """
-        스터디그룹 가입 요청을 생성합니다.
+        스터디그룹 가입 요청을 생성합니다. 스터디그룹은 serializer 의 validate 에서 확인한 값을 사용합니다.
+        validate 이후 같은 유저의 요청이 먼저 저장되었다면, unique 제약조건 위반을 400 에러로 반환합니다.
+        그 밖의 무결성 오류는 그대로 발생시킵니다.
         """
-        studygroup = StudyGroup.objects.get(uuid=self.kwargs["studygroup_uuid"])
-        serializer.save(user=self.request.user, studygroup=studygroup)
-        super().perform_create(serializer)
+        try:
+            with transaction.atomic():
+                serializer.save(user=self.request.user)
+        except IntegrityError:
+            if not StudyGroupMemberRequest.objects.filter(
+                user=self.request.user,
+                studygroup_id=serializer.validated_data["studygroup_id"],
+            ).exists():
+                raise
+            raise ValidationError(
+                StudyGroupMemberRequestCreateSerializer.DUPLICATE_REQUEST_MESSAGE
+            )
 
 
 @extend_schema(tags=["스터디그룹 가입요청 관리 API"])
@@ -79,6 +97,11 @@ class StudyGroupMemberRequestDetailAPI(
     permission_classes = (IsStudygroupLeader,)
     serializer_class = StudyGroupMemberRequestManageSerializer
 
+    def get_queryset(self) -> QuerySet[StudyGroupMemberRequest]:
+        return self.queryset.filter(
+            studygroup_id=get_studygroup_context(self.request, self).studygroup_id
+        )
+
     @extend_schema(
         summary="특정 스터디그룹의 가입 요청을 승인합니다. 해당 스터디그룹의 리더만 가능합니다.", operation_id="approve"
     )
@@ -103,16 +126,37 @@ class StudyGroupMemberRequestDetailAPI(
     ) -> None:
         """
         스터디그룹 가입 요청을 승인합니다.
-        1. 해당 요청이 승인되고, 처리되었음이 저장됩니다.
-        2. 스터디그룹의 멤버로 등록됩니다.
+        1. 스터디그룹 행을 잠그고(select_for_update) 남은 자리가 있는지 확인합니다.
+           같은 스터디그룹의 승인은 한 번에 하나씩 처리되므로, 동시에 승인해도 인원을 넘지 않습니다.
+        2. 이미 스터디그룹의 멤버라면 승인하지 않습니다.
+        3. 해당 요청이 승인되고, 처리되었음이 저장됩니다.
+        4. 스터디그룹의 멤버로 등록됩니다.
         """
-        studygroup = StudyGroup.objects.get(uuid=self.kwargs["studygroup_uuid"])
-        studygroup_request = StudyGroupMemberRequest.objects.get(pk=self.kwargs["pk"])
+        studygroup = (
+            StudyGroup.objects.select_for_update()
+            .only("member_count", "member_limit")
+            .get(pk=get_studygroup_context(self.request, self).studygroup_id)
+        )
+        studygroup_request = get_object_or_404(
+            self.get_queryset().select_for_update(), pk=self.kwargs["pk"]
+        )
+        if studygroup_request.processed:
+            raise ValidationError("The request has already been processed.")
+        if StudyGroupMember.objects.filter(
+            studygroup_id=studygroup.pk, user_id=studygroup_request.user_id
+        ).exists():
+            raise ValidationError("The user is already a member of this studygroup.")
+        if studygroup.member_count >= studygroup.member_limit:
+            raise ValidationError(
+                "The studygroup is full. You can't approve more members."
+            )
         studygroup_request.is_approved = True
         studygroup_request.processed = True
         studygroup_request.save()
         StudyGroupMember.objects.create(
-            user=studygroup_request.user, studygroup=studygroup, is_leader=False
+            user_id=studygroup_request.user_id,
+            studygroup_id=studygroup.pk,
+            is_leader=False,
         )
 
     @transaction.atomic
@@ -125,6 +169,106 @@ class StudyGroupMemberRequestDetailAPI(
         instance.save()
 
 
+@extend_schema(tags=["스터디그룹 가입요청 관리 API"])
+class StudyGroupMemberRequestBulkAPI(generics.GenericAPIView):
+    queryset = StudyGroupMemberRequest.objects.all()
+    permission_classes = (IsStudygroupLeader,)
+    serializer_class = StudyGroupMemberRequestBulkSerializer
+
+    def get_queryset(self) -> QuerySet[StudyGroupMemberRequest]:
+        return self.queryset.filter(
+            studygroup_id=get_studygroup_context(self.request, self).studygroup_id
+        )
+
+    @extend_schema(
+        summary="특정 스터디그룹의 가입 요청들을 한 번에 승인하거나 거절합니다. 해당 스터디그룹의 리더만 가능합니다.",
+        responses=StudyGroupMemberRequestBulkResponseSerializer,
+    )
+    def post(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """
+        요청별 처리 결과를 함께 반환합니다. 처리할 수 없는 요청이 있어도 나머지 요청은 처리됩니다.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = self.perform_bulk(
+            serializer.validated_data["ids"], serializer.validated_data["action"]
+        )
+        return Response(
+            StudyGroupMemberRequestBulkResponseSerializer({"results": results}).data
+        )
+
+    @transaction.atomic
+    def perform_bulk(self, ids: list[int], action: str) -> list[dict[str, Any]]:
+        """
+        가입 요청들을 한 트랜잭션에서 처리합니다.
+        1. 단건 승인과 같이 스터디그룹 행을 잠그고, 남은 자리만큼만 승인합니다.
+        2. 요청들은 bulk_update 로, 새 멤버들은 bulk_create 로 저장합니다.
+        3. bulk 연산은 signal 이 발생하지 않으므로, signal 과 같은 sync_membership 으로 관련 값들을 갱신합니다.
+        """
+        Result = StudyGroupMemberRequestBulkResultSerializer
+        studygroup = (
+            StudyGroup.objects.select_for_update()
+            .only("uuid", "member_count", "member_limit")
+            .get(pk=get_studygroup_context(self.request, self).studygroup_id)
+        )
+        studygroup_requests = self.get_queryset().select_for_update().in_bulk(ids)
+        member_user_ids = set(
+            StudyGroupMember.objects.filter(
+                studygroup_id=studygroup.pk,
+                user_id__in={r.user_id for r in studygroup_requests.values()},
+            ).values_list("user_id", flat=True)
+        )
+        remaining = studygroup.member_limit - studygroup.member_count
+
+        results = []
+        processed_requests = []
+        new_members = []
+        for pk in dict.fromkeys(ids):
+            studygroup_request = studygroup_requests.get(pk)
+            if studygroup_request is None:
+                result = Result.NOT_FOUND
+            elif studygroup_request.processed:
+                result = Result.ALREADY_PROCESSED
+            elif action == StudyGroupMemberRequestBulkSerializer.REJECT:
+                result = Result.REJECTED
+            elif studygroup_request.user_id in member_user_ids:
+                result = Result.ALREADY_MEMBER
+            elif remaining <= 0:
+                result = Result.FULL
+            else:
+                result = Result.APPROVED
+                studygroup_request.is_approved = True
+                remaining -= 1
+                member_user_ids.add(studygroup_request.user_id)
+                new_members.append(
+                    StudyGroupMember(
+                        user_id=studygroup_request.user_id,
+                        studygroup_id=studygroup.pk,
+                        is_leader=False,
+                    )
+                )
+            if result in (Result.APPROVED, Result.REJECTED):
+                studygroup_request.processed = True
+                processed_requests.append(studygroup_request)
+            results.append({"id": pk, "result": result})
+
+        if not processed_requests:
+            return results
+        StudyGroupMemberRequest.objects.bulk_update(
+            processed_requests, ["processed", "is_approved"]
+        )
+        if new_members:
+            StudyGroupMember.objects.bulk_create(new_members)
+        sync_membership(
+            studygroup.pk,
+            {r.user_id for r in processed_requests},
+            member_delta=len(new_members),
+            members_changed=bool(new_members),
+            studygroup_uuid=studygroup.uuid,
+        )
+        return results
+
+
 @extend_schema(tags=["스터디그룹 멤버 관리 API"])
 class StudyGroupMemberListAPI(generics.ListAPIView):
     permission_classes = (IsStudygroupMember,)  # 스터디그룹 멤버 조회는 스터디그룹의 가입된 멤버만 조회 가능합니다.
@@ -135,10 +279,9 @@ class StudyGroupMemberListAPI(generics.ListAPIView):
         """
         QueryString 으로 전달받은 uuid 에 해당하는 스터디그룹의 멤버 목록을 조회합니다.
         """
-        assert self.kwargs.get("studygroup_uuid") is not None
         return StudyGroupMember.objects.filter(
-            studygroup__uuid=self.kwargs["studygroup_uuid"]
-        )
+            studygroup_id=get_studygroup_context(self.request, self).studygroup_id
+        ).select_related("user")
 
     @extend_schema(summary="특정 스터디그룹의 멤버 목록을 조회합니다.")
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
@@ -151,9 +294,8 @@ class StudyGroupMemberDetailAPI(generics.DestroyAPIView):
     permission_classes = (IsStudygroupLeader,)
 
     def get_queryset(self) -> QuerySet[StudyGroupMember]:
-        assert self.kwargs.get("studygroup_uuid") is not None
         return StudyGroupMember.objects.filter(
-            studygroup__uuid=self.kwargs["studygroup_uuid"]
+            studygroup_id=get_studygroup_context(self.request, self).studygroup_id
         )
 
     @extend_schema(summary="스터디그룹의 멤버를 탈퇴시킵니다.")
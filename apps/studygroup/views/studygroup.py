@@ -1,10 +1,14 @@
+import hashlib
 from typing import Any, Sequence
 
+from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.db.models import QuerySet
+from django.utils.datetime_safe import date
+from django.utils.http import parse_etags, quote_etag
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_spectacular.utils import extend_schema
-from rest_framework import viewsets
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import status, viewsets
 from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import AllowAny, BasePermission, IsAuthenticated
 from rest_framework.request import Request
@@ -12,6 +16,9 @@ from rest_framework.response import Response
 from rest_framework.serializers import BaseSerializer
 
 from apps.accounts.models import User
+from apps.core.exceptions import PreconditionFailed
+from apps.studygroup.caches import get_studygroup_version, studygroup_list_cache
+from apps.studygroup.context import get_studygroup_context
 from apps.studygroup.filters import StudyGroupListFilter, StudyGroupOrderingFilter
 from apps.studygroup.models import StudyGroup, StudyGroupMember
 from apps.studygroup.pagination import StudyGroupPagination
@@ -63,9 +70,31 @@ class StudyGroupAPISet(viewsets.ModelViewSet):
     def get_queryset(self) -> QuerySet[StudyGroup]:
         queryset = StudyGroup.objects.all()
         if self.action in ["list"]:
-            return queryset.defer("content")
+            return queryset.for_list().defer("content")
         return queryset
 
+    @staticmethod
+    def _is_list_cacheable(request: Request) -> bool:
+        """
+        seed 나 커서 없이 랜덤 정렬을 요청하면 매번 다른 순서로 보여야 하므로 캐시하지 않습니다.
+        """
+        params = request.query_params
+        return not (
+            "random" in params.get(StudyGroupOrderingFilter.ordering_param, "")
+            and StudyGroupPagination.seed_query_param not in params
+            and StudyGroupPagination.cursor_query_param not in params
+        )
+
+    def get_object(self) -> StudyGroup:
+        """
+        수정, 삭제는 권한 확인 시 조회한 스터디그룹을 그대로 사용합니다.
+        """
+        if self.action in ["update", "partial_update", "destroy"]:
+            studygroup = get_studygroup_context(self.request, self).studygroup
+            self.check_object_permissions(self.request, studygroup)
+            return studygroup
+        return super().get_object()
+
     def get_serializer_class(self) -> type[BaseSerializer[StudyGroup]]:
         return self.serializer_classes.get(self.action, self.serializer_class)
 
@@ -90,6 +119,7 @@ class StudyGroupAPISet(viewsets.ModelViewSet):
         formdata 의 head_image 가 빈 값이면, 이미지를 삭제하고 빈 값으로 저장합니다.
         """
         assert serializer.instance is not None
+        self._check_if_match(serializer.instance)
         if self.request.data.get("head_image") == "":
             serializer.instance.head_image.delete()
             serializer.instance.head_image = None
@@ -97,19 +127,120 @@ class StudyGroupAPISet(viewsets.ModelViewSet):
 
     @extend_schema(summary="스터디그룹 홍보글 목록을 조회합니다.")
     def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        return super().list(request, *args, **kwargs)
+        """
+        로그인하지 않은 사용자의 목록 조회 응답은 studygroup_list_cache 에 캐시합니다.
+        캐시 적중 여부는 X-Cache 헤더(HIT, MISS)로 확인할 수 있습니다.
+        """
+        if request.user.is_authenticated or not self._is_list_cacheable(request):
+            return super().list(request, *args, **kwargs)
+        build = super().list
+        key = studygroup_list_cache.make_key(
+            request.build_absolute_uri("/"), request.query_params
+        )
+        data, hit = studygroup_list_cache.get_or_build(
+            key, lambda: build(request, *args, **kwargs).data
+        )
+        return Response(data, headers={"X-Cache": "HIT" if hit else "MISS"})
 
     @extend_schema(summary="새로운 스터디그룹을 개설합니다.")
     def create(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         return super().create(request, *args, **kwargs)
 
-    @extend_schema(summary="특정 스터디그룹 상세 정보를 조회합니다.")
+    def get_etag(self, queryset: QuerySet[StudyGroup] | None = None) -> str | None:
+        """
+        스터디그룹 상세 정보의 ETag 를 계산합니다. 스터디그룹이 없으면 None 을 반환합니다.
+        수정 시각, 인원 수, 스터디그룹 버전(리더와 리더의 프로필, 태그, 카테고리), 오늘 날짜(until_deadline)
+        중 하나라도 바뀌면 달라집니다.
+        """
+        if queryset is None:
+            queryset = StudyGroup.objects.all()
+        try:
+            row = (
+                queryset.filter(uuid=self.kwargs[self.lookup_url_kwarg])
+                .values_list("pk", "updated_at", "member_count")
+                .first()
+            )
+        except (TypeError, ValueError, ValidationError):
+            return None
+        if row is None:
+            return None
+        pk, updated_at, member_count = row
+        validator = ":".join(
+            map(
+                str,
+                [
+                    pk,
+                    updated_at.isoformat(),
+                    member_count,
+                    get_studygroup_version(pk),
+                    date.today(),
+                ],
+            )
+        )
+        return quote_etag(hashlib.md5(validator.encode()).hexdigest())
+
+    def _check_if_match(self, studygroup: StudyGroup) -> None:
+        """
+        If-Match 헤더가 있으면, 스터디그룹 row 를 잠근 뒤 현재 ETag 와 비교합니다.
+        다른 스터디그룹장이 먼저 수정했다면 덮어쓰지 않고 412 에러를 반환합니다.
+        """
+        if_match = self.request.headers.get("If-Match")
+        if if_match is None:
+            return
+        etags = parse_etags(if_match)
+        if "*" in etags:
+            return
+        etag = self.get_etag(StudyGroup.objects.select_for_update())
+        if etag not in etags:
+            raise PreconditionFailed
+
+    @extend_schema(
+        summary="특정 스터디그룹 상세 정보를 조회합니다.",
+        parameters=[
+            OpenApiParameter(
+                name="If-None-Match",
+                description="이전에 받은 ETag 값입니다. 변경되지 않았다면 304 를 반환합니다.",
+                required=False,
+                type=str,
+                location=OpenApiParameter.HEADER,
+            )
+        ],
+    )
     def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        return super().retrieve(request, *args, **kwargs)
+        """
+        If-None-Match 헤더가 현재 ETag 와 같으면, serializer 를 거치지 않고 304 를 반환합니다.
+        """
+        etag = self.get_etag()
+        if etag is not None and etag in parse_etags(
+            request.headers.get("If-None-Match", "")
+        ):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        response = super().retrieve(request, *args, **kwargs)
+        if etag is not None:
+            response["ETag"] = etag
+        return response
 
-    @extend_schema(summary="스터디그룹 정보를 수정합니다.")
+    @extend_schema(
+        summary="스터디그룹 정보를 수정합니다.",
+        parameters=[
+            OpenApiParameter(
+                name="If-Match",
+                description="조회 시 받은 ETag 값입니다. 그 사이에 변경되었다면 412 를 반환합니다.",
+                required=False,
+                type=str,
+                location=OpenApiParameter.HEADER,
+            )
+        ],
+    )
     def update(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        return super().update(request, *args, **kwargs)
+        """
+        If-Match 헤더로 조회 시점의 ETag 를 전달하면, 그 사이에 변경된 스터디그룹은 수정하지 않습니다.
+        """
+        response = super().update(request, *args, **kwargs)
+        etag = self.get_etag()
+        if etag is not None:
+            response["ETag"] = etag
+        return response
 
     @extend_schema(summary="스터디그룹 정보를 일부 수정합니다.", deprecated=True)
     def partial_update(self, request: Request, *args: Any, **kwargs: Any) -> Response:
@@ -7,6 +7,7 @@ from rest_framework.permissions import AllowAny
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from apps.studygroup.caches import tag_pool
 from apps.studygroup.models import Tag
 from apps.studygroup.serializers import TagReadSerializer
 
@@ -33,21 +34,20 @@ from apps.studygroup.serializers import TagReadSerializer
 class TagRandomListAPI(ListAPIView):
     """
     querystring에 전달된 숫자만큼의 랜덤 태그를 반환합니다.
+    스터디그룹에서 사용 중인 태그들 중, 많이 사용된 태그일수록 높은 확률로 선택됩니다.
+    태그 목록은 메모리에 캐시된 tag_pool 에서 뽑으므로, 대부분의 요청은 DB 를 조회하지 않습니다.
     """
 
-    queryset = Tag.objects.filter(studygroups__isnull=False)
+    queryset = Tag.objects.none()
     serializer_class = TagReadSerializer
     permission_classes = (AllowAny,)
 
-    def get_queryset(self):
-        random_count = int(self.request.query_params.get("random_count", 3))
-        return self.queryset.order_by("?")[:random_count]
-
     def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        self._validate_random_count(
+        random_count = self._validate_random_count(
             random_count=request.query_params.get("random_count", 3)
         )
-        return super().list(request, *args, **kwargs)
+        serializer = self.get_serializer(tag_pool.sample(random_count), many=True)
+        return Response(serializer.data)
 
     @staticmethod
     def _validate_random_count(random_count: int) -> int:
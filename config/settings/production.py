@@ -9,6 +9,16 @@ DATABASES = {
     }
 }
 
+# 스터디그룹 목록 버전, 멤버 정보, 인증 유저 등을 모든 gunicorn 워커가 함께 보도록 Redis 를 사용합니다.
+# 캐시 조회가 많은 요청 경로에 있으므로, DB 캐시(DatabaseCache)는 사용하지 않습니다.
+# (조회마다 DB 쿼리가 생기고, 저장마다 COUNT(*) 와 cull 이 실행됩니다.)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ["REDIS_URL"],
+    }
+}
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,